@@ -0,0 +1,66 @@
+"""add column 'mcp_tool_name' to flow
+
+Revision ID: 6802bb7e7f17
+Revises: 8fbc7412303f
+Create Date: 2026-10-17 10:12:41.205377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from langflow.utils import migration
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6802bb7e7f17'
+down_revision: Union[str, None] = '8fbc7412303f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    with op.batch_alter_table('flow', schema=None) as batch_op:
+        if not migration.column_exists(table_name='flow', column_name='mcp_tool_name', conn=conn):
+            batch_op.add_column(sa.Column('mcp_tool_name', sa.String(), nullable=True))
+
+    # Fill in the tool names of the existing flows. When two flows of a user share a tool name, the first one gets
+    # it and the others get a numeric suffix, so every flow stays reachable as a tool.
+    flow = sa.table('flow', sa.column('id'), sa.column('user_id'), sa.column('name'), sa.column('mcp_tool_name'))
+    flows = conn.execute(sa.select(flow.c.id, flow.c.user_id, flow.c.name).order_by(flow.c.id)).all()
+    tool_names = {(user_id, "_".join(name.lower().split())) for _, user_id, name in flows if user_id is not None}
+    taken = set()
+    for flow_id, user_id, name in flows:
+        mcp_tool_name = "_".join(name.lower().split())
+        if user_id is not None:
+            if (user_id, mcp_tool_name) in taken:
+                suffix = 2
+                while (user_id, f"{mcp_tool_name}_{suffix}") in taken | tool_names:
+                    suffix += 1
+                mcp_tool_name = f"{mcp_tool_name}_{suffix}"
+            taken.add((user_id, mcp_tool_name))
+        conn.execute(sa.update(flow).where(flow.c.id == flow_id).values(mcp_tool_name=mcp_tool_name))
+
+    inspector = sa.inspect(conn)  # type: ignore
+    indexes_names = [index["name"] for index in inspector.get_indexes("flow")]
+    constraints_names = [constraint["name"] for constraint in inspector.get_unique_constraints("flow")]
+    with op.batch_alter_table('flow', schema=None) as batch_op:
+        if "ix_flow_mcp_tool_name" not in indexes_names:
+            batch_op.create_index(batch_op.f("ix_flow_mcp_tool_name"), ["mcp_tool_name"], unique=False)
+        if "unique_flow_mcp_tool_name" not in constraints_names:
+            batch_op.create_unique_constraint("unique_flow_mcp_tool_name", ["user_id", "mcp_tool_name"])
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    indexes_names = [index["name"] for index in inspector.get_indexes("flow")]
+    constraints_names = [constraint["name"] for constraint in inspector.get_unique_constraints("flow")]
+    with op.batch_alter_table('flow', schema=None) as batch_op:
+        if "unique_flow_mcp_tool_name" in constraints_names:
+            batch_op.drop_constraint("unique_flow_mcp_tool_name", type_="unique")
+        if "ix_flow_mcp_tool_name" in indexes_names:
+            batch_op.drop_index(batch_op.f("ix_flow_mcp_tool_name"))
+        if migration.column_exists(table_name='flow', column_name='mcp_tool_name', conn=conn):
+            batch_op.drop_column('mcp_tool_name')
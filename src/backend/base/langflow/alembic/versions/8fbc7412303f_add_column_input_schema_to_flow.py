@@ -0,0 +1,33 @@
+"""add column 'input_schema' to flow
+
+Revision ID: 8fbc7412303f
+Revises: 1b8b740a6fa3
+Create Date: 2026-10-17 09:30:12.482195
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from langflow.utils import migration
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8fbc7412303f'
+down_revision: Union[str, None] = '1b8b740a6fa3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    with op.batch_alter_table('flow', schema=None) as batch_op:
+        if not migration.column_exists(table_name='flow', column_name='input_schema', conn=conn):
+            batch_op.add_column(sa.Column('input_schema', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    with op.batch_alter_table('flow', schema=None) as batch_op:
+        if migration.column_exists(table_name='flow', column_name='input_schema', conn=conn):
+            batch_op.drop_column('input_schema')
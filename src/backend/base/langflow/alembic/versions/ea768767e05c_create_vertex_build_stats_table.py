@@ -0,0 +1,43 @@
+"""create vertex_build_stats table
+
+Revision ID: ea768767e05c
+Revises: 6802bb7e7f17
+Create Date: 2026-10-17 12:04:19.530861
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+from langflow.utils import migration
+
+# revision identifiers, used by Alembic.
+revision: str = "ea768767e05c"
+down_revision: Union[str, None] = "6802bb7e7f17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if not migration.table_exists("vertex_build_stats", conn):
+        op.create_table(
+            "vertex_build_stats",
+            sa.Column("flow_id", sqlmodel.sql.sqltypes.types.Uuid(), nullable=False),
+            sa.Column("vertex_id", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column("build_count", sa.Integer(), nullable=False),
+            sa.Column("ewma", sa.Float(), nullable=False),
+            sa.Column("p95", sa.Float(), nullable=False),
+            sa.Column("recent_build_times", sa.JSON(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("flow_id", "vertex_id"),
+        )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if migration.table_exists("vertex_build_stats", conn):
+        op.drop_table("vertex_build_stats")
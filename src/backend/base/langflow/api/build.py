@@ -207,7 +207,7 @@ async def generate_flow_events(
             components_count = len(graph.vertices)
             vertices_to_run = list(graph.vertices_to_run.union(get_top_level_vertices(graph, graph.vertices_to_run)))
 
-            await chat_service.set_cache(flow_id_str, graph)
+            await chat_service.set_graph(flow_id_str, graph)
             await log_telemetry(start_time, components_count, success=True)
 
         except Exception as exc:
@@ -324,7 +324,7 @@ async def generate_flow_events(
                     artifacts=artifacts,
                 )
             else:
-                await chat_service.set_cache(flow_id_str, graph)
+                await chat_service.set_graph(flow_id_str, graph, vertex_id=vertex_id)
 
             timedelta = time.perf_counter() - start_time
             duration = format_elapsed_time(timedelta)
@@ -408,7 +408,7 @@ async def generate_flow_events(
 
         if vertex_build_response.valid and vertex_build_response.next_vertices_ids:
             tasks = []
-            for next_vertex_id in vertex_build_response.next_vertices_ids:
+            for next_vertex_id in graph.sort_by_build_schedule(vertex_build_response.next_vertices_ids):
                 task = asyncio.create_task(
                     build_vertices(
                         next_vertex_id,
@@ -432,7 +432,7 @@ async def generate_flow_events(
     event_manager.on_vertices_sorted(data={"ids": ids, "to_run": vertices_to_run})
 
     tasks = []
-    for vertex_id in ids:
+    for vertex_id in graph.sort_by_build_schedule(ids):
         task = asyncio.create_task(build_vertices(vertex_id, graph, event_manager))
         tasks.append(task)
     try:
@@ -453,6 +453,7 @@ async def generate_flow_events(
         event_manager.on_error(data=error_message.data)
         raise
 
+    await graph.save_build_times()
     event_manager.on_end(data={})
     await graph.end_all_traces()
     await event_manager.queue.put((None, None, time.time()))
@@ -5,7 +5,8 @@ from datetime import timedelta
 from enum import Enum
 from typing import TYPE_CHECKING, Annotated, Any
 
-from fastapi import Depends, HTTPException, Query
+from fastapi import Depends, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Params
 from loguru import logger
 from sqlalchemy import delete
@@ -17,12 +18,16 @@ from langflow.services.database.models import User
 from langflow.services.database.models.flow import Flow
 from langflow.services.database.models.message import MessageTable
 from langflow.services.database.models.transactions.model import TransactionTable
-from langflow.services.database.models.vertex_builds.model import VertexBuildTable
-from langflow.services.deps import get_session, session_scope
+from langflow.services.database.models.vertex_builds.model import VertexBuildStatsTable, VertexBuildTable
+from langflow.services.deps import get_log_writer_service, get_session, session_scope
+from langflow.services.storage.service import STORAGE_CHUNK_SIZE
 from langflow.services.store.utils import get_lf_version_from_pypi
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from langflow.services.chat.service import ChatService
+    from langflow.services.storage.service import StorageService
     from langflow.services.store.schema import StoreComponentCreate
 
 
@@ -193,7 +198,7 @@ async def build_graph_from_db_no_cache(flow_id: uuid.UUID, session: AsyncSession
 
 async def build_graph_from_db(flow_id: uuid.UUID, session: AsyncSession, chat_service: ChatService, **kwargs):
     graph = await build_graph_from_db_no_cache(flow_id=flow_id, session=session, **kwargs)
-    await chat_service.set_cache(str(flow_id), graph)
+    await chat_service.set_graph(str(flow_id), graph)
     return graph
 
 
@@ -206,7 +211,7 @@ async def build_and_cache_graph_from_data(
     # Convert flow_id to str if it's UUID
     str_flow_id = str(flow_id) if isinstance(flow_id, uuid.UUID) else flow_id
     graph = Graph.from_payload(graph_data, str_flow_id)
-    await chat_service.set_cache(str_flow_id, graph)
+    await chat_service.set_graph(str_flow_id, graph)
     return graph
 
 
@@ -290,6 +295,8 @@ def parse_value(value: Any, input_type: str) -> Any:
 
 
 async def cascade_delete_flow(session: AsyncSession, flow_id: uuid.UUID) -> None:
+    # Write buffered logs first so they are deleted with the flow instead of being inserted afterwards.
+    await get_log_writer_service().flush()
     try:
         # TODO: Verify if deleting messages is safe in terms of session id relevance
         # If we delete messages directly, rather than setting flow_id to null,
@@ -298,6 +305,7 @@ async def cascade_delete_flow(session: AsyncSession, flow_id: uuid.UUID) -> None
         await session.exec(delete(MessageTable).where(MessageTable.flow_id == flow_id))
         await session.exec(delete(TransactionTable).where(TransactionTable.flow_id == flow_id))
         await session.exec(delete(VertexBuildTable).where(VertexBuildTable.flow_id == flow_id))
+        await session.exec(delete(VertexBuildStatsTable).where(VertexBuildStatsTable.flow_id == flow_id))
         await session.exec(delete(Flow).where(Flow.id == flow_id))
     except Exception as e:
         msg = f"Unable to cascade delete flow: {flow_id}"
@@ -371,3 +379,78 @@ async def verify_public_flow_and_get_user(flow_id: uuid.UUID, client_id: str | N
         raise HTTPException(status_code=403, detail=msg)
 
     return user, new_flow_id
+
+
+async def iter_upload_file(file: UploadFile, chunk_size: int = STORAGE_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Yield the content of an uploaded file in chunks, so that it is never read into memory at once."""
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
+
+def parse_range_header(range_header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse a `Range` header for a file of the given size.
+
+    Only single byte ranges are supported. Headers that are missing, malformed or ask for several ranges are
+    ignored, which means the whole file is sent.
+
+    Returns:
+        The first and last byte of the range, inclusive, or None to send the whole file.
+
+    Raises:
+        HTTPException: 416 if the range starts past the end of the file.
+    """
+    if not range_header:
+        return None
+    unit, _, byte_range = range_header.partition("=")
+    first, separator, last = byte_range.strip().partition("-")
+    if unit.strip().lower() != "bytes" or not separator or "," in byte_range:
+        return None
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        else:
+            # A suffix range, such as "bytes=-500" for the last 500 bytes.
+            start = max(size - int(last), 0)
+            end = size - 1
+    except ValueError:
+        return None
+    if first and last and end < start:
+        return None
+    if start >= size:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, min(end, size - 1)
+
+
+async def stream_storage_file(
+    storage_service: StorageService,
+    flow_id: str,
+    file_name: str,
+    *,
+    media_type: str,
+    range_header: str | None = None,
+    headers: dict[str, str] | None = None,
+) -> StreamingResponse:
+    """Stream a file from the storage service, honoring a single byte `Range` request."""
+    size = await storage_service.get_file_size(flow_id=flow_id, file_name=file_name)
+    byte_range = parse_range_header(range_header, size)
+    headers = {**(headers or {}), "Accept-Ranges": "bytes"}
+    if byte_range is None:
+        start, end = 0, None
+        status_code = status.HTTP_200_OK
+        headers["Content-Length"] = str(size)
+    else:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Length"] = str(end - start + 1)
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return StreamingResponse(
+        storage_service.open_read(flow_id, file_name, start=start, end=end),
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers,
+    )
@@ -36,6 +36,7 @@ from langflow.graph.schema import RunOutputs
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.interface.initialize.loading import update_params_with_load_from_db_fields
+from langflow.processing.graph_cache import get_graph_for_run
 from langflow.processing.process import process_tweaks, run_graph_internal
 from langflow.schema.graph import Tweaks
 from langflow.services.auth.utils import api_key_security, get_current_active_user
@@ -47,7 +48,7 @@ from langflow.services.database.models.user.model import User, UserRead
 from langflow.services.deps import get_session_service, get_settings_service, get_telemetry_service
 from langflow.services.settings.feature_flags import FEATURE_FLAGS
 from langflow.services.telemetry.schema import RunPayload
-from langflow.utils.compression import compress_response
+from langflow.utils.compression import encoded_payload_response
 from langflow.utils.version import get_version_info
 
 if TYPE_CHECKING:
@@ -58,17 +59,18 @@ router = APIRouter(tags=["Base"])
 
 
 @router.get("/all", dependencies=[Depends(get_current_active_user)])
-async def get_all():
+async def get_all(request: Request):
     """Retrieve all component types with compression for better performance.
 
-    Returns a compressed response containing all available component types.
+    Returns a compressed response containing all available component types. The response is encoded once
+    and carries an ETag, so clients sending a matching If-None-Match get a 304 without a body.
     """
-    from langflow.interface.components import get_and_cache_all_types_dict
+    from langflow.interface.components import component_cache, get_and_cache_all_types_dict
 
     try:
-        all_types = await get_and_cache_all_types_dict(settings_service=get_settings_service())
-        # Return compressed response using our utility function
-        return compress_response(all_types)
+        await get_and_cache_all_types_dict(settings_service=get_settings_service())
+        payload = await component_cache.aget_encoded_all_types()
+        return encoded_payload_response(payload, request)
 
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -122,17 +124,32 @@ async def simple_run_flow(
         if flow.data is None:
             msg = f"Flow {flow_id_str} has no data"
             raise ValueError(msg)
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
-        graph = Graph.from_payload(graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name)
+        graph = get_graph_for_run(
+            flow.data,
+            flow_id=flow_id_str,
+            flow_name=flow.name,
+            updated_at=flow.updated_at,
+            tweaks=input_request.tweaks,
+            user_id=str(user_id),
+            stream=stream,
+        )
         inputs = None
+        max_concurrency = None
+        if isinstance(input_request.input_value, list):
+            max_concurrency = get_settings_service().settings.batch_run_concurrency
         if input_request.input_value is not None:
+            input_values = (
+                input_request.input_value
+                if isinstance(input_request.input_value, list)
+                else [input_request.input_value]
+            )
             inputs = [
                 InputValueRequest(
                     components=[],
-                    input_value=input_request.input_value,
+                    input_value=input_value,
                     type=input_request.input_type,
                 )
+                for input_value in input_values
             ]
         if input_request.output_component:
             outputs = [input_request.output_component]
@@ -154,6 +171,7 @@ async def simple_run_flow(
             outputs=outputs,
             stream=stream,
             event_manager=event_manager,
+            max_concurrency=max_concurrency,
         )
 
         return RunResponse(outputs=task_result, session_id=session_id)
@@ -545,7 +563,7 @@ async def experimental_run_flow(
         try:
             # Get the flow that matches the flow_id and belongs to the user
             # flow = session.query(Flow).filter(Flow.id == flow_id).filter(Flow.user_id == api_key_user.id).first()
-            stmt = select(Flow).where(Flow.id == flow_id_str).where(Flow.user_id == api_key_user.id)
+            stmt = select(Flow).where(Flow.id == flow_id).where(Flow.user_id == api_key_user.id)
             flow = (await session.exec(stmt)).first()
         except sa.exc.StatementError as exc:
             # StatementError('(builtins.ValueError) badly formed hexadecimal UUID string')
@@ -19,7 +19,14 @@ from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlmodel import and_, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from langflow.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow, remove_api_keys, validate_is_component
+from langflow.api.utils import (
+    CurrentActiveUser,
+    DbSession,
+    cascade_delete_flow,
+    get_is_component_from_data,
+    remove_api_keys,
+    validate_is_component,
+)
 from langflow.api.v1.schemas import FlowListCreate
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
@@ -168,6 +175,32 @@ async def create_flow(
     return db_flow
 
 
+async def _read_flow_headers(session: AsyncSession, stmt) -> list[FlowHeader]:
+    """Read the headers of the flows selected by `stmt` without loading the data of flows that are not components."""
+    header_columns = [getattr(Flow, field_name) for field_name in FlowHeader.model_fields if field_name != "data"]
+    header_stmt = select(*header_columns)
+    if stmt.whereclause is not None:
+        header_stmt = header_stmt.where(stmt.whereclause)
+    rows = (await session.exec(header_stmt)).all()
+    headers = [dict(row._mapping) for row in rows]
+
+    # Components are returned with their data, and flows without `is_component` need it to tell whether they are one.
+    ids_with_data = [header["id"] for header in headers if header["is_component"] is not False]
+    data_by_id: dict[UUID, dict | None] = {}
+    if ids_with_data:
+        data_stmt = select(Flow.id, Flow.data).where(col(Flow.id).in_(ids_with_data))
+        data_by_id = dict((await session.exec(data_stmt)).all())
+
+    flow_headers = []
+    for header in headers:
+        data = data_by_id.get(header["id"])
+        if data and header["is_component"] is None:
+            is_component = get_is_component_from_data(data)
+            header["is_component"] = is_component if is_component is not None else len(data.get("nodes", [])) == 1
+        flow_headers.append(FlowHeader.model_validate({**header, "data": data}))
+    return flow_headers
+
+
 @router.get("/", response_model=list[FlowRead] | Page[FlowRead] | list[FlowHeader], status_code=200)
 async def read_flows(
     *,
@@ -231,6 +264,12 @@ async def read_flows(
         if components_only:
             stmt = stmt.where(Flow.is_component == True)  # noqa: E712
 
+        if get_all and header_flows:
+            flow_headers = await _read_flow_headers(session, stmt)
+            if components_only:
+                flow_headers = [flow for flow in flow_headers if flow.is_component]
+            return await compress_response(flow_headers)
+
         if get_all:
             flows = (await session.exec(stmt)).all()
             flows = validate_is_component(flows)
@@ -238,13 +277,8 @@ async def read_flows(
                 flows = [flow for flow in flows if flow.is_component]
             if remove_example_flows and starter_folder_id:
                 flows = [flow for flow in flows if flow.folder_id != starter_folder_id]
-            if header_flows:
-                # Convert to FlowHeader objects and compress the response
-                flow_headers = [FlowHeader.model_validate(flow, from_attributes=True) for flow in flows]
-                return compress_response(flow_headers)
-
             # Compress the full flows response
-            return compress_response(flows)
+            return await compress_response(flows)
 
         stmt = stmt.where(Flow.folder_id == folder_id)
         return await paginate(session, stmt, params=params)
@@ -546,7 +580,7 @@ async def read_basic_examples(
         flows = (await session.exec(select(Flow).where(Flow.folder_id == starter_folder.id))).all()
 
         # Return compressed response using our utility function
-        return compress_response(flows)
+        return await compress_response(flows)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -174,27 +174,43 @@ async def handle_read_resource(uri: str) -> bytes:
         raise
 
 
+async def _store_flow_input_schema(session, flow_id) -> dict:
+    flow = await session.get(Flow, flow_id)
+    input_schema = json_schema_from_flow(flow)
+    flow.input_schema = input_schema
+    session.add(flow)
+    return input_schema
+
+
 @server.list_tools()
 async def handle_list_tools():
     tools = []
     try:
         db_service = get_db_service()
         async with db_service.with_session() as session:
-            flows = (await session.exec(select(Flow))).all()
+            # Flows without a tool name cannot be called, because tool calls look flows up by it.
+            stmt = select(Flow.id, Flow.mcp_tool_name, Flow.description, Flow.input_schema).where(
+                Flow.user_id != None,  # noqa: E711
+                Flow.mcp_tool_name != None,  # noqa: E711
+            )
+            flows = (await session.exec(stmt)).all()
 
-            for flow in flows:
-                if flow.user_id is None:
-                    continue
+            for flow_id, mcp_tool_name, description, stored_input_schema in flows:
+                input_schema = stored_input_schema
+                if input_schema is None:
+                    # Flows saved before the input schema was stored get it computed and stored once.
+                    input_schema = await _store_flow_input_schema(session, flow_id)
 
-                flow_name = "_".join(flow.name.lower().split())
                 tool = types.Tool(
-                    name=flow_name,
-                    description=f"{flow.id}: {flow.description}"
-                    if flow.description
-                    else f"Tool generated from flow: {flow_name}",
-                    inputSchema=json_schema_from_flow(flow),
+                    name=mcp_tool_name,
+                    description=f"{flow_id}: {description}"
+                    if description
+                    else f"Tool generated from flow: {mcp_tool_name}",
+                    inputSchema=input_schema,
                 )
                 tools.append(tool)
+            if session.dirty:
+                await session.commit()
     except Exception as e:
         msg = f"Error in listing tools: {e!s}"
         logger.exception(msg)
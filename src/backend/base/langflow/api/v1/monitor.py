@@ -18,13 +18,20 @@ from langflow.services.database.models.vertex_builds.crud import (
     get_vertex_builds_by_flow_id,
 )
 from langflow.services.database.models.vertex_builds.model import VertexBuildMapModel
+from langflow.services.deps import get_log_writer_service
+from langflow.services.log_writer.service import LogWriterService
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
 
 @router.get("/builds")
-async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> VertexBuildMapModel:
+async def get_vertex_builds(
+    flow_id: Annotated[UUID, Query()],
+    session: DbSession,
+    log_writer: Annotated[LogWriterService, Depends(get_log_writer_service)],
+) -> VertexBuildMapModel:
     try:
+        await log_writer.flush()
         vertex_builds = await get_vertex_builds_by_flow_id(session, flow_id)
         return VertexBuildMapModel.from_list_of_dicts(vertex_builds)
     except Exception as e:
@@ -32,8 +39,13 @@ async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSessio
 
 
 @router.delete("/builds", status_code=204)
-async def delete_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> None:
+async def delete_vertex_builds(
+    flow_id: Annotated[UUID, Query()],
+    session: DbSession,
+    log_writer: Annotated[LogWriterService, Depends(get_log_writer_service)],
+) -> None:
     try:
+        await log_writer.flush()
         await delete_vertex_builds_by_flow_id(session, flow_id)
         await session.commit()
     except Exception as e:
@@ -164,8 +176,10 @@ async def get_transactions(
     flow_id: Annotated[UUID, Query()],
     session: DbSession,
     params: Annotated[Params | None, Depends(custom_params)],
+    log_writer: Annotated[LogWriterService, Depends(get_log_writer_service)],
 ) -> Page[TransactionTable]:
     try:
+        await log_writer.flush()
         stmt = (
             select(TransactionTable)
             .where(TransactionTable.flow_id == flow_id)
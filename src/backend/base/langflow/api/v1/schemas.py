@@ -354,7 +354,11 @@ class InputValueRequest(BaseModel):
 
 
 class SimplifiedAPIRequest(BaseModel):
-    input_value: str | None = Field(default=None, description="The input value")
+    input_value: str | list[str] | None = Field(
+        default=None,
+        description="The input value. A list of values runs the flow once for each value and returns the outputs "
+        "in the same order.",
+    )
     input_type: InputType | None = Field(default="chat", description="The input type")
     output_type: OutputType | None = Field(default="chat", description="The output type")
     output_component: str | None = Field(
@@ -15,6 +15,7 @@ from langflow.services.auth.utils import (
     get_password_hash,
     verify_password,
 )
+from langflow.services.database.models.api_key.crud import invalidate_api_key_cache
 from langflow.services.database.models.user import User, UserCreate, UserRead, UserUpdate
 from langflow.services.database.models.user.crud import get_user_by_id, update_user
 from langflow.services.deps import get_settings_service
@@ -101,7 +102,9 @@ async def patch_user(
     if user_db := await get_user_by_id(session, user_id):
         if not update_password:
             user_update.password = user_db.password
-        return await update_user(user_db, user_update, session)
+        updated_user = await update_user(user_db, user_update, session)
+        invalidate_api_key_cache(user_id=user_id)
+        return updated_user
     raise HTTPException(status_code=404, detail="User not found")
 
 
@@ -147,5 +150,6 @@ async def delete_user(
 
     await session.delete(user_db)
     await session.commit()
+    invalidate_api_key_cache(user_id=user_id)
 
     return {"detail": "User deleted"}
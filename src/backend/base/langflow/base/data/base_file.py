@@ -3,6 +3,7 @@ import tarfile
 from abc import ABC, abstractmethod
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import Any
 from zipfile import ZipFile, is_zipfile
 
 import pandas as pd
@@ -190,6 +191,30 @@ class BaseFileComponent(Component, ABC):
             list[BaseFile]: A list of BaseFile objects with updated `data`.
         """
 
+    def get_result_cache_dependencies(self, params: dict[str, Any]) -> list[tuple[str, int | None, int | None]]:
+        """Returns the size and modification time of each input file, so a file changed on disk is read again."""
+        paths = params.get("path") or []
+        paths = list(paths) if isinstance(paths, list) else [paths]
+        file_path = params.get("file_path") or []
+        for obj in file_path if isinstance(file_path, list) else [file_path]:
+            if isinstance(obj, Message):
+                paths.append(obj.text)
+            elif isinstance(obj, Data):
+                paths.append(obj.data.get(self.SERVER_FILE_PATH_FIELDNAME))
+
+        dependencies: list[tuple[str, int | None, int | None]] = []
+        for path in paths:
+            if not path:
+                continue
+            resolved_path = self.resolve_path(str(path))
+            try:
+                stat = Path(resolved_path).stat()
+            except OSError:
+                dependencies.append((resolved_path, None, None))
+            else:
+                dependencies.append((resolved_path, stat.st_size, stat.st_mtime_ns))
+        return dependencies
+
     def load_files_base(self) -> list[Data]:
         """Loads and parses file(s), including unpacked file bundles.
 
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import TYPE_CHECKING, NamedTuple
+from urllib.parse import urldefrag, urlparse
+
+from bs4 import BeautifulSoup
+from langchain_core.utils.html import extract_sub_links
+from loguru import logger
+
+from langflow.schema import Data
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from langflow.services.http_client.service import HTTPClientService
+
+# The same timeout as RecursiveUrlLoader, in seconds.
+DEFAULT_TIMEOUT = 10
+PARSE_WORKERS = min(4, os.cpu_count() or 1)
+
+_parse_executor: ProcessPoolExecutor | None = None
+_parse_executor_lock = threading.Lock()
+
+
+class ParsedPage(NamedTuple):
+    content: str
+    metadata: dict
+    links: list[str]
+
+
+class _CrawlTask(NamedTuple):
+    url: str
+    base_url: str
+    depth: int
+
+
+def parse_page(
+    raw_html: str,
+    url: str,
+    *,
+    base_url: str,
+    content_type: str,
+    output_format: str,
+    find_links: bool,
+    prevent_outside: bool,
+) -> ParsedPage:
+    """Extracts the content, the metadata and the links of a page.
+
+    It runs in a worker process, so it must stay a module-level function that only takes and returns picklable values.
+    The metadata matches the metadata RecursiveUrlLoader extracts.
+    """
+    soup = BeautifulSoup(raw_html, "lxml")
+    metadata = {"source": url, "content_type": content_type}
+    if title := soup.find("title"):
+        metadata["title"] = title.get_text()
+    if description := soup.find("meta", attrs={"name": "description"}):
+        metadata["description"] = description.get("content", None)
+    if html := soup.find("html"):
+        metadata["language"] = html.get("lang", None)
+
+    content = raw_html if output_format == "HTML" else soup.get_text()
+    links = []
+    if find_links:
+        links = extract_sub_links(
+            raw_html, url, base_url=base_url, prevent_outside=prevent_outside, continue_on_failure=True
+        )
+    return ParsedPage(content, metadata, links)
+
+
+def get_parse_executor() -> ProcessPoolExecutor:
+    """Returns the process pool pages are parsed in, starting it on first use.
+
+    The pool is shared by every crawl and lives until `shutdown_parse_executor` is called when the services are
+    torn down, so its workers start once. They are spawned rather than forked, because forking a process that
+    runs an event loop and other threads can copy locks in a held state.
+    """
+    global _parse_executor  # noqa: PLW0603
+    with _parse_executor_lock:
+        if _parse_executor is None:
+            _parse_executor = ProcessPoolExecutor(
+                max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _parse_executor
+
+
+def shutdown_parse_executor() -> None:
+    """Stops the parse pool, cancelling the pages still waiting to be parsed."""
+    global _parse_executor
+    with _parse_executor_lock:
+        executor, _parse_executor = _parse_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _submit_parse(parse: partial[ParsedPage]) -> Future[ParsedPage]:
+    return get_parse_executor().submit(parse)
+
+
+class _DomainLimiter:
+    """Limits the number of concurrent requests to a domain and spaces out the start of each request."""
+
+    def __init__(self, max_concurrency: int, delay: float):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._delay = delay
+        self._lock = asyncio.Lock()
+        self._next_request_at = 0.0
+
+    @asynccontextmanager
+    async def slot(self):
+        async with self._semaphore:
+            if self._delay > 0:
+                async with self._lock:
+                    loop = asyncio.get_running_loop()
+                    if (wait := self._next_request_at - loop.time()) > 0:
+                        await asyncio.sleep(wait)
+                    self._next_request_at = loop.time() + self._delay
+            yield
+
+
+class URLCrawler:
+    """Crawls pages breadth-first from a set of root URLs with a bounded pool of workers.
+
+    Up to `max_concurrency` pages are fetched at once, with at most `max_concurrency_per_domain` of them on the
+    same domain and at least `domain_delay` seconds between the start of two requests to a domain. A page is
+    fetched once even when several roots link to it. Pages are parsed in the shared process pool, or in a thread
+    if `use_process_pool` is False, so that parsing large pages does not block the event loop.
+
+    Like RecursiveUrlLoader, a page `max_depth - 1` links away from its root is the deepest one crawled, links
+    are only followed below the root URL when `prevent_outside` is set, and pages that cannot be fetched are
+    skipped. Unlike it, responses with an error status are skipped as well.
+    """
+
+    def __init__(
+        self,
+        http_client: HTTPClientService,
+        *,
+        max_depth: int = 1,
+        prevent_outside: bool = True,
+        output_format: str = "Text",
+        max_concurrency: int = 10,
+        max_concurrency_per_domain: int = 2,
+        domain_delay: float = 0.0,
+        timeout: float = DEFAULT_TIMEOUT,
+        use_process_pool: bool = True,
+    ):
+        self.http_client = http_client
+        self.max_depth = max_depth
+        self.prevent_outside = prevent_outside
+        self.output_format = output_format
+        self.max_concurrency = max(max_concurrency, 1)
+        self.timeout = timeout
+        self.use_process_pool = use_process_pool
+        self._domains: defaultdict[str, _DomainLimiter] = defaultdict(
+            lambda: _DomainLimiter(max(max_concurrency_per_domain, 1), domain_delay)
+        )
+        self._queue: asyncio.Queue[_CrawlTask] = asyncio.Queue()
+        self._seen: set[str] = set()
+
+    async def crawl(self, urls: list[str]) -> AsyncIterator[Data]:
+        """Yields the pages reachable from the URLs as they are parsed, in no particular order."""
+        for url in urls:
+            self._schedule(url, url, 0)
+        if self._queue.empty():
+            return
+
+        results: asyncio.Queue[Data | None] = asyncio.Queue()
+        workers = [asyncio.create_task(self._work(results)) for _ in range(self.max_concurrency)]
+        finished = asyncio.create_task(self._queue.join())
+        finished.add_done_callback(lambda _: results.put_nowait(None))
+        try:
+            while (data := await results.get()) is not None:
+                yield data
+        finally:
+            for task in [*workers, finished]:
+                task.cancel()
+            await asyncio.gather(*workers, finished, return_exceptions=True)
+
+    def _schedule(self, url: str, base_url: str, depth: int) -> None:
+        url = urldefrag(url).url
+        if url not in self._seen:
+            self._seen.add(url)
+            self._queue.put_nowait(_CrawlTask(url, base_url, depth))
+
+    async def _work(self, results: asyncio.Queue[Data | None]) -> None:
+        while True:
+            task = await self._queue.get()
+            try:
+                page = await self._crawl_page(task)
+                if page is not None:
+                    results.put_nowait(Data(text=page.content, **page.metadata))
+                    for link in page.links:
+                        self._schedule(link, task.base_url, task.depth + 1)
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).warning(f"Unable to load {task.url}")
+            finally:
+                self._queue.task_done()
+
+    async def _crawl_page(self, task: _CrawlTask) -> ParsedPage | None:
+        async with self._domains[urlparse(task.url).netloc].slot():
+            response = await self.http_client.get(task.url, timeout=self.timeout, follow_redirects=True)
+        if response.is_error:
+            logger.warning(f"Skipping {task.url}: the server responded with status {response.status_code}")
+            return None
+
+        final_url = urldefrag(str(response.url)).url
+        if final_url != task.url:
+            # The request was redirected, possibly to a page that is already crawled or about to be.
+            if final_url in self._seen:
+                return None
+            self._seen.add(final_url)
+
+        parse = partial(
+            parse_page,
+            response.text,
+            task.url,
+            base_url=task.base_url,
+            content_type=response.headers.get("Content-Type", ""),
+            output_format=self.output_format,
+            find_links=task.depth + 1 < self.max_depth,
+            prevent_outside=self.prevent_outside,
+        )
+        if not self.use_process_pool:
+            return await asyncio.to_thread(parse)
+        # Submitting can start the pool and its worker processes, which blocks, so it happens in a thread.
+        return await asyncio.wrap_future(await asyncio.to_thread(_submit_parse, parse))
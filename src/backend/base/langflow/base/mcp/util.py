@@ -67,14 +67,13 @@ def create_tool_func(tool_name: str, arg_schema: type[BaseModel], session) -> Ca
 
 async def get_flow_snake_case(flow_name: str, user_id: str, session) -> Flow | None:
     uuid_user_id = UUID(user_id) if isinstance(user_id, str) else user_id
-    stmt = select(Flow).where(Flow.user_id == uuid_user_id).where(Flow.is_component == False)  # noqa: E712
-    flows = (await session.exec(stmt)).all()
-
-    for flow in flows:
-        this_flow_name = "_".join(flow.name.lower().split())
-        if this_flow_name == flow_name:
-            return flow
-    return None
+    stmt = (
+        select(Flow)
+        .where(Flow.user_id == uuid_user_id)
+        .where(Flow.mcp_tool_name == flow_name)
+        .where(Flow.is_component == False)  # noqa: E712
+    )
+    return (await session.exec(stmt)).first()
 
 
 def create_input_schema_from_json_schema(schema: dict[str, Any]) -> type[BaseModel]:
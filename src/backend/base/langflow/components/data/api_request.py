@@ -29,6 +29,7 @@ from langflow.io import (
 from langflow.schema import Data
 from langflow.schema.dataframe import DataFrame
 from langflow.schema.dotdict import dotdict
+from langflow.services.http_client.service import HTTPClientService
 
 
 class APIRequestComponent(Component):
@@ -373,7 +374,7 @@ class APIRequestComponent(Component):
 
     async def make_request(
         self,
-        client: httpx.AsyncClient,
+        client: httpx.AsyncClient | HTTPClientService,
         method: str,
         url: str,
         headers: dict | None = None,
@@ -527,23 +528,23 @@ class APIRequestComponent(Component):
 
         urls = [self.add_query_params(url, query_params) for url in urls]
 
-        async with httpx.AsyncClient() as client:
-            results = await asyncio.gather(
-                *[
-                    self.make_request(
-                        client,
-                        method,
-                        u,
-                        headers,
-                        rec,
-                        timeout,
-                        follow_redirects=follow_redirects,
-                        save_to_file=save_to_file,
-                        include_httpx_metadata=include_httpx_metadata,
-                    )
-                    for u, rec in zip(urls, bodies, strict=False)
-                ]
-            )
+        # The shared client reuses pooled connections and limits the requests sent to each host at once.
+        results = await asyncio.gather(
+            *[
+                self.make_request(
+                    self.http_client,
+                    method,
+                    u,
+                    headers,
+                    rec,
+                    timeout,
+                    follow_redirects=follow_redirects,
+                    save_to_file=save_to_file,
+                    include_httpx_metadata=include_httpx_metadata,
+                )
+                for u, rec in zip(urls, bodies, strict=False)
+            ]
+        )
         self.status = results
         return results
 
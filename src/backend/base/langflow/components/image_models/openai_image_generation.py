@@ -100,10 +100,9 @@ class OpenAIImageGenerationComponent(Component):
 
             # Make the API request
             start_time = time.time()
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(url, json=payload, headers=headers)
-                response.raise_for_status()
-                result = response.json()
+            response = await self.http_client.post(url, json=payload, headers=headers, timeout=120.0)
+            response.raise_for_status()
+            result = response.json()
             end_time = time.time()
             duration = int((end_time - start_time) * 1000)
 
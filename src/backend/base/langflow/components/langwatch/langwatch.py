@@ -274,8 +274,7 @@ class LangWatchComponent(Component):
             for setting_name in self.dynamic_inputs:
                 payload["settings"][setting_name] = getattr(self, setting_name, None)
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, json=payload, headers=headers)
+            response = await self.http_client.post(url, json=payload, headers=headers, timeout=self.timeout)
 
             response.raise_for_status()
             result = response.json()
@@ -86,18 +86,17 @@ class OlivyaComponent(Component):
             logger.info("Sending POST request with payload: %s", payload)
 
             # Send the POST request with a timeout
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://phone.olivya.io/create_zap_call",
-                    headers=headers,
-                    json=payload,
-                    timeout=10.0,
-                )
-                response.raise_for_status()
+            response = await self.http_client.post(
+                "https://phone.olivya.io/create_zap_call",
+                headers=headers,
+                json=payload,
+                timeout=10.0,
+            )
+            response.raise_for_status()
 
-                # Parse and return the successful response
-                response_data = response.json()
-                logger.info("Request successful: %s", response_data)
+            # Parse and return the successful response
+            response_data = response.json()
+            logger.info("Request successful: %s", response_data)
 
         except httpx.HTTPStatusError as http_err:
             logger.exception("HTTP error occurred")
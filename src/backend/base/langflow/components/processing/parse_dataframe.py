@@ -1,4 +1,5 @@
 from langflow.custom import Component
+from langflow.helpers.data import dataframe_to_text
 from langflow.io import DataFrameInput, MultilineInput, Output, StrInput
 from langflow.schema.message import Message
 
@@ -55,14 +56,7 @@ class ParseDataFrameComponent(Component):
         """
         dataframe, template, sep = self._clean_args()
 
-        lines = []
-        # For each row in the DataFrame, build a dict and format
-        for _, row in dataframe.iterrows():
-            row_dict = row.to_dict()
-            text_line = template.format(**row_dict)  # e.g. template="{text}", row_dict={"text": "Hello"}
-            lines.append(text_line)
-
-        # Join all lines with the provided separator
-        result_string = sep.join(lines)
+        # Compile the template once and format the rows from whole columns
+        result_string = dataframe_to_text(template, dataframe, sep)
         self.status = result_string  # store in self.status for UI logs
         return Message(text=result_string)
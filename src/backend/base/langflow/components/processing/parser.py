@@ -2,6 +2,7 @@ import json
 from typing import Any
 
 from langflow.custom import Component
+from langflow.helpers.data import dataframe_to_text_list
 from langflow.io import (
     BoolInput,
     HandleInput,
@@ -127,9 +128,7 @@ class ParserComponent(Component):
 
         lines = []
         if df is not None:
-            for _, row in df.iterrows():
-                formatted_text = self.pattern.format(**row.to_dict())
-                lines.append(formatted_text)
+            lines.extend(dataframe_to_text_list(self.pattern, df))
         elif data is not None:
             formatted_text = self.pattern.format(**data.data)
             lines.append(formatted_text)
@@ -5,6 +5,7 @@ import asyncio
 import inspect
 from collections.abc import AsyncIterator, Iterator
 from copy import deepcopy
+from functools import lru_cache
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, get_type_hints
 from uuid import UUID
@@ -22,7 +23,6 @@ from langflow.base.tools.constants import (
     TOOLS_METADATA_INFO,
     TOOLS_METADATA_INPUT_NAME,
 )
-from langflow.custom.tree_visitor import RequiredInputsVisitor
 from langflow.exceptions.component import StreamingError
 from langflow.field_typing import Tool  # noqa: TC001 Needed by _add_toolkit_output
 from langflow.graph.state.model import create_state_model
@@ -93,6 +93,25 @@ class PlaceholderGraph(NamedTuple):
     flow_name: str | None
 
 
+@lru_cache(maxsize=1024)
+def _get_method_self_attributes(component_class: type, method_name: str, code: str | None) -> frozenset[str]:
+    """Returns the names of the `self` attributes an output method uses.
+
+    Parsing the source is the most expensive part of creating a component, so it is done once per class and method
+    instead of for every instance. Classes built from code have no source file, so their whole code is parsed.
+    """
+    try:
+        source_code = inspect.getsource(getattr(component_class, method_name))
+        ast_tree = ast.parse(dedent(source_code))
+    except Exception:  # noqa: BLE001
+        ast_tree = ast.parse(dedent(code or ""))
+    return frozenset(
+        node.attr
+        for node in ast.walk(ast_tree)
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == "self"
+    )
+
+
 class Component(CustomComponent):
     inputs: list[InputTypes] = []
     outputs: list[Output] = []
@@ -530,15 +549,10 @@ class Component(CustomComponent):
             method = getattr(self, output.method, None)
             if not method or not callable(method):
                 continue
-            try:
-                source_code = inspect.getsource(method)
-                ast_tree = ast.parse(dedent(source_code))
-            except Exception:  # noqa: BLE001
-                ast_tree = ast.parse(dedent(self._code or ""))
-
-            visitor = RequiredInputsVisitor(self._inputs)
-            visitor.visit(ast_tree)
-            output.required_inputs = sorted(visitor.required_inputs)
+            attributes = _get_method_self_attributes(type(self), output.method, self._code)
+            output.required_inputs = sorted(
+                name for name in attributes if name in self._inputs and self._inputs[name].required
+            )
 
     def get_output_by_method(self, method: Callable):
         # method is a callable and output.method is a string
@@ -1323,9 +1337,13 @@ class Component(CustomComponent):
         stored_message = stored_messages[0]
         return await Message.create(**stored_message.model_dump())
 
-    async def _send_message_event(self, message: Message, id_: str | None = None, category: str | None = None) -> None:
+    async def _send_message_event(
+        self, message: Message, id_: str | None = None, category: str | None = None, text: str | None = None
+    ) -> None:
         if hasattr(self, "_event_manager") and self._event_manager:
             data_dict = message.data.copy() if hasattr(message, "data") else message.model_dump()
+            if text is not None:
+                data_dict["text"] = text
             if id_ and not data_dict.get("id"):
                 data_dict["id"] = id_
             category = category or data_dict.get("category", None)
@@ -1372,49 +1390,46 @@ class Component(CustomComponent):
             msg = "The message must be an iterator or an async iterator."
             raise TypeError(msg)
 
-        if isinstance(iterator, AsyncIterator):
-            return await self._handle_async_iterator(iterator, message.id, message)
         try:
-            complete_message = ""
-            first_chunk = True
-            for chunk in iterator:
-                complete_message = await self._process_chunk(
-                    chunk.content, complete_message, message.id, message, first_chunk=first_chunk
-                )
-                first_chunk = False
-        except Exception as e:
-            raise StreamingError(cause=e, source=message.properties.source) from e
-        else:
-            return complete_message
+            if isinstance(iterator, AsyncIterator):
+                return await self._handle_async_iterator(iterator, message.id, message)
+            chunks: list[str] = []
+            try:
+                for chunk in iterator:
+                    await self._process_chunk(chunk.content, chunks, message.id, message, first_chunk=not chunks)
+            except Exception as e:
+                raise StreamingError(cause=e, source=message.properties.source) from e
+            else:
+                return "".join(chunks)
+        finally:
+            if self._event_manager:
+                self._event_manager.flush_tokens()
 
     async def _handle_async_iterator(self, iterator: AsyncIterator, message_id: str, message: Message) -> str:
-        complete_message = ""
-        first_chunk = True
+        chunks: list[str] = []
         async for chunk in iterator:
-            complete_message = await self._process_chunk(
-                chunk.content, complete_message, message_id, message, first_chunk=first_chunk
-            )
-            first_chunk = False
-        return complete_message
+            await self._process_chunk(chunk.content, chunks, message_id, message, first_chunk=not chunks)
+        return "".join(chunks)
 
     async def _process_chunk(
-        self, chunk: str, complete_message: str, message_id: str, message: Message, *, first_chunk: bool = False
-    ) -> str:
-        complete_message += chunk
+        self, chunk: str, chunks: list[str], message_id: str, message: Message, *, first_chunk: bool = False
+    ) -> None:
+        """Append a streamed chunk to `chunks` and send it to the client.
+
+        The chunks are joined once the stream ends, which keeps long generations linear in their length.
+        """
+        chunks.append(chunk)
         if self._event_manager:
             if first_chunk:
                 # Send the initial message only on the first chunk
-                msg_copy = message.model_copy()
-                msg_copy.text = complete_message
-                await self._send_message_event(msg_copy, id_=message_id)
-            await asyncio.to_thread(
-                self._event_manager.on_token,
-                data={
-                    "chunk": chunk,
-                    "id": str(message_id),
-                },
-            )
-        return complete_message
+                await self._send_message_event(message, id_=message_id, text=chunk)
+            await self._event_manager.wait_for_capacity()
+            token_data = {"chunk": chunk, "id": str(message_id)}
+            if self._event_manager.is_native_event("on_token"):
+                # The built-in token handler only buffers the chunk, so the thread hop would cost more than it saves.
+                self._event_manager.on_token(data=token_data)
+            else:
+                await asyncio.to_thread(self._event_manager.on_token, data=token_data)
 
     async def send_error(
         self,
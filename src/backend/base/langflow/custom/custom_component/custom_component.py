@@ -13,7 +13,7 @@ from pydantic import BaseModel
 from langflow.custom.custom_component.base_component import BaseComponent
 from langflow.helpers.flow import list_flows, load_flow, run_flow
 from langflow.schema import Data
-from langflow.services.deps import get_storage_service, get_variable_service, session_scope
+from langflow.services.deps import get_http_client_service, get_storage_service, get_variable_service, session_scope
 from langflow.services.storage.service import StorageService
 from langflow.template.utils import update_frontend_node_with_template_values
 from langflow.type_extraction.type_extraction import post_process_type
@@ -27,6 +27,7 @@ if TYPE_CHECKING:
     from langflow.graph.vertex.base import Vertex
     from langflow.schema.dotdict import dotdict
     from langflow.schema.schema import OutputValue
+    from langflow.services.http_client.service import HTTPClientService
     from langflow.services.storage.service import StorageService
     from langflow.services.tracing.schema import Log
     from langflow.services.tracing.service import TracingService
@@ -64,6 +65,9 @@ class CustomComponent(BaseComponent):
     priority: int | None = None
     """The priority of the component in the category. Lower priority means it will be displayed first. Defaults to None.
     """
+    cache_results: bool = False
+    """Whether the results of the component can be reused in later runs when its code and inputs are unchanged.
+    Only set it for components whose results depend on nothing else. Defaults to False."""
 
     def __init__(self, **data) -> None:
         """Initializes a new instance of the CustomComponent class.
@@ -189,12 +193,32 @@ class CustomComponent(BaseComponent):
             path_object = path_object.resolve()
         return str(path_object)
 
+    def get_result_cache_dependencies(self, params: dict[str, Any]) -> Any:  # noqa: ARG002
+        """Returns what the results depend on besides the params, such as the files the component reads.
+
+        It is only called for components that set `cache_results`, off the event loop, and the value is added to
+        the key of the cached results. It must be picklable. Defaults to None.
+
+        Args:
+            params: The resolved params of the vertex.
+        """
+        return None
+
     def get_full_path(self, path: str) -> str:
         storage_svc: StorageService = get_storage_service()
 
         flow_id, file_name = path.split("/", 1)
         return storage_svc.build_full_path(flow_id, file_name)
 
+    @property
+    def http_client(self) -> HTTPClientService:
+        """The HTTP client shared by every component.
+
+        It keeps connections alive between runs and limits the requests sent to each host at once, so use it
+        instead of creating an `httpx.AsyncClient` for each request, e.g. `await self.http_client.get(url)`.
+        """
+        return get_http_client_service()
+
     @property
     def graph(self):
         return self._vertex.graph
@@ -446,7 +470,6 @@ class CustomComponent(BaseComponent):
         if hasattr(self, "_user_id") and not self.user_id:
             msg = f"User id is not set for {self.__class__.__name__}"
             raise ValueError(msg)
-        variable_service = get_variable_service()  # Get service instance
         # Retrieve and decrypt the variable by name for the current user
         if isinstance(self.user_id, str):
             user_id = uuid.UUID(self.user_id)
@@ -455,6 +478,10 @@ class CustomComponent(BaseComponent):
         else:
             msg = f"Invalid user id: {self.user_id}"
             raise TypeError(msg)
+        if self._vertex is not None:
+            # Resolve through the graph so every variable of the run is fetched in a single query.
+            return await self.graph.get_variable_cache(user_id).get(name, field)
+        variable_service = get_variable_service()
         async with session_scope() as session:
             return await variable_service.get_variable(user_id=user_id, name=name, field=field, session=session)
 
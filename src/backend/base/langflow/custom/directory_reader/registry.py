@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from pathlib import Path
+from typing import Any, TypedDict
+
+import orjson
+from loguru import logger
+
+from langflow.custom.directory_reader.directory_reader import DirectoryReader
+from langflow.utils.version import get_version_info
+
+COMPONENT_REGISTRY_FILE = "component_registry.json"
+# Directories of the Langflow package that do not affect how a component file is built. The components are
+# keyed by their own hash.
+_FINGERPRINT_SKIPPED_DIRS = {"__pycache__", "components", "frontend"}
+
+
+class ComponentFileEntry(TypedDict):
+    hash: str
+    menu: str
+    path: str
+    name: str
+    template: dict[str, Any] | None
+    component: dict[str, Any]
+
+
+def hash_component_file(file_path: str) -> str | None:
+    try:
+        return hashlib.sha256(Path(file_path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+@cache
+def get_environment_fingerprint() -> str:
+    """Hash what the templates depend on besides the component files themselves.
+
+    That is every Python file of the Langflow package outside the components, identified by its path, size and
+    modification time, and the name and version of every installed distribution, read from the names of their
+    metadata directories. Reading stats and directory names keeps this fast enough to run on every start.
+    """
+    import langflow
+
+    digest = hashlib.sha256()
+    package_path = Path(langflow.__file__).parent
+    for dir_path, dir_names, file_names in os.walk(package_path):
+        dir_names[:] = sorted(name for name in dir_names if name not in _FINGERPRINT_SKIPPED_DIRS)
+        for file_name in sorted(file_names):
+            if file_name.endswith(".py"):
+                stat = Path(dir_path, file_name).stat()
+                digest.update(f"{dir_path}/{file_name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    for path in dict.fromkeys(sys.path):
+        try:
+            entries = sorted(os.listdir(path or "."))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.endswith((".dist-info", ".egg-info")):
+                digest.update(f"{entry}\n".encode())
+    return digest.hexdigest()
+
+
+def build_component_file(directory_path: str, file_path: str, file_hash: str) -> ComponentFileEntry:
+    """Build the frontend template of a component file the same way `DirectoryReader` does.
+
+    This runs in a worker process when `component_build_workers` is set, so it only takes and returns
+    picklable values.
+    """
+    from langflow.custom.directory_reader.utils import build_invalid_component
+    from langflow.custom.utils import build_component
+
+    reader = DirectoryReader(directory_path, compress_code_field=False)
+    file_path_ = Path(file_path)
+    component_name = file_path_.stem
+    if "_" in component_name:
+        component_name = " ".join(word.title() for word in component_name.split("_"))
+
+    validation_result, result_content = reader.process_file(file_path)
+    if validation_result:
+        try:
+            output_types = reader.get_output_types_from_code(result_content)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug("Error while getting output types from code")
+            output_types = [component_name]
+    else:
+        logger.error(f"Error while processing file {file_path}")
+        output_types = [component_name]
+
+    component = {
+        "name": component_name,
+        "output_types": output_types,
+        "file": file_path_.name,
+        "code": result_content if validation_result else "",
+        "error": "" if validation_result else result_content,
+    }
+    template = None
+    try:
+        if validation_result:
+            component_name, template = build_component(component)
+        else:
+            component_name, template = build_invalid_component(component)
+    except Exception:  # noqa: BLE001
+        logger.debug(f"Error while loading component {component['name']} from {component['file']}")
+    return ComponentFileEntry(
+        hash=file_hash,
+        menu=file_path_.parent.name,
+        path=str(file_path_.parent),
+        name=component_name,
+        template=template,
+        component=component,
+    )
+
+
+class ComponentRegistry:
+    """An on-disk registry of the frontend templates built from component files.
+
+    Entries are keyed by the path and the SHA-256 of each file, and the whole registry is tied to the Langflow
+    version that wrote it and to the fingerprint of the Langflow sources and the installed packages, so upgrading
+    a dependency or editing Langflow itself rebuilds every component. When the components are loaded at startup,
+    unchanged files are read from the registry and only new or changed files are built again, optionally in a
+    pool of `max_workers` processes.
+
+    Only components that built without errors are saved, so a component that failed because of a missing
+    dependency is retried on the next start.
+
+    Args:
+        registry_path: The JSON file the registry is read from and saved to.
+        max_workers: The number of processes used to build changed files. 0 builds them in this process.
+    """
+
+    def __init__(self, registry_path: str | Path, *, max_workers: int = 0) -> None:
+        self.registry_path = Path(registry_path)
+        self.max_workers = max_workers
+        self.version = get_version_info()["version"]
+        self._fingerprint: str | None = None
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, ComponentFileEntry] = {}
+        self._seen: dict[str, ComponentFileEntry] = {}
+
+    @property
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = get_environment_fingerprint()
+        return self._fingerprint
+
+    @fingerprint.setter
+    def fingerprint(self, value: str) -> None:
+        self._fingerprint = value
+
+    def load(self) -> None:
+        try:
+            data = orjson.loads(self.registry_path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, orjson.JSONDecodeError):
+            logger.warning(f"Could not read the component registry at {self.registry_path}, rebuilding it")
+            return
+        if data.get("version") != self.version:
+            logger.debug("The component registry was built by another Langflow version, rebuilding it")
+            return
+        if data.get("fingerprint") != self.fingerprint:
+            logger.debug("The Langflow sources or the installed packages changed, rebuilding the component registry")
+            return
+        self._entries = data.get("files", {})
+
+    def save(self) -> None:
+        """Write the entries of the files loaded since the registry was created, dropping the others."""
+        data = orjson.dumps({"version": self.version, "fingerprint": self.fingerprint, "files": self._seen})
+        self.registry_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that concurrent workers never read a partial registry.
+        fd, tmp_path = tempfile.mkstemp(dir=self.registry_path.parent, prefix=".component_registry.")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            Path(tmp_path).replace(self.registry_path)
+        except OSError:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    async def abuild_component_files(self, reader: DirectoryReader, file_list: list[str]) -> list[ComponentFileEntry]:
+        """Return the built entries for the files, in the same order, building only those that changed."""
+        file_list = [file_path for file_path in file_list if Path(file_path).stem not in reader.disabled_components]
+        hashes = await asyncio.to_thread(lambda: [hash_component_file(file_path) for file_path in file_list])
+
+        entries: dict[str, ComponentFileEntry] = {}
+        to_build: list[tuple[str, str]] = []
+        for file_path, file_hash in zip(file_list, hashes, strict=True):
+            cached = self._entries.get(file_path)
+            if file_hash is not None and cached is not None and cached["hash"] == file_hash:
+                entries[file_path] = cached
+            else:
+                to_build.append((file_path, file_hash or ""))
+        self.hits += len(entries)
+        self.misses += len(to_build)
+
+        for (file_path, _), entry in zip(to_build, await self._abuild(reader, to_build), strict=True):
+            entries[file_path] = entry
+            if self._is_cacheable(entry):
+                self._seen[file_path] = entry
+        for file_path, entry in entries.items():
+            if file_path not in self._seen and self._entries.get(file_path) is entry:
+                self._seen[file_path] = entry
+        return [entries[file_path] for file_path in file_list]
+
+    async def _abuild(self, reader: DirectoryReader, to_build: list[tuple[str, str]]) -> list[ComponentFileEntry]:
+        if not to_build:
+            return []
+        logger.debug(f"Building {len(to_build)} component file(s) missing from the component registry")
+        directory_path = str(reader.directory_path)
+        if self.max_workers > 0 and len(to_build) > 1:
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(to_build))) as executor:
+                futures = [
+                    loop.run_in_executor(executor, build_component_file, directory_path, file_path, file_hash)
+                    for file_path, file_hash in to_build
+                ]
+                return list(await asyncio.gather(*futures))
+        return [
+            await asyncio.to_thread(build_component_file, directory_path, file_path, file_hash)
+            for file_path, file_hash in to_build
+        ]
+
+    @staticmethod
+    def _is_cacheable(entry: ComponentFileEntry) -> bool:
+        if not entry["hash"] or entry["template"] is None or entry["component"]["error"]:
+            return False
+        try:
+            orjson.dumps(entry)
+        except TypeError:
+            return False
+        return True
@@ -1,10 +1,16 @@
+from __future__ import annotations
+
 import asyncio
+from typing import TYPE_CHECKING
 
 from loguru import logger
 
 from langflow.custom.directory_reader import DirectoryReader
 from langflow.template.frontend_node.custom_components import CustomComponentFrontendNode
 
+if TYPE_CHECKING:
+    from langflow.custom.directory_reader.registry import ComponentFileEntry, ComponentRegistry
+
 
 def merge_nested_dicts_with_renaming(dict1, dict2):
     for key, value in dict2.items():
@@ -83,12 +89,31 @@ def build_custom_component_list_from_path(path: str):
     return merge_nested_dicts_with_renaming(valid_menu, invalid_menu)
 
 
-async def abuild_custom_component_list_from_path(path: str):
-    """Build a list of custom components for the langchain from a given path."""
+def group_component_entries(entries: list[ComponentFileEntry], *, with_errors: bool) -> dict:
+    """Group built component files by menu, like `DirectoryReader.filter_loaded_components`."""
+    menus: dict[str, dict] = {}
+    for entry in entries:
+        if entry["template"] is None or bool(entry["component"]["error"]) != with_errors:
+            continue
+        menu = menus.setdefault(entry["menu"], {"name": entry["menu"], "path": entry["path"], "components": []})
+        menu["components"].append((entry["name"], entry["template"], entry["component"]))
+    return {"menu": list(menus.values())}
+
+
+async def abuild_custom_component_list_from_path(path: str, registry: ComponentRegistry | None = None):
+    """Build a list of custom components for the langchain from a given path.
+
+    If a registry is given, unchanged component files are loaded from it instead of being built again.
+    """
     file_list = await asyncio.to_thread(load_files_from_path, path)
     reader = DirectoryReader(path, compress_code_field=False)
 
-    valid_components, invalid_components = await abuild_and_validate_all_files(reader, file_list)
+    if registry is None:
+        valid_components, invalid_components = await abuild_and_validate_all_files(reader, file_list)
+    else:
+        entries = await registry.abuild_component_files(reader, file_list)
+        valid_components = group_component_entries(entries, with_errors=False)
+        invalid_components = group_component_entries(entries, with_errors=True)
 
     valid_menu = build_valid_menu(valid_components)
     invalid_menu = build_invalid_menu(invalid_components)
@@ -1,12 +1,67 @@
-from typing import TYPE_CHECKING
+import hashlib
+import threading
+from typing import TYPE_CHECKING, NamedTuple
+
+from cachetools import LRUCache
 
 from langflow.utils import validate
 
 if TYPE_CHECKING:
     from langflow.custom import CustomComponent
 
+COMPONENT_CLASS_CACHE_SIZE = 512
+
+
+class ComponentClassCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+_class_cache: LRUCache[str, type["CustomComponent"]] = LRUCache(maxsize=COMPONENT_CLASS_CACHE_SIZE)
+_class_cache_lock = threading.Lock()
+_class_cache_hits = 0
+_class_cache_misses = 0
+
 
 def eval_custom_component_code(code: str) -> type["CustomComponent"]:
-    """Evaluate custom component code."""
+    """Evaluate custom component code.
+
+    Classes are cached by the SHA-256 of the code, so evaluating the same code again returns
+    the class that was already compiled instead of parsing and executing the code again.
+    """
+    global _class_cache_hits, _class_cache_misses  # noqa: PLW0603
+    code_hash = hashlib.sha256(code.encode("utf-8")).hexdigest()
+    with _class_cache_lock:
+        component_class = _class_cache.get(code_hash)
+        if component_class is not None:
+            _class_cache_hits += 1
+            return component_class
+        _class_cache_misses += 1
+
     class_name = validate.extract_class_name(code)
-    return validate.create_class(code, class_name)
+    component_class = validate.create_class(code, class_name)
+    with _class_cache_lock:
+        _class_cache[code_hash] = component_class
+    return component_class
+
+
+def component_class_cache_info() -> ComponentClassCacheInfo:
+    """Return hit and miss statistics for the component class cache."""
+    with _class_cache_lock:
+        return ComponentClassCacheInfo(
+            hits=_class_cache_hits,
+            misses=_class_cache_misses,
+            maxsize=int(_class_cache.maxsize),
+            currsize=int(_class_cache.currsize),
+        )
+
+
+def clear_component_class_cache() -> None:
+    """Remove every cached component class and reset the statistics."""
+    global _class_cache_hits, _class_cache_misses  # noqa: PLW0603
+    with _class_cache_lock:
+        _class_cache.clear()
+        _class_cache_hits = 0
+        _class_cache_misses = 0
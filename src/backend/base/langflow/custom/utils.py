@@ -15,6 +15,7 @@ from pydantic import BaseModel
 
 from langflow.custom import CustomComponent
 from langflow.custom.custom_component.component import Component
+from langflow.custom.directory_reader.registry import COMPONENT_REGISTRY_FILE, ComponentRegistry
 from langflow.custom.directory_reader.utils import (
     abuild_custom_component_list_from_path,
     build_custom_component_list_from_path,
@@ -25,6 +26,7 @@ from langflow.custom.schema import MissingDefault
 from langflow.field_typing.range_spec import RangeSpec
 from langflow.helpers.custom import format_type
 from langflow.schema import dotdict
+from langflow.services.deps import get_settings_service
 from langflow.template.field.base import Input
 from langflow.template.frontend_node.custom_components import ComponentFrontendNode, CustomComponentFrontendNode
 from langflow.type_extraction.type_extraction import extract_inner_type
@@ -491,6 +493,7 @@ async def abuild_custom_components(components_paths: list[str]):
         return {}
 
     logger.info(f"Building custom components from {components_paths}")
+    registry = await asyncio.to_thread(_load_component_registry)
     custom_components_from_file: dict = {}
     processed_paths = set()
     for path in components_paths:
@@ -498,7 +501,7 @@ async def abuild_custom_components(components_paths: list[str]):
         if path_str in processed_paths:
             continue
 
-        custom_component_dict = await abuild_custom_component_list_from_path(path_str)
+        custom_component_dict = await abuild_custom_component_list_from_path(path_str, registry)
         if custom_component_dict:
             category = next(iter(custom_component_dict))
             logger.info(f"Loading {len(custom_component_dict[category])} component(s) from category {category}")
@@ -507,9 +510,26 @@ async def abuild_custom_components(components_paths: list[str]):
             )
         processed_paths.add(path_str)
 
+    if registry is not None:
+        logger.debug(f"Loaded {registry.hits} component file(s) from the registry and built {registry.misses}")
+        try:
+            await asyncio.to_thread(registry.save)
+        except OSError:
+            logger.warning(f"Could not save the component registry to {registry.registry_path}")
     return custom_components_from_file
 
 
+def _load_component_registry() -> ComponentRegistry | None:
+    settings = get_settings_service().settings
+    if not settings.use_component_registry or not settings.config_dir:
+        return None
+    registry = ComponentRegistry(
+        Path(settings.config_dir) / COMPONENT_REGISTRY_FILE, max_workers=settings.component_build_workers
+    )
+    registry.load()
+    return registry
+
+
 def sanitize_field_config(field_config: dict | Input):
     # If any of the already existing keys are in field_config, remove them
     field_dict = field_config.to_dict() if isinstance(field_config, Input) else field_config
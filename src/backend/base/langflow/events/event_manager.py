@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import inspect
 import json
 import time
 import uuid
+from datetime import datetime, timezone
 from functools import partial
 from typing import TYPE_CHECKING, Literal
 
+import orjson
 from fastapi.encoders import jsonable_encoder
 from loguru import logger
 from typing_extensions import Protocol
@@ -14,10 +18,13 @@ from typing_extensions import Protocol
 from langflow.schema.playground_events import create_event_by_type
 
 if TYPE_CHECKING:
-    import asyncio
-
     from langflow.schema.log import LoggableType
 
+TOKEN_FLUSH_INTERVAL = 0.05
+"""Seconds a streamed token can wait in the buffer before it is sent."""
+TOKEN_FLUSH_BYTES = 1024
+"""Number of buffered chunk bytes for a message after which the buffer is sent right away."""
+
 
 class EventCallback(Protocol):
     def __call__(self, *, manager: EventManager, event_type: str, data: LoggableType): ...
@@ -28,9 +35,40 @@ class PartialEventCallback(Protocol):
 
 
 class EventManager:
-    def __init__(self, queue: asyncio.Queue):
+    """Serializes events and puts them on a queue for the client.
+
+    Token events registered without a custom callback are buffered per message id and sent as a single
+    token event once `token_flush_interval` seconds have passed or `token_flush_bytes` bytes have been
+    buffered. Any other event flushes the buffers first, so the client always sees events in order.
+
+    The buffers and the queue are only touched on the event loop the manager is used from. Events sent from
+    another thread, such as a component sending messages from `asyncio.to_thread`, are handed to that loop
+    with `call_soon_threadsafe`, which keeps them in the order they were sent.
+
+    Args:
+        queue: The queue the serialized events are put on.
+        token_flush_interval: Seconds a token can wait in the buffer. 0 sends every token on its own.
+        token_flush_bytes: Buffered chunk bytes for a message after which the buffer is sent.
+    """
+
+    def __init__(
+        self,
+        queue: asyncio.Queue,
+        *,
+        token_flush_interval: float = TOKEN_FLUSH_INTERVAL,
+        token_flush_bytes: int = TOKEN_FLUSH_BYTES,
+    ):
         self.queue = queue
         self.events: dict[str, PartialEventCallback] = {}
+        self.token_flush_interval = token_flush_interval
+        self.token_flush_bytes = token_flush_bytes
+        self._token_buffers: dict[str, list[str]] = {}
+        self._token_buffer_bytes: dict[str, int] = {}
+        self._token_buffer_started: float | None = None
+        self._token_flush_handle: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        with contextlib.suppress(RuntimeError):
+            self._loop = asyncio.get_running_loop()
 
     @staticmethod
     def _validate_callback(callback: EventCallback) -> None:
@@ -60,12 +98,35 @@ class EventManager:
             msg = "Event name must start with 'on_'"
             raise ValueError(msg)
         if callback is None:
-            callback_ = partial(self.send_event, event_type=event_type)
+            send = self.send_token if event_type == "token" else self.send_event
+            callback_ = partial(send, event_type=event_type)
         else:
             callback_ = partial(callback, manager=self, event_type=event_type)
         self.events[name] = callback_
 
+    def is_native_event(self, name: str) -> bool:
+        """Whether the event is handled by the manager itself rather than by a custom callback.
+
+        Native events never block, so they can be sent from the event loop without a thread hop.
+        """
+        callback = self.events.get(name)
+        return isinstance(callback, partial) and callback.func in (self.send_event, self.send_token)
+
+    def _is_off_loop(self) -> bool:
+        """Whether the call comes from another thread than the event loop the manager is used from."""
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if self._loop is None or self._loop.is_closed():
+            self._loop = running_loop
+        return self._loop is not None and running_loop is not self._loop
+
     def send_event(self, *, event_type: Literal["message", "error", "warning", "info", "token"], data: LoggableType):
+        if self._is_off_loop():
+            self._loop.call_soon_threadsafe(partial(self.send_event, event_type=event_type, data=data))
+            return
+        self.flush_tokens()
         try:
             if isinstance(data, dict) and event_type in {"message", "error", "warning", "info", "token"}:
                 data = create_event_by_type(event_type, **data)
@@ -74,10 +135,69 @@ class EventManager:
         except Exception:
             raise
         jsonable_data = jsonable_encoder(data)
-        json_data = {"event": event_type, "data": jsonable_data}
+        self._put_event(event_type, jsonable_data)
+
+    def send_token(self, *, event_type: Literal["token"], data: LoggableType) -> None:
+        """Buffer a streamed chunk and send the buffered chunks of its message as one token event."""
+        if self._is_off_loop():
+            self._loop.call_soon_threadsafe(partial(self.send_token, event_type=event_type, data=data))
+            return
+        if self.token_flush_interval <= 0 or not isinstance(data, dict) or not isinstance(data.get("chunk"), str):
+            self.send_event(event_type=event_type, data=data)
+            return
+
+        message_id = str(data.get("id"))
+        chunk = data["chunk"]
+        self._token_buffers.setdefault(message_id, []).append(chunk)
+        buffered_bytes = self._token_buffer_bytes.get(message_id, 0) + len(chunk)
+        self._token_buffer_bytes[message_id] = buffered_bytes
+
+        now = time.monotonic()
+        if self._token_buffer_started is None:
+            self._token_buffer_started = now
+            self._schedule_token_flush()
+        if buffered_bytes >= self.token_flush_bytes or now - self._token_buffer_started >= self.token_flush_interval:
+            self.flush_tokens()
+
+    def flush_tokens(self) -> None:
+        """Send every buffered chunk, one token event per message."""
+        if self._is_off_loop():
+            self._loop.call_soon_threadsafe(self.flush_tokens)
+            return
+        if self._token_flush_handle is not None:
+            self._token_flush_handle.cancel()
+            self._token_flush_handle = None
+        self._token_buffer_started = None
+        if not self._token_buffers:
+            return
+        buffers = self._token_buffers
+        self._token_buffers = {}
+        self._token_buffer_bytes = {}
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z")
+        for message_id, chunks in buffers.items():
+            self._put_event("token", {"chunk": "".join(chunks), "id": message_id, "timestamp": timestamp})
+
+    def _schedule_token_flush(self) -> None:
+        if self._loop is None:
+            # Used without an event loop; the buffer is flushed by the next token or event instead.
+            return
+        self._token_flush_handle = self._loop.call_later(self.token_flush_interval, self.flush_tokens)
+
+    def _put_event(self, event_type: str, jsonable_data: LoggableType) -> None:
         event_id = f"{event_type}-{uuid.uuid4()}"
-        str_data = json.dumps(json_data) + "\n\n"
-        self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
+        event = {"event": event_type, "data": jsonable_data}
+        try:
+            str_data = orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS) + b"\n\n"
+        except orjson.JSONEncodeError:
+            # orjson rejects some values json accepts, such as integers that do not fit in 64 bits.
+            str_data = (json.dumps(event) + "\n\n").encode("utf-8")
+        self.queue.put_nowait((event_id, str_data, time.time()))
+
+    async def wait_for_capacity(self) -> None:
+        """Wait until the queue can take more events, if the queue applies backpressure."""
+        wait_for_capacity = getattr(self.queue, "wait_for_capacity", None)
+        if wait_for_capacity is not None:
+            await wait_for_capacity()
 
     def noop(self, *, data: LoggableType) -> None:
         pass
@@ -86,8 +206,8 @@ class EventManager:
         return self.events.get(name, self.noop)
 
 
-def create_default_event_manager(queue):
-    manager = EventManager(queue)
+def create_default_event_manager(queue, *, token_flush_interval: float = TOKEN_FLUSH_INTERVAL):
+    manager = EventManager(queue, token_flush_interval=token_flush_interval)
     manager.register_event("on_token", "token")
     manager.register_event("on_vertices_sorted", "vertices_sorted")
     manager.register_event("on_error", "error")
@@ -7,10 +7,10 @@ import copy
 import json
 import queue
 import threading
+import time
 import uuid
 from collections import defaultdict, deque
 from datetime import datetime, timezone
-from functools import partial
 from itertools import chain
 from typing import TYPE_CHECKING, Any, cast
 
@@ -19,6 +19,7 @@ from loguru import logger
 from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.edge.base import CycleEdge, Edge
 from langflow.graph.graph.constants import Finish, lazy_load_vertex_dict
+from langflow.graph.graph.edge_index import EdgeIndex
 from langflow.graph.graph.runnable_vertices_manager import RunnableVerticesManager
 from langflow.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
 from langflow.graph.graph.state_manager import GraphStateManager
@@ -32,7 +33,7 @@ from langflow.graph.graph.utils import (
     should_continue,
 )
 from langflow.graph.schema import InterfaceComponentTypes, RunOutputs
-from langflow.graph.utils import log_vertex_build
+from langflow.graph.utils import load_build_schedule, log_build_times, log_vertex_build
 from langflow.graph.vertex.base import Vertex, VertexStates
 from langflow.graph.vertex.schema import NodeData, NodeTypeEnum
 from langflow.graph.vertex.vertex_types import ComponentVertex, InterfaceVertex, StateVertex
@@ -40,7 +41,8 @@ from langflow.logging.logger import LogConfig, configure
 from langflow.schema.dotdict import dotdict
 from langflow.schema.schema import INPUT_FIELD_NAME, InputType
 from langflow.services.cache.utils import CacheMiss
-from langflow.services.deps import get_chat_service, get_tracing_service
+from langflow.services.deps import get_chat_service, get_settings_service, get_tracing_service
+from langflow.services.variable.run_cache import RunVariableCache
 from langflow.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
@@ -50,6 +52,7 @@ if TYPE_CHECKING:
     from langflow.custom.custom_component.component import Component
     from langflow.events.event_manager import EventManager
     from langflow.graph.edge.schema import EdgeData
+    from langflow.graph.graph.build_schedule import BuildSchedule
     from langflow.graph.schema import ResultData
     from langflow.schema import Data
     from langflow.services.chat.schema import GetCache, SetCache
@@ -109,7 +112,8 @@ class Graph:
         self.vertices_to_run: set[str] = set()
         self.stop_vertex: str | None = None
         self.inactive_vertices: set = set()
-        self.edges: list[CycleEdge] = []
+        self._edge_list: list[CycleEdge] = []
+        self._edge_index = EdgeIndex()
         self.vertices: list[Vertex] = []
         self.run_manager = RunnableVerticesManager()
         self.state_manager = GraphStateManager()
@@ -118,6 +122,9 @@ class Graph:
 
         self.top_level_vertices: list[str] = []
         self.vertex_map: dict[str, Vertex] = {}
+        # The cache key ChatService.set_graph last stored the graph under, and the vertices whose build state it holds.
+        self.cache_key: str | None = None
+        self.cached_vertex_ids: set[str] = set()
         self.predecessor_map: dict[str, list[str]] = defaultdict(list)
         self.successor_map: dict[str, list[str]] = defaultdict(list)
         self.in_degree_map: dict[str, int] = defaultdict(int)
@@ -132,6 +139,10 @@ class Graph:
         self._call_order: list[str] = []
         self._snapshots: list[dict[str, Any]] = []
         self._end_trace_tasks: set[asyncio.Task] = set()
+        self._variable_cache: RunVariableCache | None = None
+        self._build_schedule: BuildSchedule | None = None
+        self._build_schedule_loaded = False
+        self._build_times: dict[str, float] = {}
 
         if context and not isinstance(context, dict):
             msg = "Context must be a dictionary"
@@ -149,6 +160,24 @@ class Graph:
             msg = "You must provide both input and output components"
             raise ValueError(msg)
 
+    def get_variable_cache(self, user_id: uuid.UUID) -> RunVariableCache:
+        """Return the cache that resolves the variables of `user_id` for this graph run.
+
+        The cache knows every variable name the vertices load from the database, so the first lookup
+        fetches all of them in one query.
+        """
+        variable_cache = getattr(self, "_variable_cache", None)
+        if variable_cache is None or variable_cache.user_id != user_id:
+            names = {
+                value
+                for vertex in self.vertices
+                for field in vertex.load_from_db_fields
+                if isinstance(value := vertex.params.get(field), str) and value
+            }
+            variable_cache = RunVariableCache(user_id, names)
+            self._variable_cache = variable_cache
+        return variable_cache
+
     @property
     def context(self) -> dotdict:
         if isinstance(self._context, dotdict):
@@ -662,6 +691,27 @@ class Graph:
                 user_id=self.user_id,
                 session_id=self.session_id,
             )
+        await self.load_build_schedule()
+
+    async def load_build_schedule(self) -> None:
+        """Loads the schedule built from the build times of earlier runs of the flow, once per graph."""
+        if self._build_schedule_loaded:
+            return
+        self._build_schedule_loaded = True
+        if self.flow_id:
+            self._build_schedule = await load_build_schedule(self.flow_id)
+
+    def sort_by_build_schedule(self, vertex_ids: Iterable[str]) -> list[str]:
+        """Sorts vertices that can be built so that those on the longest expected chain of builds start first."""
+        if self._build_schedule is None:
+            return list(vertex_ids)
+        return self._build_schedule.sort(vertex_ids, self.successor_map)
+
+    async def save_build_times(self) -> None:
+        """Adds the build times of the vertices built since the last call to the statistics of the flow."""
+        build_times, self._build_times = self._build_times, {}
+        if self.flow_id:
+            await log_build_times(flow_id=self.flow_id, build_times=build_times)
 
     def _end_all_traces_async(self, outputs: dict[str, Any] | None = None, error: Exception | None = None) -> None:
         task = asyncio.create_task(self.end_all_traces(outputs, error))
@@ -739,6 +789,7 @@ class Graph:
         session_id: str,
         fallback_to_env_vars: bool,
         event_manager: EventManager | None = None,
+        cache_graph: bool = True,
     ) -> list[ResultData | None]:
         """Runs the graph with the given inputs.
 
@@ -751,6 +802,7 @@ class Graph:
             session_id (str): The session ID for the graph.
             fallback_to_env_vars (bool): Whether to fallback to environment variables.
             event_manager (EventManager | None): The event manager for the graph.
+            cache_graph (bool): Whether to store the graph in the chat service cache before running it.
 
         Returns:
             List[Optional["ResultData"]]: The outputs of the graph.
@@ -774,12 +826,8 @@ class Graph:
                 raise ValueError(msg)
             vertex.update_raw_params({"session_id": session_id})
         # Process the graph
-        try:
-            cache_service = get_chat_service()
-            if self.flow_id:
-                await cache_service.set_cache(self.flow_id, self)
-        except Exception:  # noqa: BLE001
-            logger.exception("Error setting cache")
+        if cache_graph:
+            await self._cache_graph()
 
         try:
             # Prioritize the webhook component if it exists
@@ -812,6 +860,14 @@ class Graph:
 
         return vertex_outputs
 
+    async def _cache_graph(self) -> None:
+        try:
+            cache_service = get_chat_service()
+            if self.flow_id:
+                await cache_service.set_graph(self.flow_id, self)
+        except Exception:  # noqa: BLE001
+            logger.exception("Error setting cache")
+
     async def arun(
         self,
         inputs: list[dict[str, str]],
@@ -823,6 +879,7 @@ class Graph:
         stream: bool = False,
         fallback_to_env_vars: bool = False,
         event_manager: EventManager | None = None,
+        max_concurrency: int | None = None,
     ) -> list[RunOutputs]:
         """Runs the graph with the given inputs.
 
@@ -835,9 +892,12 @@ class Graph:
             stream (bool, optional): Whether to stream the results or not. Defaults to False.
             fallback_to_env_vars (bool, optional): Whether to fallback to environment variables. Defaults to False.
             event_manager (EventManager | None): The event manager for the graph.
+            max_concurrency (int | None, optional): How many inputs to run at the same time. When it is set and
+                there are several inputs, each input runs on its own clone of the graph. Otherwise, or if the graph
+                cannot be cloned, the inputs run one after the other on this graph. Defaults to None.
 
         Returns:
-            List[RunOutputs]: The outputs of the graph.
+            List[RunOutputs]: The outputs of the graph, in the same order as the inputs.
         """
         # inputs is {"message": "Hello, world!"}
         # we need to go through self.inputs and update the self.raw_params
@@ -860,6 +920,17 @@ class Graph:
             self.session_id = session_id
         for _ in range(len(inputs) - len(types)):
             types.append("chat")  # default to chat
+        if max_concurrency is not None and len(inputs) > 1 and getattr(self, "_graph_data", None) is not None:
+            return await self._arun_concurrently(
+                list(zip(inputs, inputs_components, types, strict=True)),
+                max_concurrency=max_concurrency,
+                outputs=outputs or [],
+                stream=stream,
+                session_id=session_id or "",
+                fallback_to_env_vars=fallback_to_env_vars,
+                event_manager=event_manager,
+            )
+        await self._cache_graph()
         for run_inputs, components, input_type in zip(inputs, inputs_components, types, strict=True):
             run_outputs = await self._run(
                 inputs=run_inputs,
@@ -870,12 +941,58 @@ class Graph:
                 session_id=session_id or "",
                 fallback_to_env_vars=fallback_to_env_vars,
                 event_manager=event_manager,
+                cache_graph=False,
             )
             run_output_object = RunOutputs(inputs=run_inputs, outputs=run_outputs)
             logger.debug(f"Run outputs: {run_output_object}")
             vertex_outputs.append(run_output_object)
         return vertex_outputs
 
+    async def _arun_concurrently(
+        self,
+        runs: list[tuple[dict[str, str], list[str], InputType | None]],
+        *,
+        max_concurrency: int,
+        outputs: list[str],
+        stream: bool,
+        session_id: str,
+        fallback_to_env_vars: bool,
+        event_manager: EventManager | None,
+    ) -> list[RunOutputs]:
+        """Runs each input on its own clone of the graph, at most `max_concurrency` at a time.
+
+        If a run fails, the runs that have not finished are cancelled and the error is raised.
+        """
+        semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+        await self._cache_graph()
+        await self.load_build_schedule()
+
+        async def run_clone(run_inputs: dict[str, str], components: list[str], input_type: InputType | None):
+            async with semaphore:
+                graph = self.clone()
+                graph.session_id = self.session_id
+                run_outputs = await graph._run(
+                    inputs=run_inputs,
+                    input_components=components,
+                    input_type=input_type,
+                    outputs=outputs,
+                    stream=stream,
+                    session_id=session_id,
+                    fallback_to_env_vars=fallback_to_env_vars,
+                    event_manager=event_manager,
+                    cache_graph=False,
+                )
+                return RunOutputs(inputs=run_inputs, outputs=run_outputs)
+
+        tasks = [asyncio.create_task(run_clone(*run)) for run in runs]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
     def next_vertex_to_build(self):
         """Returns the next vertex to be built.
 
@@ -1014,6 +1131,43 @@ class Graph:
             "_sorted_vertices_layers": self._sorted_vertices_layers,
         }
 
+    def get_run_state(self) -> dict[str, Any]:
+        """Returns the state of the current run, without the results of the vertices.
+
+        Unlike `__getstate__`, this does not include the vertices and edges, so it stays small
+        for large graphs. Use it with `Vertex.get_build_state` to save a run incrementally and
+        `set_run_state` to restore it on a graph created from the same flow data.
+        """
+        return {
+            "run_manager": self.run_manager.to_dict(),
+            "_run_id": self._run_id,
+            "_session_id": self._session_id,
+            "inactivated_vertices": self.inactivated_vertices,
+            "activated_vertices": self.activated_vertices,
+            "vertices_layers": self.vertices_layers,
+            "vertices_to_run": self.vertices_to_run,
+            "stop_vertex": self.stop_vertex,
+            "_run_queue": self._run_queue,
+            "_first_layer": self._first_layer,
+            "_sorted_vertices_layers": self._sorted_vertices_layers,
+            "built_vertices": [vertex.id for vertex in self.vertices if vertex.built],
+        }
+
+    def set_run_state(self, state: dict[str, Any]) -> None:
+        run_manager = RunnableVerticesManager.from_dict(state["run_manager"])
+        run_manager.cycle_vertices = self.run_manager.cycle_vertices
+        self.run_manager = run_manager
+        self.inactivated_vertices = state["inactivated_vertices"]
+        self.activated_vertices = state["activated_vertices"]
+        self.vertices_layers = state["vertices_layers"]
+        self.vertices_to_run = state["vertices_to_run"]
+        self.stop_vertex = state["stop_vertex"]
+        self._run_queue = state["_run_queue"]
+        self._first_layer = state["_first_layer"]
+        self._sorted_vertices_layers = state["_sorted_vertices_layers"]
+        self._session_id = state["_session_id"]
+        self._run_id = state["_run_id"]
+
     def __deepcopy__(self, memo):
         # Check if we've already copied this instance
         if id(self) in memo:
@@ -1053,11 +1207,18 @@ class Graph:
             state["run_manager"] = run_manager
         else:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
+        edges = state.pop("edges")
         self.__dict__.update(state)
+        self.edges = edges
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
         self.state_manager = GraphStateManager()
         self.tracing_service = get_tracing_service()
         self.set_run_id(self._run_id)
+        self._build_schedule = None
+        self._build_schedule_loaded = False
+        self._build_times = {}
+        self.cache_key = None
+        self.cached_vertex_ids = set()
 
     @classmethod
     def from_payload(
@@ -1096,6 +1257,44 @@ class Graph:
         else:
             return graph
 
+    def clone(self, *, user_id: str | None = None) -> Graph:
+        """Creates a new graph with fresh vertex state from this graph's processed flow data.
+
+        The flow data has already been flattened by `process_flow`, so the clone skips payload
+        processing and only rebuilds vertices and edges. The original graph is left untouched,
+        which makes it safe to keep a graph around as a template and clone it for every run.
+
+        Args:
+            user_id: The user ID for the clone. Defaults to the user ID of this graph.
+
+        Returns:
+            Graph: The cloned graph.
+        """
+        graph_data = getattr(self, "_graph_data", None)
+        if graph_data is None:
+            msg = "Only graphs created from flow data can be cloned"
+            raise ValueError(msg)
+        graph = type(self)(
+            flow_id=self.flow_id,
+            flow_name=self.flow_name,
+            description=self.description,
+            user_id=user_id if user_id is not None else self.user_id,
+            context=copy.deepcopy(dict(self._context)),
+        )
+        graph.raw_graph_data = self.raw_graph_data
+        graph.top_level_vertices = list(self.top_level_vertices)
+        if self._cycle_vertices is not None:
+            graph._cycle_vertices = set(self._cycle_vertices)
+        graph.run_manager.cycle_vertices = set(self.run_manager.cycle_vertices)
+        graph._graph_data = copy.deepcopy(graph_data)
+        graph._vertices = graph._graph_data["nodes"]
+        graph._edges = graph._graph_data["edges"]
+        graph.initialize()
+        # Clones share the schedule, so a cap on expensive builds holds across all of them.
+        graph._build_schedule = self._build_schedule
+        graph._build_schedule_loaded = self._build_schedule_loaded
+        return graph
+
     def __eq__(self, /, other: object) -> bool:
         if not isinstance(other, Graph):
             return False
@@ -1224,8 +1423,9 @@ class Graph:
         """Updates the edges of a vertex."""
         # Vertex has edges, so we need to update the edges
         for edge in vertex.edges:
-            if edge not in self.edges and edge.source_id in self.vertex_map and edge.target_id in self.vertex_map:
-                self.edges.append(edge)
+            if edge not in self._edge_index and edge.source_id in self.vertex_map and edge.target_id in self.vertex_map:
+                self._edge_list.append(edge)
+                self._edge_index.add(edge)
 
     def _build_graph(self) -> None:
         """Builds the graph from the vertices and edges."""
@@ -1345,7 +1545,7 @@ class Graph:
         self.reset_inactivated_vertices()
         self.reset_activated_vertices()
 
-        await chat_service.set_cache(str(self.flow_id or self._run_id), self)
+        await chat_service.set_graph(str(self.flow_id or self._run_id), self, vertex_id=vertex_id)
         self._record_snapshot(vertex_id)
         return vertex_build_result
 
@@ -1453,13 +1653,21 @@ class Graph:
                         should_build = True
 
             if should_build:
-                await vertex.build(
-                    user_id=user_id,
-                    inputs=inputs_dict,
-                    fallback_to_env_vars=fallback_to_env_vars,
-                    files=files,
-                    event_manager=event_manager,
+                build_slot = (
+                    self._build_schedule.build_slot(vertex_id)
+                    if self._build_schedule is not None
+                    else contextlib.nullcontext()
                 )
+                async with build_slot:
+                    start_time = time.perf_counter()
+                    await vertex.build(
+                        user_id=user_id,
+                        inputs=inputs_dict,
+                        fallback_to_env_vars=fallback_to_env_vars,
+                        files=files,
+                        event_manager=event_manager,
+                    )
+                    self._build_times[vertex_id] = time.perf_counter() - start_time
                 if set_cache is not None:
                     vertex_dict = {
                         "built": vertex.built,
@@ -1490,6 +1698,20 @@ class Graph:
             result_dict=result_dict, params=params, valid=valid, artifacts=artifacts, vertex=vertex
         )
 
+    @property
+    def edges(self) -> list[CycleEdge]:
+        """The edges of the graph.
+
+        Assigning a new list re-indexes the edges by vertex. Edges must not be added to the list in place,
+        as the index would not see them.
+        """
+        return self._edge_list
+
+    @edges.setter
+    def edges(self, edges: list[CycleEdge]) -> None:
+        self._edge_list = edges
+        self._edge_index = EdgeIndex(edges)
+
     def get_vertex_edges(
         self,
         vertex_id: str,
@@ -1500,17 +1722,26 @@ class Graph:
         """Returns a list of edges for a given vertex."""
         # The idea here is to return the edges that have the vertex_id as source or target
         # or both
-        return [
-            edge
-            for edge in self.edges
-            if (edge.source_id == vertex_id and is_source is not False)
-            or (edge.target_id == vertex_id and is_target is not False)
-        ]
+        if is_source is False and is_target is False:
+            return []
+        if is_target is False:
+            return self._edge_index.outgoing(vertex_id)
+        if is_source is False:
+            return self._edge_index.incoming(vertex_id)
+        return self._edge_index.vertex_edges(vertex_id)
+
+    def get_incoming_edges(self, vertex_id: str, target_param: str | None = None) -> list[CycleEdge]:
+        """Returns the edges that target a vertex, optionally only those connected to one of its inputs."""
+        return self._edge_index.incoming(vertex_id, target_param)
+
+    def get_edges_between(self, source_id: str, target_id: str) -> list[CycleEdge]:
+        """Returns the edges that go from one vertex to another."""
+        return self._edge_index.between(source_id, target_id)
 
     def get_vertices_with_target(self, vertex_id: str) -> list[Vertex]:
         """Returns the vertices connected to a vertex."""
         vertices: list[Vertex] = []
-        for edge in self.edges:
+        for edge in self._edge_index.incoming(vertex_id):
             if edge.target_id == vertex_id:
                 vertex = self.get_vertex(edge.source_id)
                 if vertex is None:
@@ -1524,35 +1755,72 @@ class Graph:
         fallback_to_env_vars: bool,
         start_component_id: str | None = None,
         event_manager: EventManager | None = None,
+    ) -> Graph:
+        """Processes the graph using the vertex scheduling strategy set in the settings."""
+        if get_settings_service().settings.vertex_scheduling == "streaming":
+            return await self.process_streaming(
+                fallback_to_env_vars=fallback_to_env_vars,
+                start_component_id=start_component_id,
+                event_manager=event_manager,
+            )
+        return await self.process_layered(
+            fallback_to_env_vars=fallback_to_env_vars,
+            start_component_id=start_component_id,
+            event_manager=event_manager,
+        )
+
+    def _create_build_task(
+        self,
+        vertex_id: str,
+        *,
+        fallback_to_env_vars: bool,
+        vertex_task_run_count: dict[str, int],
+        event_manager: EventManager | None = None,
+    ) -> asyncio.Task:
+        """Creates a task that builds a vertex, naming it after the vertex and its run count."""
+        chat_service = get_chat_service()
+        vertex = self.get_vertex(vertex_id)
+        task = asyncio.create_task(
+            self.build_vertex(
+                vertex_id=vertex_id,
+                user_id=self.user_id,
+                inputs_dict={},
+                fallback_to_env_vars=fallback_to_env_vars,
+                get_cache=chat_service.get_cache,
+                set_cache=chat_service.set_cache,
+                event_manager=event_manager,
+            ),
+            name=f"{vertex.display_name} Run {vertex_task_run_count.get(vertex_id, 0)}",
+        )
+        vertex_task_run_count[vertex_id] = vertex_task_run_count.get(vertex_id, 0) + 1
+        return task
+
+    async def process_layered(
+        self,
+        *,
+        fallback_to_env_vars: bool,
+        start_component_id: str | None = None,
+        event_manager: EventManager | None = None,
     ) -> Graph:
         """Processes the graph with vertices in each layer run in parallel."""
         first_layer = self.sort_vertices(start_component_id=start_component_id)
         vertex_task_run_count: dict[str, int] = {}
-        to_process = deque(first_layer)
         layer_index = 0
-        chat_service = get_chat_service()
         await self.initialize_run()
+        to_process = deque(self.sort_by_build_schedule(first_layer))
         lock = asyncio.Lock()
         while to_process:
             current_batch = list(to_process)  # Copy current deque items to a list
             to_process.clear()  # Clear the deque for new items
-            tasks = []
-            for vertex_id in current_batch:
-                vertex = self.get_vertex(vertex_id)
-                task = asyncio.create_task(
-                    self.build_vertex(
-                        vertex_id=vertex_id,
-                        user_id=self.user_id,
-                        inputs_dict={},
-                        fallback_to_env_vars=fallback_to_env_vars,
-                        get_cache=chat_service.get_cache,
-                        set_cache=chat_service.set_cache,
-                        event_manager=event_manager,
-                    ),
-                    name=f"{vertex.display_name} Run {vertex_task_run_count.get(vertex_id, 0)}",
+            tasks = [
+                self._create_build_task(
+                    vertex_id,
+                    fallback_to_env_vars=fallback_to_env_vars,
+                    vertex_task_run_count=vertex_task_run_count,
+                    event_manager=event_manager,
                 )
-                tasks.append(task)
-                vertex_task_run_count[vertex_id] = vertex_task_run_count.get(vertex_id, 0) + 1
+                for vertex_id in current_batch
+            ]
 
             logger.debug(f"Running layer {layer_index} with {len(tasks)} tasks, {current_batch}")
             try:
@@ -1562,9 +1830,83 @@ class Graph:
                 raise
             if not next_runnable_vertices:
                 break
-            to_process.extend(next_runnable_vertices)
+            to_process.extend(self.sort_by_build_schedule(next_runnable_vertices))
             layer_index += 1
 
+        await self.save_build_times()
+        logger.debug("Graph processing complete")
+        return self
+
+    async def process_streaming(
+        self,
+        *,
+        fallback_to_env_vars: bool,
+        start_component_id: str | None = None,
+        event_manager: EventManager | None = None,
+    ) -> Graph:
+        """Processes the graph starting each vertex as soon as its own predecessors are built.
+
+        Unlike `process_layered`, there is no barrier between layers: a slow vertex only delays
+        the vertices that depend on it, so the run takes as long as the graph's critical path.
+        """
+        first_layer = self.sort_vertices(start_component_id=start_component_id)
+        vertex_task_run_count: dict[str, int] = {}
+        await self.initialize_run()
+        lock = asyncio.Lock()
+        pending: set[asyncio.Task] = set()
+        task_vertex_ids: dict[asyncio.Task, str] = {}
+
+        def schedule(vertex_ids: Iterable[str]) -> None:
+            for vertex_id in self.sort_by_build_schedule(vertex_ids):
+                task = self._create_build_task(
+                    vertex_id,
+                    fallback_to_env_vars=fallback_to_env_vars,
+                    vertex_task_run_count=vertex_task_run_count,
+                    event_manager=event_manager,
+                )
+                task_vertex_ids[task] = vertex_id
+                pending.add(task)
+
+        # Mark the roots as being run like get_next_runnable_vertices does for the vertices it returns, or a root
+        # that is still building is scheduled again when a sibling root finishes first.
+        for vertex_id in first_layer:
+            self.run_manager.add_to_vertices_being_run(vertex_id)
+        schedule(first_layer)
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pending.discard(task)
+                    vertex_id = task_vertex_ids.pop(task)
+                    if (exc := task.exception()) is not None:
+                        logger.error(f"Task {task.get_name()} failed with exception: {exc}")
+                        raise exc
+                    result = task.result()
+                    if not isinstance(result, VertexBuildResult):
+                        msg = f"Invalid result from task {task.get_name()}: {result}"
+                        raise TypeError(msg)
+                    await log_vertex_build(
+                        flow_id=self.flow_id or "",
+                        vertex_id=result.vertex.id,
+                        valid=result.valid,
+                        params=result.params,
+                        data=result.result_dict,
+                        artifacts=result.artifacts,
+                    )
+                    logger.debug(f"Vertex {vertex_id}, result: {result.vertex.built_result}")
+                    # get_next_runnable_vertices marks the returned vertices as being run,
+                    # so a vertex is never scheduled twice while it is still building.
+                    next_runnable_vertices = await self.get_next_runnable_vertices(
+                        lock, vertex=result.vertex, cache=False
+                    )
+                    schedule(next_runnable_vertices)
+        except Exception:
+            for task in pending:
+                task.cancel()
+            logger.exception("Error executing tasks")
+            raise
+
+        await self.save_build_times()
         logger.debug("Graph processing complete")
         return self
 
@@ -1591,8 +1933,7 @@ class Graph:
                 else:
                     self.run_manager.add_to_vertices_being_run(next_v_id)
             if cache and self.flow_id is not None:
-                set_cache_coro = partial(get_chat_service().set_cache, key=self.flow_id)
-                await set_cache_coro(data=self, lock=lock)
+                await get_chat_service().set_graph(self.flow_id, self, vertex_id=v_id)
         return next_runnable_vertices
 
     async def _execute_tasks(self, tasks: list[asyncio.Task], lock: asyncio.Lock) -> list[str]:
@@ -1720,7 +2061,7 @@ class Graph:
     def get_vertex_neighbors(self, vertex: Vertex) -> dict[Vertex, int]:
         """Returns the neighbors of a vertex."""
         neighbors: dict[Vertex, int] = {}
-        for edge in self.edges:
+        for edge in self._edge_index.vertex_edges(vertex.id):
             if edge.source_id == vertex.id:
                 neighbor = self.get_vertex(edge.target_id)
                 if neighbor is None:
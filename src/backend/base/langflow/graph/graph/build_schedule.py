@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING
+
+from langflow.graph.graph.utils import get_critical_path_lengths
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from contextlib import AbstractAsyncContextManager
+
+
+class BuildSchedule:
+    """Schedules the builds of a run using the build times of earlier runs of the same flow.
+
+    Vertices that start the longest expected downstream chains are started first, and vertices whose
+    95th percentile build time reaches the expensive threshold share a limited number of build slots.
+
+    Args:
+        expected_build_times: The expected build time of each vertex, in seconds.
+        expensive_vertex_ids: The vertices that are known to be expensive to build.
+        max_concurrent_expensive_builds: How many expensive vertices may build at the same time. 0 means no limit.
+    """
+
+    def __init__(
+        self,
+        expected_build_times: dict[str, float] | None = None,
+        expensive_vertex_ids: Iterable[str] = (),
+        max_concurrent_expensive_builds: int = 0,
+    ) -> None:
+        self.expected_build_times = expected_build_times or {}
+        self.expensive_vertex_ids = set(expensive_vertex_ids)
+        self._expensive_build_semaphore = (
+            asyncio.Semaphore(max_concurrent_expensive_builds)
+            if max_concurrent_expensive_builds > 0 and self.expensive_vertex_ids
+            else None
+        )
+
+    def sort(self, vertex_ids: Iterable[str], successor_map: dict[str, list[str]]) -> list[str]:
+        """Sorts the vertices by the expected length of their longest downstream chain, longest first.
+
+        Vertices with the same length keep their order.
+        """
+        vertex_ids = list(vertex_ids)
+        if not self.expected_build_times:
+            return vertex_ids
+        lengths = get_critical_path_lengths(vertex_ids, successor_map, self.expected_build_times)
+        return sorted(vertex_ids, key=lambda vertex_id: lengths.get(vertex_id, 0.0), reverse=True)
+
+    def build_slot(self, vertex_id: str) -> AbstractAsyncContextManager:
+        """Returns the context to hold while building the vertex, which waits for a free slot if it is expensive."""
+        if self._expensive_build_semaphore is not None and vertex_id in self.expensive_vertex_ids:
+            return self._expensive_build_semaphore
+        return contextlib.nullcontext()
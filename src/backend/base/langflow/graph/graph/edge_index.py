@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from langflow.graph.edge.base import CycleEdge
+
+
+class EdgeIndex:
+    """Per-vertex adjacency lists of a graph's edges.
+
+    The lists keep the order in which the edges were added, so looking up the edges of a vertex returns
+    them in the same order as filtering the graph's edge list would, without scanning every edge.
+    """
+
+    def __init__(self, edges: Iterable[CycleEdge] = ()) -> None:
+        self._edges: set[CycleEdge] = set()
+        self._vertex_edges: dict[str, list[CycleEdge]] = defaultdict(list)
+        self._outgoing: dict[str, list[CycleEdge]] = defaultdict(list)
+        self._incoming: dict[str, list[CycleEdge]] = defaultdict(list)
+        self._incoming_by_param: dict[tuple[str, str | None], list[CycleEdge]] = defaultdict(list)
+        self._between: dict[tuple[str, str], list[CycleEdge]] = defaultdict(list)
+        for edge in edges:
+            self.add(edge)
+
+    def __contains__(self, edge: object) -> bool:
+        return edge in self._edges
+
+    def add(self, edge: CycleEdge) -> None:
+        self._edges.add(edge)
+        self._vertex_edges[edge.source_id].append(edge)
+        if edge.target_id != edge.source_id:
+            self._vertex_edges[edge.target_id].append(edge)
+        self._outgoing[edge.source_id].append(edge)
+        self._incoming[edge.target_id].append(edge)
+        self._incoming_by_param[edge.target_id, edge.target_param].append(edge)
+        self._between[edge.source_id, edge.target_id].append(edge)
+
+    def vertex_edges(self, vertex_id: str) -> list[CycleEdge]:
+        """Returns the edges that have the vertex as source or target."""
+        return list(self._vertex_edges.get(vertex_id, ()))
+
+    def outgoing(self, vertex_id: str) -> list[CycleEdge]:
+        """Returns the edges that have the vertex as source."""
+        return list(self._outgoing.get(vertex_id, ()))
+
+    def incoming(self, vertex_id: str, target_param: str | None = None) -> list[CycleEdge]:
+        """Returns the edges that have the vertex as target, optionally only those connected to `target_param`."""
+        if target_param is None:
+            return list(self._incoming.get(vertex_id, ()))
+        return list(self._incoming_by_param.get((vertex_id, target_param), ()))
+
+    def between(self, source_id: str, target_id: str) -> list[CycleEdge]:
+        """Returns the edges from `source_id` to `target_id`."""
+        return list(self._between.get((source_id, target_id), ()))
@@ -1022,3 +1022,38 @@ def filter_vertices_from_vertex(
                 queue.append(successor)
 
     return filtered_vertices
+
+
+def get_critical_path_lengths(
+    vertex_ids: list[str],
+    successor_map: dict[str, list[str]],
+    build_times: dict[str, float],
+) -> dict[str, float]:
+    """Computes the expected time from the start of each vertex's build to the end of its longest downstream chain.
+
+    Args:
+        vertex_ids: The IDs of the vertices to compute the lengths for.
+        successor_map: The successor IDs of each vertex.
+        build_times: The expected build time of each vertex. Vertices without one count as 0.
+
+    Returns:
+        The length of the longest chain starting at each vertex, in the unit of `build_times`. Edges that close
+        a cycle are ignored.
+    """
+    lengths: dict[str, float] = {}
+    in_progress: set[str] = set()
+
+    def visit(vertex_id: str) -> float:
+        if vertex_id in lengths:
+            return lengths[vertex_id]
+        if vertex_id in in_progress:
+            return 0.0
+        in_progress.add(vertex_id)
+        downstream = max((visit(successor_id) for successor_id in successor_map.get(vertex_id, [])), default=0.0)
+        in_progress.discard(vertex_id)
+        lengths[vertex_id] = build_times.get(vertex_id, 0.0) + downstream
+        return lengths[vertex_id]
+
+    for vertex_id in vertex_ids:
+        visit(vertex_id)
+    return lengths
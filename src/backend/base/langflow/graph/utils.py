@@ -12,15 +12,13 @@ from langflow.interface.utils import extract_input_variables_from_prompt
 from langflow.schema.data import Data
 from langflow.schema.message import Message
 from langflow.serialization import serialize
-from langflow.services.database.models.transactions.crud import log_transaction as crud_log_transaction
 from langflow.services.database.models.transactions.model import TransactionBase
-from langflow.services.database.models.vertex_builds.crud import log_vertex_build as crud_log_vertex_build
 from langflow.services.database.models.vertex_builds.model import VertexBuildBase
-from langflow.services.database.utils import session_getter
-from langflow.services.deps import get_db_service, get_settings_service
+from langflow.services.deps import get_log_writer_service, get_settings_service, session_scope
 
 if TYPE_CHECKING:
     from langflow.api.v1.schemas import ResultDataResponse
+    from langflow.graph.graph.build_schedule import BuildSchedule
     from langflow.graph.vertex.base import Vertex
 
 
@@ -134,11 +132,7 @@ async def log_transaction(
             error=error,
             flow_id=flow_id if isinstance(flow_id, UUID) else UUID(flow_id),
         )
-        async with session_getter(get_db_service()) as session:
-            with session.no_autoflush:
-                inserted = await crud_log_transaction(session, transaction)
-                if inserted:
-                    logger.debug(f"Logged transaction: {inserted.id}")
+        await get_log_writer_service().log_transaction(transaction)
     except Exception:  # noqa: BLE001
         logger.error("Error logging transaction")
 
@@ -166,13 +160,54 @@ async def log_vertex_build(
             # Serialize artifacts using our custom serializer
             artifacts=serialize(artifacts) if artifacts else None,
         )
-        async with session_getter(get_db_service()) as session:
-            inserted = await crud_log_vertex_build(session, vertex_build)
-            logger.debug(f"Logged vertex build: {inserted.build_id}")
+        await get_log_writer_service().log_vertex_build(vertex_build)
     except Exception:  # noqa: BLE001
         logger.exception("Error logging vertex build")
 
 
+async def log_build_times(*, flow_id: str, build_times: dict[str, float]) -> None:
+    try:
+        if not build_times or not get_settings_service().settings.use_vertex_build_stats:
+            return
+        await get_log_writer_service().log_build_times(UUID(flow_id), build_times)
+    except Exception:  # noqa: BLE001
+        logger.opt(exception=True).debug("Error logging build times")
+
+
+async def load_build_schedule(flow_id: str) -> BuildSchedule | None:
+    """Create the build schedule of a flow from the build time statistics of its earlier runs.
+
+    Returns None if the statistics are disabled or the flow has none yet.
+    """
+    from langflow.graph.graph.build_schedule import BuildSchedule
+    from langflow.services.database.models.vertex_builds.crud import get_vertex_build_stats
+
+    settings = get_settings_service().settings
+    if not settings.use_vertex_build_stats:
+        return None
+    try:
+        flow_uuid = UUID(flow_id)
+    except ValueError:
+        return None
+    try:
+        async with session_scope() as session:
+            stats = await get_vertex_build_stats(session, flow_uuid)
+    except Exception:  # noqa: BLE001
+        logger.opt(exception=True).debug("Error loading the build time statistics")
+        return None
+    if not stats:
+        return None
+    return BuildSchedule(
+        expected_build_times={vertex_id: vertex_stats.ewma for vertex_id, vertex_stats in stats.items()},
+        expensive_vertex_ids=[
+            vertex_id
+            for vertex_id, vertex_stats in stats.items()
+            if vertex_stats.p95 >= settings.expensive_vertex_build_time
+        ],
+        max_concurrent_expensive_builds=settings.max_concurrent_expensive_builds,
+    )
+
+
 def rewrite_file_path(file_path: str):
     file_path = file_path.replace("\\", "/")
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import inspect
+import pickle
 import traceback
 import types
 from collections.abc import AsyncIterator, Callable, Iterator, Mapping
@@ -20,7 +22,8 @@ from langflow.schema.artifact import ArtifactType
 from langflow.schema.data import Data
 from langflow.schema.message import Message
 from langflow.schema.schema import INPUT_FIELD_NAME, OutputValue, build_output_logs
-from langflow.services.deps import get_storage_service
+from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.deps import get_storage_service, get_vertex_cache_service
 from langflow.utils.schemas import ChatOutputResponse
 from langflow.utils.util import sync_to_async
 
@@ -35,6 +38,25 @@ if TYPE_CHECKING:
     from langflow.services.tracing.schema import Log
 
 
+def _stable_cache_value(value: Any) -> Any:
+    """Returns the part of a param value that results depend on, without the ids and timestamps of messages.
+
+    Upstream messages get a new id and timestamp on every run, so hashing them whole would never hit the cache.
+    """
+    if isinstance(value, Message):
+        if not isinstance(value.text, str):
+            # A stream cannot be hashed, which leaves the vertex uncached.
+            return value
+        return ("Message", value.text, value.sender, value.sender_name, [str(file) for file in value.files or []])
+    if isinstance(value, Data):
+        return ("Data", _stable_cache_value(value.data))
+    if isinstance(value, dict):
+        return sorted(((str(key), _stable_cache_value(item)) for key, item in value.items()), key=lambda item: item[0])
+    if isinstance(value, list | tuple):
+        return [_stable_cache_value(item) for item in value]
+    return value
+
+
 class VertexStates(str, Enum):
     """Vertex are related to it being active, inactive, or in an error state."""
 
@@ -185,11 +207,11 @@ class Vertex:
 
     @property
     def outgoing_edges(self) -> list[CycleEdge]:
-        return [edge for edge in self.edges if edge.source_id == self.id]
+        return self.graph.get_vertex_edges(self.id, is_target=False)
 
     @property
     def incoming_edges(self) -> list[CycleEdge]:
-        return [edge for edge in self.edges if edge.target_id == self.id]
+        return self.graph.get_vertex_edges(self.id, is_source=False)
 
     @property
     def edges_source_names(self) -> set[str | None]:
@@ -220,6 +242,51 @@ class Vertex:
         self.built_object = state.get("built_object") or UnbuiltObject()
         self.built_result = state.get("built_result") or UnbuiltResult()
 
+    # Attributes that change when the vertex is built, see `get_build_state`
+    BUILD_STATE_ATTRIBUTES = (
+        "built",
+        "built_object",
+        "built_result",
+        "results",
+        "result",
+        "artifacts",
+        "artifacts_raw",
+        "artifacts_type",
+        "outputs_logs",
+        "logs",
+        "build_times",
+        "state",
+    )
+
+    # Attributes set by `_build_results`, which are stored in the vertex result cache
+    CACHED_RESULT_ATTRIBUTES = (
+        "built_object",
+        "results",
+        "artifacts",
+        "artifacts_raw",
+        "artifacts_type",
+        "outputs_logs",
+        "logs",
+    )
+
+    def get_build_state(self) -> dict[str, Any]:
+        """Returns the part of the vertex that changes when it is built.
+
+        The build state can be applied with `set_build_state` to the same vertex of a graph
+        created from the same flow data, which is much smaller than serializing the whole graph.
+        """
+        state = {name: getattr(self, name) for name in self.BUILD_STATE_ATTRIBUTES}
+        state["built_object"] = None if isinstance(self.built_object, UnbuiltObject) else self.built_object
+        state["built_result"] = None if isinstance(self.built_result, UnbuiltResult) else self.built_result
+        return state
+
+    def set_build_state(self, state: dict[str, Any]) -> None:
+        for name in self.BUILD_STATE_ATTRIBUTES:
+            if name in state:
+                setattr(self, name, state[name])
+        self.built_object = state.get("built_object") or UnbuiltObject()
+        self.built_result = state.get("built_result") or UnbuiltResult()
+
     def set_top_level(self, top_level_vertices: list[str]) -> None:
         self.parent_is_top_level = self.parent_node_id in top_level_vertices
 
@@ -391,6 +458,14 @@ class Vertex:
                 self.custom_component.set_event_manager(event_manager)
             custom_params = initialize.loading.get_params(self.params)
 
+        cache_key = None
+        if getattr(custom_component, "cache_results", False):
+            # Components may stat files for their key, so it is computed off the event loop.
+            cache_key = await asyncio.to_thread(self._get_result_cache_key, custom_component, user_id)
+        if cache_key is not None and await self._load_cached_result(cache_key, custom_component):
+            self.built = True
+            return
+
         await self._build_results(
             custom_component=custom_component,
             custom_params=custom_params,
@@ -399,9 +474,51 @@ class Vertex:
         )
 
         self._validate_built_object()
+        if cache_key is not None:
+            await get_vertex_cache_service().set(
+                cache_key, {name: getattr(self, name) for name in self.CACHED_RESULT_ATTRIBUTES}
+            )
 
         self.built = True
 
+    def _get_result_cache_key(self, custom_component: Any, user_id=None) -> str | None:
+        """Returns the key of the vertex result cache for this build, or None if the results cannot be cached.
+
+        The key is a hash of the component type, the user, the outputs that are used, the resolved params, which
+        hold the code of the component and the results of the upstream vertices, and whatever else the component
+        reports from `get_result_cache_dependencies`, so any change to them leads to a new key. Messages and data
+        are hashed by their content, so upstream results that are rebuilt with the same content keep the key.
+        """
+        used_outputs = sorted(name for name in self.edges_source_names if name)
+        try:
+            payload = pickle.dumps(
+                (
+                    self.vertex_type,
+                    str(user_id or self.graph.user_id),
+                    used_outputs,
+                    _stable_cache_value(self.params),
+                    custom_component.get_result_cache_dependencies(self.params),
+                ),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug(f"The params of {self.display_name} cannot be hashed, not caching it")
+            return None
+        return hashlib.sha256(payload).hexdigest()
+
+    async def _load_cached_result(self, cache_key: str, custom_component: Any) -> bool:
+        cached_result = await get_vertex_cache_service().get(cache_key)
+        if cached_result is CACHE_MISS:
+            return False
+        for name in self.CACHED_RESULT_ATTRIBUTES:
+            setattr(self, name, cached_result[name])
+        self.custom_component = custom_component
+        # A reused component still holds the output values of its last build, which must not hide the cached results.
+        if hasattr(custom_component, "_reset_all_output_values"):
+            custom_component._reset_all_output_values()
+        logger.debug(f"Using the cached result of {self.display_name}")
+        return True
+
     def extract_messages_from_artifacts(self, artifacts: dict[str, Any]) -> list[dict]:
         """Extracts messages from the artifacts.
 
@@ -763,7 +880,7 @@ class Vertex:
             return self.built_object
 
         # Get the requester edge
-        requester_edge = next((edge for edge in self.edges if edge.target_id == requester.id), None)
+        requester_edge = next(iter(self.graph.get_edges_between(self.id, requester.id)), None)
         # Return the result of the requester edge
         return (
             None
@@ -84,9 +84,7 @@ class ComponentVertex(Vertex):
         Returns:
             The edge with the target id.
         """
-        for edge in self.edges:
-            if edge.target_id == target_id:
-                yield edge
+        yield from self.graph.get_edges_between(self.id, target_id)
 
     async def _get_result(self, requester: Vertex, target_handle_name: str | None = None) -> Any:
         """Retrieves the result of the built component.
@@ -1,5 +1,9 @@
+import re
 from collections import defaultdict
+from functools import lru_cache
+from string import Formatter
 
+import pandas as pd
 from langchain_core.documents import Document
 
 from langflow.schema import Data
@@ -139,3 +143,99 @@ def messages_to_text(template: str, messages: Message | list[Message]) -> str:
 
     formated_messages = [template.format(data=message.model_dump(), **message.model_dump()) for message in messages_]
     return "\n".join(formated_messages)
+
+
+# The column a replacement field refers to, before any attribute access or indexing, like `col` in `{col.attr[0]}`.
+_FIELD_NAME_PATTERN = re.compile(r"[^.\[]*")
+
+
+class RowTemplate:
+    """A `str.format` template compiled to format all the rows of a DataFrame at once.
+
+    Each row gets the text `template.format(**row)` would give it, but without building a dict for every row: the
+    replacement fields are rewritten as positional fields, and the rows are formatted from the values of the
+    columns the template refers to, which are read once per column. Templates with positional or nested
+    replacement fields are formatted row by row from dicts instead.
+    """
+
+    def __init__(self, template: str):
+        self.template = template
+        self.fields: list[str] = []
+        parts: list[str] = []
+        compiled: str | None = None
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            parts.append(literal.replace("{", "{{").replace("}", "}}"))
+            if field_name is None:
+                continue
+            name = _FIELD_NAME_PATTERN.match(field_name).group()
+            if not name or name.isdigit() or "{" in format_spec:
+                break
+            if name not in self.fields:
+                self.fields.append(name)
+            field = f"{self.fields.index(name)}{field_name[len(name) :]}"
+            if conversion:
+                field += f"!{conversion}"
+            if format_spec:
+                field += f":{format_spec}"
+            parts.append(f"{{{field}}}")
+        else:
+            compiled = "".join(parts)
+        self._compiled = compiled
+
+    def format(self, dataframe: pd.DataFrame) -> list[str]:
+        """Formats every row of the DataFrame.
+
+        Raises:
+            KeyError: If the template refers to a column the DataFrame does not have.
+        """
+        if dataframe.empty:
+            return []
+        if self._compiled is None:
+            return [self.template.format(**row) for row in dataframe.to_dict(orient="records")]
+        for name in self.fields:
+            if name not in dataframe.columns:
+                raise KeyError(name)
+        if not self.fields:
+            return [self._compiled.format()] * len(dataframe)
+        columns = [dataframe[name].tolist() for name in self.fields]
+        format_row = self._compiled.format
+        return [format_row(*values) for values in zip(*columns, strict=True)]
+
+
+@lru_cache(maxsize=128)
+def compile_row_template(template: str) -> RowTemplate:
+    """Compiles the template, reusing the compiled template for templates that were compiled before."""
+    return RowTemplate(template)
+
+
+def dataframe_to_text_list(template: str, dataframe: pd.DataFrame) -> list[str]:
+    """Formats each row of a DataFrame using a template string.
+
+    Gives the same text as formatting each row with `template.format(**row)`, with the columns of the DataFrame
+    as the template keys, but compiles the template once and formats the rows from whole columns.
+
+    Args:
+        template: Format string with placeholders matching the column names (e.g., "{name} is {age}").
+        dataframe: The DataFrame whose rows are formatted.
+
+    Returns:
+        List[str]: The formatted text of each row, in the order of the rows.
+
+    Raises:
+        KeyError: If the template refers to a column the DataFrame does not have.
+    """
+    return compile_row_template(template).format(dataframe)
+
+
+def dataframe_to_text(template: str, dataframe: pd.DataFrame, sep: str = "\n") -> str:
+    r"""Converts the rows of a DataFrame into a formatted text string based on a given template.
+
+    Args:
+        template (str): The template string used to format each row.
+        dataframe (pd.DataFrame): The DataFrame whose rows are formatted.
+        sep (str, optional): The separator to use between formatted rows. Defaults to "\n".
+
+    Returns:
+        str: A string containing the formatted rows separated by the specified separator.
+    """
+    return sep.join(dataframe_to_text_list(template, dataframe))
@@ -4,13 +4,13 @@ from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID
 
 from fastapi import HTTPException
-from loguru import logger
 from pydantic.v1 import BaseModel, Field, create_model
 from sqlmodel import select
 
 from langflow.schema.schema import INPUT_FIELD_NAME
 from langflow.services.database.models.flow import Flow
 from langflow.services.database.models.flow.model import FlowRead
+from langflow.services.database.models.flow.utils import get_input_schema_from_flow_data
 from langflow.services.deps import get_settings_service, session_scope
 
 if TYPE_CHECKING:
@@ -121,14 +121,14 @@ async def run_flow(
         )
     ]
 
-    fallback_to_env_vars = get_settings_service().settings.fallback_to_env_var
+    settings = get_settings_service().settings
 
     return await graph.arun(
         inputs_list,
         outputs=outputs,
         inputs_components=inputs_components,
         types=types,
-        fallback_to_env_vars=fallback_to_env_vars,
+        fallback_to_env_vars=settings.fallback_to_env_var,
     )
 
 
@@ -319,42 +319,6 @@ async def generate_unique_flow_name(flow_name, user_id, session):
 
 def json_schema_from_flow(flow: Flow) -> dict:
     """Generate JSON schema from flow input nodes."""
-    from langflow.graph.graph.base import Graph
-
-    # Get the flow's data which contains the nodes and their configurations
-    flow_data = flow.data or {}
-
-    graph = Graph.from_payload(flow_data)
-    input_nodes = [vertex for vertex in graph.vertices if vertex.is_input]
-
-    properties = {}
-    required = []
-    for node in input_nodes:
-        node_data = node.data["node"]
-        template = node_data["template"]
-
-        for field_name, field_data in template.items():
-            if field_data != "Component" and field_data.get("show", False) and not field_data.get("advanced", False):
-                field_type = field_data.get("type", "string")
-                properties[field_name] = {
-                    "type": field_type,
-                    "description": field_data.get("info", f"Input for {field_name}"),
-                }
-                # Update field_type in properties after determining the JSON Schema type
-                if field_type == "str":
-                    field_type = "string"
-                elif field_type == "int":
-                    field_type = "integer"
-                elif field_type == "float":
-                    field_type = "number"
-                elif field_type == "bool":
-                    field_type = "boolean"
-                else:
-                    logger.warning(f"Unknown field type: {field_type} defaulting to string")
-                    field_type = "string"
-                properties[field_name]["type"] = field_type
-
-                if field_data.get("required", False):
-                    required.append(field_name)
-
-    return {"type": "object", "properties": properties, "required": required}
+    if flow.input_schema is not None:
+        return flow.input_schema
+    return get_input_schema_from_flow_data(flow.data)
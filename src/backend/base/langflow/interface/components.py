@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -7,6 +8,7 @@ from typing import TYPE_CHECKING, Any
 from loguru import logger
 
 from langflow.custom.utils import abuild_custom_components
+from langflow.utils.compression import EncodedPayload, encode_payload
 
 if TYPE_CHECKING:
     from langflow.services.settings.service import SettingsService
@@ -17,6 +19,27 @@ class ComponentCache:
     def __init__(self):
         self.all_types_dict: dict[str, Any] | None = None
         self.fully_loaded_components: dict[str, bool] = {}
+        self._encoded_all_types: EncodedPayload | None = None
+        self._encoded_source: dict[str, Any] | None = None
+        self._encode_lock: asyncio.Lock | None = None
+
+    async def aget_encoded_all_types(self) -> EncodedPayload:
+        """Return `all_types_dict` encoded for the /all endpoint.
+
+        The payload is encoded and compressed in a worker thread the first time it is requested after
+        `all_types_dict` was set or invalidated, and reused by every request until then.
+        """
+        if self._encode_lock is None:
+            self._encode_lock = asyncio.Lock()
+        async with self._encode_lock:
+            if self._encoded_all_types is None or self._encoded_source is not self.all_types_dict:
+                self._encoded_source = self.all_types_dict
+                self._encoded_all_types = await asyncio.to_thread(encode_payload, self.all_types_dict)
+            return self._encoded_all_types
+
+    def invalidate_encoded_all_types(self) -> None:
+        """Drop the encoded payload after `all_types_dict` was modified in place."""
+        self._encoded_all_types = None
 
 
 # Singleton instance
@@ -204,6 +227,7 @@ async def ensure_component_loaded(component_type: str, component_name: str, sett
 
             # Mark as fully loaded
             component_cache.fully_loaded_components[component_key] = True
+            component_cache.invalidate_encoded_all_types()
             logger.debug(f"Component {component_type}:{component_name} fully loaded")
         else:
             logger.warning(f"Failed to fully load component {component_type}:{component_name}")
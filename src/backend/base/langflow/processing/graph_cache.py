@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING, Any
+
+from cachetools import LRUCache
+from loguru import logger
+
+from langflow.graph.graph.base import Graph
+from langflow.processing.process import process_tweaks
+from langflow.services.deps import get_settings_service
+from langflow.services.session.utils import compute_dict_hash
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from langflow.schema.graph import Tweaks
+
+_graph_templates: LRUCache[tuple[str, str, str], Graph] | None = None
+
+
+def _get_graph_templates() -> LRUCache[tuple[str, str, str], Graph] | None:
+    global _graph_templates  # noqa: PLW0603
+    maxsize = get_settings_service().settings.graph_template_cache_size
+    if maxsize <= 0:
+        return None
+    if _graph_templates is None or _graph_templates.maxsize != maxsize:
+        _graph_templates = LRUCache(maxsize=maxsize)
+    return _graph_templates
+
+
+def clear_graph_templates() -> None:
+    """Removes every cached graph template."""
+    if _graph_templates is not None:
+        _graph_templates.clear()
+
+
+def build_graph_template_key(
+    flow_id: str, updated_at: datetime, tweaks: Tweaks | dict[str, Any] | None, *, stream: bool
+) -> tuple[str, str, str]:
+    tweaks_dict = tweaks.model_dump() if tweaks is not None and not isinstance(tweaks, dict) else dict(tweaks or {})
+    tweaks_dict.setdefault("stream", stream)
+    return flow_id, updated_at.isoformat(), compute_dict_hash(tweaks_dict)
+
+
+def get_graph_for_run(
+    flow_data: dict,
+    *,
+    flow_id: str,
+    flow_name: str | None,
+    updated_at: datetime | None,
+    tweaks: Tweaks | dict[str, Any] | None,
+    user_id: str | None,
+    stream: bool = False,
+) -> Graph:
+    """Returns a graph ready to run for the given flow version and tweaks.
+
+    The first request for a `(flow_id, updated_at, tweaks)` combination builds the graph from the flow
+    data and keeps it as a template. Later requests get a clone of the template, which skips parsing
+    the payload and applying the tweaks again. Saving the flow changes `updated_at`, so edited flows
+    never reuse a stale template.
+
+    Args:
+        flow_data: The flow data containing the nodes and edges.
+        flow_id: The ID of the flow.
+        flow_name: The flow name.
+        updated_at: When the flow was last updated. If None, the graph is not cached.
+        tweaks: The tweaks to apply to the flow data.
+        user_id: The ID of the user running the flow.
+        stream: Whether the components should stream their results.
+
+    Returns:
+        Graph: A graph with fresh vertex state.
+    """
+    graph_templates = _get_graph_templates() if updated_at is not None else None
+    if graph_templates is None:
+        graph_data = process_tweaks(copy.deepcopy(flow_data), tweaks or {}, stream=stream)
+        return Graph.from_payload(graph_data, flow_id=flow_id, user_id=user_id, flow_name=flow_name)
+
+    key = build_graph_template_key(flow_id, updated_at, tweaks, stream=stream)
+    template = graph_templates.get(key)
+    if template is None:
+        logger.debug(f"Building graph template for flow {flow_id}")
+        graph_data = process_tweaks(copy.deepcopy(flow_data), tweaks or {}, stream=stream)
+        template = Graph.from_payload(graph_data, flow_id=flow_id, user_id=user_id, flow_name=flow_name)
+        graph_templates[key] = template
+    return template.clone(user_id=user_id)
@@ -32,8 +32,13 @@ async def run_graph_internal(
     inputs: list[InputValueRequest] | None = None,
     outputs: list[str] | None = None,
     event_manager: EventManager | None = None,
+    max_concurrency: int | None = None,
 ) -> tuple[list[RunOutputs], str]:
-    """Run the graph and generate the result."""
+    """Run the graph and generate the result.
+
+    When `max_concurrency` is set, each input runs on its own clone of the graph, up to `max_concurrency` at a time,
+    or one at a time for streamed runs. Otherwise the inputs run one after the other on the graph.
+    """
     inputs = inputs or []
     effective_session_id = session_id or flow_id
     components = []
@@ -47,7 +52,10 @@ async def run_graph_internal(
         inputs_list.append({INPUT_FIELD_NAME: input_value_request.input_value})
         types.append(input_value_request.type)
 
-    fallback_to_env_vars = get_settings_service().settings.fallback_to_env_var
+    if stream and max_concurrency is not None:
+        # Streamed runs send their events to a single client, so their inputs run one at a time.
+        max_concurrency = 1
+    settings = get_settings_service().settings
     graph.session_id = effective_session_id
     run_outputs = await graph.arun(
         inputs=inputs_list,
@@ -56,8 +64,9 @@ async def run_graph_internal(
         outputs=outputs or [],
         stream=stream,
         session_id=effective_session_id or "",
-        fallback_to_env_vars=fallback_to_env_vars,
+        fallback_to_env_vars=settings.fallback_to_env_var,
         event_manager=event_manager,
+        max_concurrency=max_concurrency,
     )
     return run_outputs, effective_session_id
 
@@ -1,4 +1,5 @@
-from typing import cast
+from collections.abc import Iterator, Sequence
+from typing import cast, overload
 
 import pandas as pd
 from langchain_core.documents import Document
@@ -91,6 +92,14 @@ class DataFrame(pandas_DataFrame):
         # suggested change: [Data(**row) for row in list_of_dicts]
         return [Data(data=row) for row in list_of_dicts]
 
+    def to_data_view(self) -> "DataView":
+        """Returns a read-only view of the rows as Data-like objects.
+
+        Unlike `to_data_list`, it does not create a `Data` model for every row, so it is much cheaper for large
+        DataFrames when the rows are only read.
+        """
+        return DataView(self, text_key=self._text_key, default_value=self._default_value)
+
     def add_row(self, data: dict | Data) -> "DataFrame":
         """Adds a single row to the dataset.
 
@@ -178,3 +187,96 @@ class DataFrame(pandas_DataFrame):
         if not isinstance(other, DataFrame | pd.DataFrame):  # Non-DataFrame case
             return False
         return super().__eq__(other)
+
+
+class DataRow:
+    """A row of a DataFrame with the read interface of `Data`, without the cost of validating a `Data` model.
+
+    Use `to_data` to get a `Data` object that can be modified or passed to code that expects one.
+    """
+
+    __slots__ = ("data", "default_value", "text_key")
+
+    def __init__(self, data: dict, text_key: str = "text", default_value: str | None = ""):
+        self.data = data
+        self.text_key = text_key
+        self.default_value = default_value
+
+    def get_text(self):
+        """Returns the text value of the row, or the default value if the row has no text."""
+        return self.data.get(self.text_key, self.default_value)
+
+    def to_data(self) -> Data:
+        return Data(data=dict(self.data), text_key=self.text_key, default_value=self.default_value)
+
+    def to_lc_document(self) -> Document:
+        return self.to_data().to_lc_document()
+
+    def __getattr__(self, key):
+        """Allows attribute-like access to the values of the row."""
+        # An unset slot or a special method looked up by copy and pickle must not be read from `data`, which may not
+        # be set yet either.
+        if key.startswith("__") or key in DataRow.__slots__:
+            raise AttributeError(key)
+        try:
+            return self.data[key]
+        except KeyError as e:
+            msg = f"'{type(self).__name__}' object has no attribute '{key}'"
+            raise AttributeError(msg) from e
+
+    def __contains__(self, key) -> bool:
+        return key in self.data
+
+    def __eq__(self, other):
+        return isinstance(other, DataRow | Data) and self.data == other.data
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(data={self.data!r})"
+
+
+class DataView(Sequence[DataRow]):
+    """A lazy, read-only sequence of the rows of a DataFrame as `DataRow` objects.
+
+    The values of each column are read once, when the view is created; a row is only assembled when it is accessed.
+    The view does not follow later changes to the DataFrame.
+    """
+
+    def __init__(self, dataframe: pd.DataFrame, text_key: str = "text", default_value: str | None = ""):
+        self._keys = list(dataframe.columns)
+        self._columns = [dataframe.iloc[:, position].tolist() for position in range(len(self._keys))]
+        self._length = len(dataframe)
+        self.text_key = text_key
+        self.default_value = default_value
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> DataRow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[DataRow]: ...
+
+    def __getitem__(self, index: int | slice) -> DataRow | list[DataRow]:
+        if isinstance(index, slice):
+            return [self._row(position) for position in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            msg = "DataView index out of range"
+            raise IndexError(msg)
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[DataRow]:
+        if not self._columns:
+            for _ in range(self._length):
+                yield DataRow({}, self.text_key, self.default_value)
+            return
+        for values in zip(*self._columns, strict=True):
+            yield DataRow(dict(zip(self._keys, values, strict=True)), self.text_key, self.default_value)
+
+    def _row(self, position: int) -> DataRow:
+        data = {key: column[position] for key, column in zip(self._keys, self._columns, strict=True)}
+        return DataRow(data, self.text_key, self.default_value)
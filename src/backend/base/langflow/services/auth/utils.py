@@ -3,6 +3,7 @@ import random
 import warnings
 from collections.abc import Coroutine
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import TYPE_CHECKING, Annotated
 from uuid import UUID
 
@@ -379,12 +380,18 @@ def ensure_valid_key(s: str) -> bytes:
     return key
 
 
-def get_fernet(settings_service: SettingsService):
-    secret_key: str = settings_service.auth_settings.SECRET_KEY.get_secret_value()
+@lru_cache(maxsize=4)
+def _get_fernet_for_key(secret_key: str) -> Fernet:
     valid_key = ensure_valid_key(secret_key)
     return Fernet(valid_key)
 
 
+def get_fernet(settings_service: SettingsService):
+    # Deriving the key is not free, so the Fernet instance is reused for as long as the secret key is the same.
+    secret_key: str = settings_service.auth_settings.SECRET_KEY.get_secret_value()
+    return _get_fernet_for_key(secret_key)
+
+
 def encrypt_api_key(api_key: str, settings_service: SettingsService):
     fernet = get_fernet(settings_service)
     # Two-way encryption
@@ -1,7 +1,7 @@
 import abc
 import asyncio
 import threading
-from typing import Generic, TypeVar
+from typing import Generic, NamedTuple, TypeVar
 
 from langflow.services.base import Service
 
@@ -9,6 +9,15 @@ LockType = TypeVar("LockType", bound=threading.Lock)
 AsyncLockType = TypeVar("AsyncLockType", bound=asyncio.Lock)
 
 
+class CacheStats(NamedTuple):
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+
 class CacheService(Service, Generic[LockType]):
     """Abstract base class for a cache."""
 
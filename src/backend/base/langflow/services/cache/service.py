@@ -13,6 +13,7 @@ from langflow.services.cache.base import (
     AsyncBaseCacheService,
     AsyncLockType,
     CacheService,
+    CacheStats,
     ExternalAsyncBaseCacheService,
     LockType,
 )
@@ -54,6 +55,10 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
         self._lock = threading.RLock()
         self.max_size = max_size
         self.expiration_time = expiration_time
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
 
     def get(self, key, lock: Union[threading.Lock, None] = None):  # noqa: UP007
         """Retrieve an item from the cache.
@@ -66,7 +71,12 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
             The value associated with the key, or CACHE_MISS if the key is not found or the item has expired.
         """
         with lock or self._lock:
-            return self._get_without_lock(key)
+            value = self._get_without_lock(key)
+            if value is CACHE_MISS:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
 
     def _get_without_lock(self, key):
         """Retrieve an item from the cache without acquiring the lock."""
@@ -76,6 +86,7 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
                 self._cache.move_to_end(key)
                 # Check if the value is pickled
                 return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
+            self.expirations += 1
             self.delete(key)
         return CACHE_MISS
 
@@ -96,6 +107,7 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
             elif self.max_size and len(self._cache) >= self.max_size:
                 # Remove least recently used item
                 self._cache.popitem(last=False)
+                self.evictions += 1
             # pickle locally to mimic Redis
 
             self._cache[key] = {"value": value, "time": time.time()}
@@ -170,6 +182,17 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
         """Return the number of items in the cache."""
         return len(self._cache)
 
+    def stats(self) -> CacheStats:
+        """Return the number of items in the cache and how often items were found, missed, evicted or expired."""
+        return CacheStats(
+            size=len(self._cache),
+            max_size=self.max_size or 0,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            expirations=self.expirations,
+        )
+
     def __repr__(self) -> str:
         """Return a string representation of the InMemoryCache instance."""
         return f"InMemoryCache(max_size={self.max_size}, expiration_time={self.expiration_time})"
@@ -303,10 +326,19 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         self.lock = asyncio.Lock()
         self.max_size = max_size
         self.expiration_time = expiration_time
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
 
     async def get(self, key, lock: asyncio.Lock | None = None):
         async with lock or self.lock:
-            return await self._get(key)
+            value = await self._get(key)
+            if value is CACHE_MISS:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
 
     async def _get(self, key):
         item = self.cache.get(key, None)
@@ -315,6 +347,7 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
                 self.cache.move_to_end(key)
                 return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
             logger.info(f"Cache item for key '{key}' has expired and will be deleted.")
+            self.expirations += 1
             await self._delete(key)  # Log before deleting the expired item
         return CACHE_MISS
 
@@ -326,8 +359,9 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
             )
 
     async def _set(self, key, value) -> None:
-        if self.max_size and len(self.cache) >= self.max_size:
+        if self.max_size and key not in self.cache and len(self.cache) >= self.max_size:
             self.cache.popitem(last=False)
+            self.evictions += 1
         self.cache[key] = {"value": value, "time": time.time()}
         self.cache.move_to_end(key)
 
@@ -350,11 +384,23 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         await self._upsert(key, value, lock)
 
     async def _upsert(self, key, value, lock: asyncio.Lock | None = None) -> None:
-        existing_value = await self.get(key, lock)
-        if existing_value is not None and isinstance(existing_value, dict) and isinstance(value, dict):
-            existing_value.update(value)
-            value = existing_value
-        await self.set(key, value, lock)
+        async with lock or self.lock:
+            existing_value = await self._get(key)
+            if existing_value is not None and isinstance(existing_value, dict) and isinstance(value, dict):
+                existing_value.update(value)
+                value = existing_value
+            await self._set(key, value)
 
     async def contains(self, key) -> bool:
         return key in self.cache
+
+    def stats(self) -> CacheStats:
+        """Return the number of items in the cache and how often items were found, missed, evicted or expired."""
+        return CacheStats(
+            size=len(self.cache),
+            max_size=self.max_size or 0,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            expirations=self.expirations,
+        )
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import contextlib
 import hashlib
@@ -26,6 +27,24 @@ class CacheMiss:
         return False
 
 
+class AsyncLockStripes:
+    """A fixed table of asyncio locks shared by all keys.
+
+    Each key maps to one of `size` locks by its hash, so keys never add locks, at the cost of unrelated keys
+    sometimes waiting for each other. Do not hold the lock of a key while acquiring the lock of another key
+    from the same table, as both may be the same lock.
+    """
+
+    def __init__(self, size: int = 64) -> None:
+        self._locks = [asyncio.Lock() for _ in range(size)]
+
+    def __getitem__(self, key: str) -> asyncio.Lock:
+        return self._locks[hash(key) % len(self._locks)]
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+
 def create_cache_folder(func):
     def wrapper(*args, **kwargs):
         # Get the destination folder
@@ -1,21 +1,38 @@
+from __future__ import annotations
+
 import asyncio
-from collections import defaultdict
-from threading import RLock
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+import dill
 
 from langflow.services.base import Service
-from langflow.services.cache.base import AsyncBaseCacheService, CacheService
+from langflow.services.cache.base import AsyncBaseCacheService, CacheService, ExternalAsyncBaseCacheService
+from langflow.services.cache.disk import AsyncDiskCache
+from langflow.services.cache.service import ThreadingInMemoryCache
+from langflow.services.cache.utils import AsyncLockStripes, CacheMiss
 from langflow.services.deps import get_cache_service
 
+if TYPE_CHECKING:
+    from langflow.graph.graph.base import Graph
+    from langflow.services.cache.base import CacheStats
+
+CACHE_LOCK_STRIPES = 64
+
 
 class ChatService(Service):
-    """Service class for managing chat-related operations."""
+    """Service class for managing chat-related operations.
+
+    The locks handed out by `async_cache_locks` and the locks that serialize updates of a cache key come from
+    two fixed tables of `CACHE_LOCK_STRIPES` locks, so they do not grow with the number of flows and sessions.
+    Operations on the in-memory caches are dictionary lookups, so they run directly on the event loop, and only
+    other synchronous caches are called from a worker thread.
+    """
 
     name = "chat_service"
 
     def __init__(self) -> None:
-        self.async_cache_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
-        self._sync_cache_locks: dict[str, RLock] = defaultdict(RLock)
+        self.async_cache_locks = AsyncLockStripes(CACHE_LOCK_STRIPES)
+        self._cache_key_locks = AsyncLockStripes(CACHE_LOCK_STRIPES)
         self.cache_service: CacheService | AsyncBaseCacheService = get_cache_service()
 
     async def set_cache(self, key: str, data: Any, lock: asyncio.Lock | None = None) -> bool:
@@ -24,7 +41,8 @@ class ChatService(Service):
         Args:
             key (str): The cache key.
             data (Any): The data to be cached.
-            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
+            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation of an async cache.
+                Defaults to the lock of the key.
 
         Returns:
             bool: True if the cache was set successfully, False otherwise.
@@ -34,11 +52,12 @@ class ChatService(Service):
             "type": type(data),
         }
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            await self.cache_service.upsert(str(key), result_dict, lock=lock or self.async_cache_locks[key])
+            await self.cache_service.upsert(str(key), result_dict, lock=lock or self._cache_key_locks[key])
             return await self.cache_service.contains(key)
-        await asyncio.to_thread(
-            self.cache_service.upsert, str(key), result_dict, lock=lock or self._sync_cache_locks[key]
-        )
+        if isinstance(self.cache_service, ThreadingInMemoryCache):
+            self.cache_service.upsert(str(key), result_dict)
+        else:
+            await asyncio.to_thread(self.cache_service.upsert, str(key), result_dict)
         return key in self.cache_service
 
     async def get_cache(self, key: str, lock: asyncio.Lock | None = None) -> Any:
@@ -46,22 +65,143 @@ class ChatService(Service):
 
         Args:
             key (str): The cache key.
-            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
+            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation of an async cache.
+                Defaults to the lock of the key.
 
         Returns:
             Any: The cached data.
         """
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            return await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
-        return await asyncio.to_thread(self.cache_service.get, key, lock=lock or self._sync_cache_locks[key])
+            return await self.cache_service.get(key, lock=lock or self._cache_key_locks[key])
+        if isinstance(self.cache_service, ThreadingInMemoryCache):
+            return self.cache_service.get(key)
+        return await asyncio.to_thread(self.cache_service.get, key)
 
     async def clear_cache(self, key: str, lock: asyncio.Lock | None = None) -> None:
         """Clear the cache for a client.
 
+        When the key holds a graph stored with `set_graph`, the entries of its flow data and of its build states
+        are removed as well.
+
         Args:
             key (str): The cache key.
-            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
+            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation of an async cache.
+                Defaults to the lock of the key.
         """
+        if self.serializes_values:
+            cached = await self.get_cache(key, lock=lock)
+            graph_state = None if isinstance(cached, CacheMiss) else cached.get("result")
+            if isinstance(graph_state, dict) and "built_vertex_ids" in graph_state:
+                for vertex_id in graph_state["built_vertex_ids"]:
+                    await self._delete(_build_state_key(key, vertex_id))
+                await self._delete(_graph_data_key(key))
+        await self._delete(key, lock=lock)
+
+    async def _delete(self, key: str, lock: asyncio.Lock | None = None) -> None:
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            return await self.cache_service.delete(key, lock=lock or self.async_cache_locks[key])
-        return await asyncio.to_thread(self.cache_service.delete, key, lock=lock or self._sync_cache_locks[key])
+            return await self.cache_service.delete(key, lock=lock or self._cache_key_locks[key])
+        if isinstance(self.cache_service, ThreadingInMemoryCache):
+            return self.cache_service.delete(key)
+        return await asyncio.to_thread(self.cache_service.delete, key)
+
+    def get_cache_stats(self) -> CacheStats | None:
+        """Return the size and the hit, miss, eviction and expiration counts of the cache, if it keeps them."""
+        stats = getattr(self.cache_service, "stats", None)
+        return stats() if callable(stats) else None
+
+    @property
+    def serializes_values(self) -> bool:
+        """Whether the cache service pickles the values it stores instead of keeping references."""
+        return isinstance(self.cache_service, ExternalAsyncBaseCacheService | AsyncDiskCache)
+
+    async def set_graph(self, key: str, graph: Graph, *, vertex_id: str | None = None) -> None:
+        """Store a graph so that later requests can continue its run.
+
+        In-memory caches keep a reference to the graph, so the graph itself is stored. When the
+        cache serializes its values, the flow data and the build state of each built vertex are
+        stored under keys of their own, and the key holds the run state and the IDs of the built
+        vertices. A call only writes the build state of `vertex_id` and of built vertices that are
+        not stored yet, so the cost of storing a build does not grow with the number of vertices
+        built before it. Without a `vertex_id`, everything is written again.
+
+        If one of the entries expires before the others, `get_graph` returns a cache miss.
+
+        Args:
+            key (str): The cache key, usually the flow ID.
+            graph (Graph): The graph to store.
+            vertex_id (str | None): The vertex that was just built. Defaults to None.
+        """
+        if not self.serializes_values or not graph.raw_graph_data.get("nodes"):
+            await self.set_cache(key, graph)
+            return
+
+        if vertex_id is None or graph.cache_key != key:
+            await self.set_cache(_graph_data_key(key), graph.raw_graph_data)
+            graph.cache_key = key
+            graph.cached_vertex_ids = set()
+
+        built_vertex_ids = [vertex.id for vertex in graph.vertices if vertex.built]
+        for built_vertex_id in built_vertex_ids:
+            if built_vertex_id == vertex_id or built_vertex_id not in graph.cached_vertex_ids:
+                build_state = dill.dumps(graph.get_vertex(built_vertex_id).get_build_state(), recurse=True)
+                await self.set_cache(_build_state_key(key, built_vertex_id), build_state)
+        for stale_vertex_id in graph.cached_vertex_ids.difference(built_vertex_ids):
+            await self._delete(_build_state_key(key, stale_vertex_id))
+        graph.cached_vertex_ids = set(built_vertex_ids)
+
+        graph_state = {
+            "flow_id": graph.flow_id,
+            "flow_name": graph.flow_name,
+            "description": graph.description,
+            "user_id": graph.user_id,
+            "run_state": graph.get_run_state(),
+            "built_vertex_ids": built_vertex_ids,
+        }
+        await self.set_cache(key, graph_state)
+
+    async def get_graph(self, key: str) -> Graph | CacheMiss:
+        """Get a graph stored with `set_graph`.
+
+        Args:
+            key (str): The cache key, usually the flow ID.
+
+        Returns:
+            Graph | CacheMiss: The graph, or a CacheMiss if there is no graph stored for the key.
+        """
+        from langflow.graph.graph.base import Graph
+
+        cached = await self.get_cache(key)
+        if isinstance(cached, CacheMiss):
+            return cached
+        graph_state = cached.get("result")
+        if not isinstance(graph_state, dict):
+            return graph_state
+
+        entries = [await self.get_cache(_graph_data_key(key))]
+        entries += [await self.get_cache(_build_state_key(key, v_id)) for v_id in graph_state["built_vertex_ids"]]
+        for entry in entries:
+            if isinstance(entry, CacheMiss):
+                return entry
+        graph_data, *build_states = [entry["result"] for entry in entries]
+
+        graph = Graph.from_payload(
+            graph_data,
+            flow_id=graph_state["flow_id"],
+            flow_name=graph_state["flow_name"],
+            user_id=graph_state["user_id"],
+        )
+        graph.description = graph_state["description"]
+        graph.set_run_state(graph_state["run_state"])
+        for vertex_id, build_state in zip(graph_state["built_vertex_ids"], build_states, strict=True):
+            graph.get_vertex(vertex_id).set_build_state(dill.loads(build_state))  # noqa: S301
+        graph.cache_key = key
+        graph.cached_vertex_ids = set(graph_state["built_vertex_ids"])
+        return graph
+
+
+def _graph_data_key(key: str) -> str:
+    return f"{key}:graph_data"
+
+
+def _build_state_key(key: str, vertex_id: str) -> str:
+    return f"{key}:vertex:{vertex_id}"
@@ -4,17 +4,25 @@ import secrets
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+from cachetools import TTLCache
+from loguru import logger
 from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from sqlmodel import col, select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.database.models import User
 from langflow.services.database.models.api_key import ApiKey, ApiKeyCreate, ApiKeyRead, UnmaskedApiKeyRead
-from langflow.services.deps import session_scope
+from langflow.services.deps import get_settings_service, session_scope
 
 if TYPE_CHECKING:
     from sqlmodel.sql.expression import SelectOfScalar
 
+API_KEY_CACHE_SIZE = 1024
+
+_api_key_cache: TTLCache[str, tuple[UUID, User]] | None = None
+_pending_uses: dict[UUID, tuple[int, datetime.datetime]] = {}
+_flush_uses_task: asyncio.Task | None = None
+
 
 async def get_api_keys(session: AsyncSession, user_id: UUID) -> list[ApiKeyRead]:
     query: SelectOfScalar = select(ApiKey).where(ApiKey.user_id == user_id)
@@ -46,33 +54,119 @@ async def delete_api_key(session: AsyncSession, api_key_id: UUID) -> None:
     if api_key is None:
         msg = "API Key not found"
         raise ValueError(msg)
+    invalidate_api_key_cache(api_key=api_key.api_key)
     await session.delete(api_key)
     await session.commit()
 
 
-update_total_uses_tasks: set[asyncio.Task] = set()
+def _get_api_key_cache() -> TTLCache[str, tuple[UUID, User]] | None:
+    global _api_key_cache  # noqa: PLW0603
+    ttl = get_settings_service().settings.api_key_cache_ttl
+    if ttl <= 0:
+        return None
+    if _api_key_cache is None or _api_key_cache.ttl != ttl:
+        _api_key_cache = TTLCache(maxsize=API_KEY_CACHE_SIZE, ttl=ttl)
+    return _api_key_cache
+
+
+def invalidate_api_key_cache(*, api_key: str | None = None, user_id: UUID | None = None) -> None:
+    """Remove cached API keys so the next request using them is checked against the database.
+
+    Args:
+        api_key: Remove this API key.
+        user_id: Remove every API key that belongs to this user.
+    """
+    if _api_key_cache is None:
+        return
+    if api_key is not None:
+        _api_key_cache.pop(api_key, None)
+    if user_id is not None:
+        for cached_key, (_, user) in list(_api_key_cache.items()):
+            if user.id == user_id:
+                _api_key_cache.pop(cached_key, None)
+
+
+def clear_api_key_cache() -> None:
+    """Remove every cached API key."""
+    if _api_key_cache is not None:
+        _api_key_cache.clear()
 
 
 async def check_key(session: AsyncSession, api_key: str) -> User | None:
-    """Check if the API key is valid."""
+    """Check if the API key is valid.
+
+    Valid keys are cached for `api_key_cache_ttl` seconds together with a detached copy of their user, so
+    repeated requests with the same key skip the database. Deleting the key invalidates its entry in this
+    process only; other workers keep using their entry until it expires.
+    """
+    api_key_cache = _get_api_key_cache()
+    if api_key_cache is not None and (cached := api_key_cache.get(api_key)) is not None:
+        api_key_id, user = cached
+        await record_api_key_use(api_key_id)
+        return user
+
     query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
     api_key_object: ApiKey | None = (await session.exec(query)).first()
-    if api_key_object is not None:
-        task = asyncio.create_task(update_total_uses(api_key_object.id))
-        task.add_done_callback(update_total_uses_tasks.discard)
-        update_total_uses_tasks.add(task)
-        return api_key_object.user
-    return None
-
-
-async def update_total_uses(api_key_id: UUID):
-    """Update the total uses and last used at."""
+    if api_key_object is None:
+        return None
+    user = User(**api_key_object.user.model_dump())
+    if api_key_cache is not None:
+        api_key_cache[api_key] = (api_key_object.id, user)
+    await record_api_key_use(api_key_object.id)
+    return user
+
+
+async def record_api_key_use(api_key_id: UUID) -> None:
+    """Count a use of the API key.
+
+    Uses are aggregated in memory and written in a single transaction every `api_key_usage_flush_interval`
+    seconds instead of opening a session for every request.
+    """
+    count, _ = _pending_uses.get(api_key_id, (0, None))
+    _pending_uses[api_key_id] = (count + 1, datetime.datetime.now(datetime.timezone.utc))
+
+    global _flush_uses_task  # noqa: PLW0603
+    flush_interval = get_settings_service().settings.api_key_usage_flush_interval
+    if flush_interval <= 0:
+        await flush_api_key_usage()
+        return
+    loop = asyncio.get_running_loop()
+    if _flush_uses_task is None or _flush_uses_task.done() or _flush_uses_task.get_loop() is not loop:
+        _flush_uses_task = loop.create_task(_flush_api_key_usage_after(flush_interval))
+
+
+async def _flush_api_key_usage_after(flush_interval: float) -> None:
+    while _pending_uses:
+        await asyncio.sleep(flush_interval)
+        try:
+            await flush_api_key_usage()
+        except Exception:  # noqa: BLE001
+            logger.exception("Error updating API key usage")
+
+
+async def flush_api_key_usage() -> None:
+    """Write the API key uses counted since the last flush to the database."""
+    if not _pending_uses:
+        return
+    pending = dict(_pending_uses)
+    _pending_uses.clear()
     async with session_scope() as session:
-        new_api_key = await session.get(ApiKey, api_key_id)
-        if new_api_key is None:
-            msg = "API Key not found"
-            raise ValueError(msg)
-        new_api_key.total_uses += 1
-        new_api_key.last_used_at = datetime.datetime.now(datetime.timezone.utc)
-        session.add(new_api_key)
-        await session.commit()
+        for api_key_id, (count, last_used_at) in pending.items():
+            await session.exec(
+                update(ApiKey)
+                .where(col(ApiKey.id) == api_key_id)
+                .values(total_uses=col(ApiKey.total_uses) + count, last_used_at=last_used_at)
+            )
+
+
+async def teardown_api_keys() -> None:
+    """Write the pending API key uses and clear the cached keys."""
+    global _flush_uses_task  # noqa: PLW0603
+    if _flush_uses_task is not None and not _flush_uses_task.done():
+        _flush_uses_task.cancel()
+        await asyncio.wait([_flush_uses_task])
+    _flush_uses_task = None
+    try:
+        await flush_api_key_usage()
+    finally:
+        clear_api_key_cache()
@@ -17,7 +17,7 @@ from pydantic import (
     field_validator,
 )
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Text, UniqueConstraint, text
+from sqlalchemy import Text, UniqueConstraint, event, inspect, select, text
 from sqlmodel import JSON, Column, Field, Relationship, SQLModel
 
 from langflow.schema import Data
@@ -187,6 +187,8 @@ class Flow(FlowBase, table=True):  # type: ignore[call-arg]
     folder_id: UUID | None = Field(default=None, foreign_key="folder.id", nullable=True, index=True)
     fs_path: str | None = Field(default=None, nullable=True)
     folder: Optional["Folder"] = Relationship(back_populates="flows")
+    input_schema: dict | None = Field(default=None, sa_column=Column(JSON, nullable=True))
+    mcp_tool_name: str | None = Field(default=None, nullable=True, index=True)
 
     def to_data(self):
         serialized = self.model_dump()
@@ -202,9 +204,64 @@ class Flow(FlowBase, table=True):  # type: ignore[call-arg]
     __table_args__ = (
         UniqueConstraint("user_id", "name", name="unique_flow_name"),
         UniqueConstraint("user_id", "endpoint_name", name="unique_flow_endpoint_name"),
+        UniqueConstraint("user_id", "mcp_tool_name", name="unique_flow_mcp_tool_name"),
     )
 
 
+@event.listens_for(Flow, "before_insert")
+@event.listens_for(Flow, "before_update")
+def set_flow_input_schema(_mapper, _connection, target: Flow) -> None:
+    """Store the JSON schema of the flow inputs whenever its data is written, so listings never have to load it."""
+    from langflow.services.database.models.flow.utils import get_input_schema_from_flow_data
+
+    state = inspect(target)
+    if state.persistent and not state.attrs.data.history.has_changes() and target.input_schema is not None:
+        return
+    target.input_schema = get_input_schema_from_flow_data(target.data)
+
+
+@event.listens_for(Flow, "before_insert")
+@event.listens_for(Flow, "before_update")
+def set_flow_mcp_tool_name(_mapper, connection, target: Flow) -> None:
+    """Store the name the flow is exposed with as an MCP tool, so tool calls can look it up by index.
+
+    Like the migration that added the column, a flow whose tool name is already taken by another flow of its user
+    gets the first free numeric suffix, e.g. `my_flow_2`.
+    """
+    from langflow.services.database.models.flow.utils import get_mcp_tool_name
+
+    state = inspect(target)
+    if state.persistent and not state.attrs.name.history.has_changes():
+        return
+    if not target.name:
+        target.mcp_tool_name = None
+        return
+    mcp_tool_name = get_mcp_tool_name(target.name)
+    if target.user_id is None:
+        target.mcp_tool_name = mcp_tool_name
+        return
+
+    flow_table = Flow.__table__
+    stmt = select(flow_table.c.mcp_tool_name).where(
+        flow_table.c.user_id == target.user_id,
+        flow_table.c.id != target.id,
+        flow_table.c.mcp_tool_name.startswith(mcp_tool_name, autoescape=True),
+    )
+    taken = set(connection.execute(stmt).scalars())
+    # Flows flushed together with this one are not in the table yet
+    taken.update(
+        flow.mcp_tool_name
+        for flow in [*state.session.new, *state.session.dirty]
+        if isinstance(flow, Flow) and flow is not target and flow.user_id == target.user_id
+    )
+    suffix = 2
+    unique_name = mcp_tool_name
+    while unique_name in taken:
+        unique_name = f"{mcp_tool_name}_{suffix}"
+        suffix += 1
+    target.mcp_tool_name = unique_name
+
+
 class FlowCreate(FlowBase):
     user_id: UUID | None = None
     folder_id: UUID | None = None
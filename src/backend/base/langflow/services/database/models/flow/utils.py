@@ -1,3 +1,5 @@
+from loguru import logger
+
 from langflow.utils.version import get_version_info
 
 from .model import Flow
@@ -26,6 +28,58 @@ def get_all_website_input_components_in_flow(flow_data: dict | None):
     return [node for node in flow_data.get("nodes", []) if "WebsiteInput" in node.get("id")]
 
 
+def get_mcp_tool_name(flow_name: str) -> str:
+    """Get the snake case name a flow is exposed with as an MCP tool."""
+    return "_".join(flow_name.lower().split())
+
+
+def get_input_nodes_in_flow(flow_data: dict | None) -> list[dict]:
+    """Get the input nodes of the flow data, including those nested in group nodes, in graph order."""
+    from langflow.graph.schema import INPUT_COMPONENTS
+
+    if not isinstance(flow_data, dict):
+        return []
+    input_nodes = []
+    for node in flow_data.get("nodes", []):
+        node_data = node.get("data", {}).get("node", {})
+        if "flow" in node_data:
+            input_nodes.extend(get_input_nodes_in_flow(node_data["flow"].get("data")))
+        elif node_data.get("is_input") or any(name in node.get("id", "") for name in INPUT_COMPONENTS):
+            input_nodes.append(node)
+    return input_nodes
+
+
+def get_input_schema_from_flow_data(flow_data: dict | None) -> dict:
+    """Generate the JSON schema of the inputs of a flow from its raw data, without building the graph."""
+    properties: dict[str, dict] = {}
+    required = []
+    for node in get_input_nodes_in_flow(flow_data):
+        template = node["data"]["node"].get("template", {})
+        for field_name, field_data in template.items():
+            if not isinstance(field_data, dict) or not field_data.get("show", False) or field_data.get("advanced"):
+                continue
+            field_type = field_data.get("type", "string")
+            if field_type == "str":
+                field_type = "string"
+            elif field_type == "int":
+                field_type = "integer"
+            elif field_type == "float":
+                field_type = "number"
+            elif field_type == "bool":
+                field_type = "boolean"
+            else:
+                logger.warning(f"Unknown field type: {field_type} defaulting to string")
+                field_type = "string"
+            properties[field_name] = {
+                "type": field_type,
+                "description": field_data.get("info", f"Input for {field_name}"),
+            }
+            if field_data.get("required", False):
+                required.append(field_name)
+
+    return {"type": "object", "properties": properties, "required": required}
+
+
 def get_components_versions(flow: Flow):
     versions: dict[str, str] = {}
     if flow.data is None:
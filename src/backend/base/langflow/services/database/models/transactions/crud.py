@@ -52,20 +52,10 @@ async def log_transaction(db: AsyncSession, transaction: TransactionBase) -> Tra
         # Get max entries setting
         max_entries = get_settings_service().settings.max_transactions_to_keep
 
-        # Delete older entries in a single transaction
-        delete_older = delete(TransactionTable).where(
-            TransactionTable.flow_id == transaction.flow_id,
-            col(TransactionTable.id).in_(
-                select(TransactionTable.id)
-                .where(TransactionTable.flow_id == transaction.flow_id)
-                .order_by(col(TransactionTable.timestamp).desc())
-                .offset(max_entries - 1)  # Keep newest max_entries-1 plus the one we're adding
-            ),
-        )
-
-        # Add new entry and execute delete in same transaction
+        # Add new entry and delete older entries in the same transaction.
+        # Keep newest max_entries-1 plus the one we're adding.
+        await delete_older_transactions(db, transaction.flow_id, max_entries - 1)
         db.add(table)
-        await db.exec(delete_older)
         await db.commit()
 
     except Exception:
@@ -74,6 +64,29 @@ async def log_transaction(db: AsyncSession, transaction: TransactionBase) -> Tra
     return table
 
 
+async def delete_older_transactions(db: AsyncSession, flow_id: UUID, max_entries: int) -> None:
+    """Delete the transactions of a flow beyond the newest `max_entries`.
+
+    Args:
+        db: Database session
+        flow_id: The flow whose older transactions should be deleted
+        max_entries: The number of transactions to keep for the flow
+
+    Note:
+        The caller is responsible for committing the transaction.
+    """
+    delete_older = delete(TransactionTable).where(
+        TransactionTable.flow_id == flow_id,
+        col(TransactionTable.id).in_(
+            select(TransactionTable.id)
+            .where(TransactionTable.flow_id == flow_id)
+            .order_by(col(TransactionTable.timestamp).desc())
+            .offset(max_entries)
+        ),
+    )
+    await db.exec(delete_older)
+
+
 def transform_transaction_table(
     transaction: list[TransactionTable] | TransactionTable,
 ) -> list[TransactionReadResponse]:
@@ -1,3 +1,3 @@
-from .model import VertexBuildTable
+from .model import VertexBuildStatsTable, VertexBuildTable
 
-__all__ = ["VertexBuildTable"]
+__all__ = ["VertexBuildStatsTable", "VertexBuildTable"]
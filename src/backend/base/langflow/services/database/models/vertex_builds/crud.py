@@ -1,11 +1,20 @@
+import math
+from datetime import datetime, timezone
 from uuid import UUID
 
 from sqlmodel import col, delete, func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
+from langflow.services.database.models.vertex_builds.model import (
+    VertexBuildBase,
+    VertexBuildStatsTable,
+    VertexBuildTable,
+)
 from langflow.services.deps import get_settings_service
 
+BUILD_TIME_EWMA_ALPHA = 0.3
+MAX_RECENT_BUILD_TIMES = 50
+
 
 async def get_vertex_builds_by_flow_id(
     db: AsyncSession, flow_id: UUID, limit: int | None = 1000
@@ -95,30 +104,10 @@ async def log_vertex_build(
         await db.flush()
 
         # 2) Delete older builds for this vertex, keeping newest max_per_vertex
-        keep_vertex_subq = (
-            select(VertexBuildTable.build_id)
-            .where(
-                VertexBuildTable.flow_id == vertex_build.flow_id,
-                VertexBuildTable.id == vertex_build.id,
-            )
-            .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
-            .limit(max_per_vertex)
-        )
-        delete_vertex_older = delete(VertexBuildTable).where(
-            VertexBuildTable.flow_id == vertex_build.flow_id,
-            VertexBuildTable.id == vertex_build.id,
-            col(VertexBuildTable.build_id).not_in(keep_vertex_subq),
-        )
-        await db.exec(delete_vertex_older)
+        await delete_older_vertex_builds(db, vertex_build.flow_id, vertex_build.id, max_per_vertex)
 
         # 3) Delete older builds globally, keeping newest max_global
-        keep_global_subq = (
-            select(VertexBuildTable.build_id)
-            .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
-            .limit(max_global)
-        )
-        delete_global_older = delete(VertexBuildTable).where(col(VertexBuildTable.build_id).not_in(keep_global_subq))
-        await db.exec(delete_global_older)
+        await delete_older_vertex_builds_globally(db, max_global)
 
         # 4) Commit transaction
         await db.commit()
@@ -130,6 +119,54 @@ async def log_vertex_build(
     return table
 
 
+async def delete_older_vertex_builds(db: AsyncSession, flow_id: UUID, vertex_id: str, max_builds: int) -> None:
+    """Delete the builds of a vertex beyond the newest `max_builds`.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        flow_id (UUID): The flow the vertex belongs to.
+        vertex_id (str): The vertex whose older builds should be deleted.
+        max_builds (int): The number of builds to keep for the vertex.
+
+    Note:
+        The caller is responsible for committing the transaction.
+    """
+    keep_vertex_subq = (
+        select(VertexBuildTable.build_id)
+        .where(
+            VertexBuildTable.flow_id == flow_id,
+            VertexBuildTable.id == vertex_id,
+        )
+        .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
+        .limit(max_builds)
+    )
+    delete_vertex_older = delete(VertexBuildTable).where(
+        VertexBuildTable.flow_id == flow_id,
+        VertexBuildTable.id == vertex_id,
+        col(VertexBuildTable.build_id).not_in(keep_vertex_subq),
+    )
+    await db.exec(delete_vertex_older)
+
+
+async def delete_older_vertex_builds_globally(db: AsyncSession, max_builds: int) -> None:
+    """Delete every build beyond the newest `max_builds` across all flows.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        max_builds (int): The number of builds to keep.
+
+    Note:
+        The caller is responsible for committing the transaction.
+    """
+    keep_global_subq = (
+        select(VertexBuildTable.build_id)
+        .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
+        .limit(max_builds)
+    )
+    delete_global_older = delete(VertexBuildTable).where(col(VertexBuildTable.build_id).not_in(keep_global_subq))
+    await db.exec(delete_global_older)
+
+
 async def delete_vertex_builds_by_flow_id(db: AsyncSession, flow_id: UUID) -> None:
     """Delete all vertex builds associated with a specific flow ID.
 
@@ -143,3 +180,58 @@ async def delete_vertex_builds_by_flow_id(db: AsyncSession, flow_id: UUID) -> No
     """
     stmt = delete(VertexBuildTable).where(VertexBuildTable.flow_id == flow_id)
     await db.exec(stmt)
+
+
+async def get_vertex_build_stats(db: AsyncSession, flow_id: UUID) -> dict[str, VertexBuildStatsTable]:
+    """Get the build time statistics of the vertices of a flow, keyed by vertex ID."""
+    stmt = select(VertexBuildStatsTable).where(VertexBuildStatsTable.flow_id == flow_id)
+    return {stats.vertex_id: stats for stats in (await db.exec(stmt)).all()}
+
+
+async def update_vertex_build_stats(db: AsyncSession, flow_id: UUID, build_times: dict[str, float]) -> None:
+    """Add the build times of one run of a flow to the statistics of its vertices.
+
+    The moving average weighs each new build time by `BUILD_TIME_EWMA_ALPHA`, and the 95th percentile is
+    computed over the last `MAX_RECENT_BUILD_TIMES` builds of the vertex.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        flow_id (UUID): The flow that was run.
+        build_times (dict[str, float]): The build time in seconds of each vertex built in the run.
+
+    Note:
+        The caller is responsible for committing the transaction.
+    """
+    if not build_times:
+        return
+    stmt = select(VertexBuildStatsTable).where(
+        VertexBuildStatsTable.flow_id == flow_id, col(VertexBuildStatsTable.vertex_id).in_(list(build_times))
+    )
+    existing = {stats.vertex_id: stats for stats in (await db.exec(stmt)).all()}
+    now = datetime.now(timezone.utc)
+    for vertex_id, build_time in build_times.items():
+        stats = existing.get(vertex_id)
+        if stats is None:
+            stats = VertexBuildStatsTable(flow_id=flow_id, vertex_id=vertex_id, ewma=build_time)
+        else:
+            stats.ewma = BUILD_TIME_EWMA_ALPHA * build_time + (1 - BUILD_TIME_EWMA_ALPHA) * stats.ewma
+        recent_build_times = [*stats.recent_build_times, build_time][-MAX_RECENT_BUILD_TIMES:]
+        stats.recent_build_times = recent_build_times
+        stats.p95 = _percentile(recent_build_times, 0.95)
+        stats.build_count += 1
+        stats.updated_at = now
+        db.add(stats)
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+async def delete_vertex_build_stats_by_flow_id(db: AsyncSession, flow_id: UUID) -> None:
+    """Delete the build time statistics of the vertices of a flow.
+
+    Note:
+        The caller is responsible for committing the transaction.
+    """
+    await db.exec(delete(VertexBuildStatsTable).where(VertexBuildStatsTable.flow_id == flow_id))
@@ -56,6 +56,19 @@ class VertexBuildTable(VertexBuildBase, table=True):  # type: ignore[call-arg]
     build_id: UUID | None = Field(default_factory=uuid4, primary_key=True)
 
 
+class VertexBuildStatsTable(SQLModel, table=True):  # type: ignore[call-arg]
+    """Build time statistics of a vertex, aggregated over the runs of its flow."""
+
+    __tablename__ = "vertex_build_stats"
+    flow_id: UUID = Field(primary_key=True)
+    vertex_id: str = Field(primary_key=True)
+    build_count: int = Field(default=0, nullable=False)
+    ewma: float = Field(default=0.0, nullable=False, description="Exponentially weighted moving average, in seconds")
+    p95: float = Field(default=0.0, nullable=False, description="95th percentile of the recent builds, in seconds")
+    recent_build_times: list[float] = Field(default_factory=list, sa_column=Column(JSON))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
 class VertexBuildMapModel(BaseModel):
     vertex_builds: dict[str, list[VertexBuildTable]]
 
@@ -15,7 +15,9 @@ if TYPE_CHECKING:
     from langflow.services.cache.service import AsyncBaseCacheService, CacheService
     from langflow.services.chat.service import ChatService
     from langflow.services.database.service import DatabaseService
+    from langflow.services.http_client.service import HTTPClientService
     from langflow.services.job_queue.service import JobQueueService
+    from langflow.services.log_writer.service import LogWriterService
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
     from langflow.services.socket.service import SocketIOService
@@ -26,6 +28,7 @@ if TYPE_CHECKING:
     from langflow.services.telemetry.service import TelemetryService
     from langflow.services.tracing.service import TracingService
     from langflow.services.variable.service import VariableService
+    from langflow.services.vertex_cache.service import VertexCacheService
 
 
 def get_service(service_type: ServiceType, default=None):
@@ -247,3 +250,24 @@ def get_queue_service() -> JobQueueService:
     from langflow.services.job_queue.factory import JobQueueServiceFactory
 
     return get_service(ServiceType.JOB_QUEUE_SERVICE, JobQueueServiceFactory())
+
+
+def get_log_writer_service() -> LogWriterService:
+    """Retrieves the LogWriterService instance from the service manager."""
+    from langflow.services.log_writer.factory import LogWriterServiceFactory
+
+    return get_service(ServiceType.LOG_WRITER_SERVICE, LogWriterServiceFactory())
+
+
+def get_vertex_cache_service() -> VertexCacheService:
+    """Retrieves the VertexCacheService instance from the service manager."""
+    from langflow.services.vertex_cache.factory import VertexCacheServiceFactory
+
+    return get_service(ServiceType.VERTEX_CACHE_SERVICE, VertexCacheServiceFactory())
+
+
+def get_http_client_service() -> HTTPClientService:
+    """Retrieves the HTTPClientService instance from the service manager."""
+    from langflow.services.http_client.factory import HTTPClientServiceFactory
+
+    return get_service(ServiceType.HTTP_CLIENT_SERVICE, HTTPClientServiceFactory())
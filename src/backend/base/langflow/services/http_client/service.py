@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import weakref
+from collections import OrderedDict, defaultdict
+from email.utils import parsedate_to_datetime
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import httpx
+
+from langflow.services.base import Service
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
+# The arguments of `httpx.AsyncClient.request` that go to `build_request`. The others go to `send`.
+_BUILD_REQUEST_ARGS = ("content", "data", "files", "json", "params", "headers", "cookies", "timeout", "extensions")
+CACHEABLE_METHODS = {"GET", "HEAD"}
+CACHEABLE_STATUS_CODES = {200, 203, 204, 300, 301, 404, 410}
+# Responses larger than this are never cached, so that a few large downloads cannot fill the cache.
+MAX_CACHED_RESPONSE_SIZE = 1024 * 1024
+
+
+class CachedResponse(NamedTuple):
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    content: bytes
+    expires_at: float
+
+
+class _LoopClient(NamedTuple):
+    client: httpx.AsyncClient
+    host_semaphores: defaultdict[str, asyncio.Semaphore]
+
+
+class HTTPClientService(Service):
+    """A process-wide HTTP client with connection pooling, per-host concurrency limits and response caching.
+
+    Components share its connection pool, so connections to the same host are kept alive and reused across
+    requests and flow runs instead of paying for a new TLS handshake each time. At most
+    `http_client_max_connections_per_host` requests to the same host run at once; the others wait for a slot.
+
+    If `http_client_cache_max_entries` is set, responses to GET and HEAD requests are cached as a shared cache
+    would cache them: only when `Cache-Control` (`s-maxage` or `max-age`) or `Expires` gives them a lifetime,
+    and never when they are marked `no-store`, `no-cache` or `private`. The request headers are part of the
+    cache key, so requests made with different credentials never share a response. For the same reason, the
+    client never stores cookies set by a response; pass `cookies` with each request that needs them.
+
+    httpx clients cannot be used across event loops, so one client is kept for each running loop.
+    """
+
+    name = "http_client_service"
+
+    def __init__(self, settings_service: SettingsService):
+        self.settings_service = settings_service
+        self._loop_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClient] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._cache: OrderedDict[tuple, CachedResponse] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled client for the running event loop.
+
+        Requests made with it directly share the connection pool but bypass the per-host limits and the cache.
+        """
+        return self._get_loop_client().client
+
+    def _get_loop_client(self) -> _LoopClient:
+        loop = asyncio.get_running_loop()
+        loop_client = self._loop_clients.get(loop)
+        if loop_client is None or loop_client.client.is_closed:
+            settings = self.settings_service.settings
+            client = httpx.AsyncClient(
+                # An empty list of allowed domains makes the jar reject every cookie, so a session cookie set
+                # for one user is never sent with the requests of another.
+                cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+                limits=httpx.Limits(
+                    max_connections=settings.http_client_max_connections,
+                    max_keepalive_connections=settings.http_client_max_keepalive_connections,
+                    keepalive_expiry=settings.http_client_keepalive_expiry,
+                ),
+            )
+            per_host = settings.http_client_max_connections_per_host
+            loop_client = _LoopClient(client, defaultdict(lambda: asyncio.Semaphore(per_host)))
+            self._loop_clients[loop] = loop_client
+        return loop_client
+
+    async def request(self, method: str, url: httpx.URL | str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the shared pool.
+
+        Takes the same arguments as `httpx.AsyncClient.request`.
+        """
+        loop_client = self._get_loop_client()
+        request = loop_client.client.build_request(
+            method,
+            url,
+            **{key: kwargs.pop(key) for key in _BUILD_REQUEST_ARGS if key in kwargs},
+        )
+        cache_key = self._get_cache_key(request)
+        if cache_key is not None and (response := self._get_cached_response(cache_key, request)) is not None:
+            return response
+
+        async with loop_client.host_semaphores[request.url.host]:
+            response = await loop_client.client.send(request, **kwargs)
+
+        if cache_key is not None:
+            self._cache_response(cache_key, response)
+        return response
+
+    async def get(self, url: httpx.URL | str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: httpx.URL | str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    def _get_cache_key(self, request: httpx.Request) -> tuple | None:
+        if self.settings_service.settings.http_client_cache_max_entries <= 0 or request.method not in CACHEABLE_METHODS:
+            return None
+        directives = _parse_cache_control(request.headers.get_list("cache-control", split_commas=True))
+        if "no-store" in directives or "no-cache" in directives:
+            return None
+        return request.method, str(request.url), tuple(sorted(request.headers.multi_items()))
+
+    def _get_cached_response(self, cache_key: tuple, request: httpx.Request) -> httpx.Response | None:
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None and cached.expires_at <= time.monotonic():
+                del self._cache[cache_key]
+                cached = None
+            if cached is None:
+                self.cache_misses += 1
+                return None
+            self._cache.move_to_end(cache_key)
+            self.cache_hits += 1
+        return httpx.Response(cached.status_code, headers=cached.headers, content=cached.content, request=request)
+
+    def _cache_response(self, cache_key: tuple, response: httpx.Response) -> None:
+        if response.status_code not in CACHEABLE_STATUS_CODES or "*" in response.headers.get("vary", ""):
+            return
+        lifetime = _get_response_lifetime(response)
+        if not lifetime or not response.is_stream_consumed or len(response.content) > MAX_CACHED_RESPONSE_SIZE:
+            return
+        # The content is stored decoded, so the headers that describe the encoded body no longer apply. Cookies
+        # are meant for the client that made the request, so they are not replayed to others either.
+        headers = [
+            (key, value)
+            for key, value in response.headers.raw
+            if key.lower() not in {b"content-encoding", b"content-length", b"transfer-encoding", b"set-cookie"}
+        ]
+        cached = CachedResponse(response.status_code, headers, response.content, time.monotonic() + lifetime)
+        with self._cache_lock:
+            self._cache[cache_key] = cached
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.settings_service.settings.http_client_cache_max_entries:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+
+    async def teardown(self) -> None:
+        # Clients that belong to other event loops cannot be closed from this one; their connections are
+        # released when the clients are garbage collected.
+        loop_client = self._loop_clients.pop(asyncio.get_running_loop(), None)
+        if loop_client is not None:
+            await loop_client.client.aclose()
+        self._loop_clients.clear()
+        self.clear_cache()
+
+
+def _parse_cache_control(values: list[str]) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for value in values:
+        name, _, argument = value.strip().partition("=")
+        if name:
+            directives[name.strip().lower()] = argument.strip().strip('"') or None
+    return directives
+
+
+def _get_response_lifetime(response: httpx.Response) -> float:
+    """Returns how many seconds the response may be reused for, which is 0 if it must not be cached."""
+    directives = _parse_cache_control(response.headers.get_list("cache-control", split_commas=True))
+    if {"no-store", "no-cache", "private"} & directives.keys():
+        return 0
+    for directive in ("s-maxage", "max-age"):
+        if directive in directives:
+            try:
+                return max(float(directives[directive] or 0), 0)
+            except ValueError:
+                return 0
+    if expires := response.headers.get("expires"):
+        try:
+            expires_at = parsedate_to_datetime(expires)
+            date = parsedate_to_datetime(response.headers["date"]) if "date" in response.headers else None
+        except (TypeError, ValueError):
+            return 0
+        if expires_at.tzinfo is None or (date is not None and date.tzinfo is None):
+            return 0
+        now = date.timestamp() if date is not None else time.time()
+        return max(expires_at.timestamp() - now, 0)
+    return 0
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Literal, NamedTuple
+
+import orjson
+from loguru import logger
+
+OverflowPolicy = Literal["coalesce", "drop_oldest", "block"]
+
+EventItem = tuple[str, bytes | None, float]
+
+TOKEN_EVENT_PREFIX = "token-"  # noqa: S105
+
+
+class EventQueueStats(NamedTuple):
+    size: int
+    max_size: int
+    bytes: int
+    peak_bytes: int
+    coalesced: int
+    dropped: int
+
+
+class EventQueue(asyncio.Queue):
+    """An asyncio queue of build events with a soft bound and an overflow policy.
+
+    Items are the `(event_id, payload, put_time)` tuples produced by the EventManager. The queue keeps
+    track of the payload bytes it holds so the JobQueueService can report how much memory each job uses.
+
+    Once the queue holds `max_size` items, new events are handled by the overflow policy:
+      - "coalesce": a token event is merged into the last queued token event of the same message. If that is
+        not possible, the oldest queued token event is dropped.
+      - "drop_oldest": the oldest queued token event is dropped.
+      - "block": nothing is dropped. Async producers are expected to await `wait_for_capacity` before sending
+        token events, which pauses the stream until the consumer catches up.
+
+    Only token events are ever dropped or merged. Every other event is always queued, even past the bound,
+    because the frontend relies on them to track the build.
+
+    Args:
+        max_size: The number of queued events after which the overflow policy applies. 0 means unbounded.
+        overflow_policy: What to do with new events when the queue is full.
+    """
+
+    def __init__(self, max_size: int = 0, overflow_policy: OverflowPolicy = "coalesce") -> None:
+        super().__init__()
+        self.max_size = max_size
+        self.overflow_policy = overflow_policy
+        self.bytes = 0
+        self.peak_bytes = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self._has_capacity = asyncio.Event()
+        self._has_capacity.set()
+
+    def is_over_capacity(self) -> bool:
+        return self.max_size > 0 and self.qsize() >= self.max_size
+
+    def put_nowait(self, item: EventItem) -> None:
+        if self.is_over_capacity() and self._is_token_event(item):
+            if self.overflow_policy == "coalesce" and self._coalesce(item):
+                return
+            if self.overflow_policy in {"coalesce", "drop_oldest"}:
+                self._drop_oldest_token_event()
+        super().put_nowait(item)
+
+    async def wait_for_capacity(self) -> None:
+        """Wait until the queue is below its bound when the overflow policy is "block"."""
+        if self.overflow_policy != "block":
+            return
+        while self.is_over_capacity():
+            self._has_capacity.clear()
+            await self._has_capacity.wait()
+
+    def stats(self) -> EventQueueStats:
+        return EventQueueStats(
+            size=self.qsize(),
+            max_size=self.max_size,
+            bytes=self.bytes,
+            peak_bytes=self.peak_bytes,
+            coalesced=self.coalesced,
+            dropped=self.dropped,
+        )
+
+    def _put(self, item: EventItem) -> None:
+        super()._put(item)
+        self.bytes += self._item_size(item)
+        self.peak_bytes = max(self.peak_bytes, self.bytes)
+
+    def _get(self) -> EventItem:
+        item = super()._get()
+        self.bytes -= self._item_size(item)
+        if not self.is_over_capacity():
+            self._has_capacity.set()
+        return item
+
+    @staticmethod
+    def _item_size(item: EventItem) -> int:
+        value = item[1]
+        return len(value) if value else 0
+
+    @staticmethod
+    def _is_token_event(item: EventItem) -> bool:
+        return item[1] is not None and item[0].startswith(TOKEN_EVENT_PREFIX)
+
+    def _coalesce(self, item: EventItem) -> bool:
+        last_item = self._queue[-1] if self._queue else None
+        if last_item is None or not self._is_token_event(last_item):
+            return False
+        try:
+            last_event = orjson.loads(last_item[1])
+            new_event = orjson.loads(item[1])
+        except orjson.JSONDecodeError:
+            return False
+        if last_event["data"].get("id") != new_event["data"].get("id"):
+            return False
+
+        last_event["data"]["chunk"] += new_event["data"]["chunk"]
+        merged = (last_item[0], orjson.dumps(last_event) + b"\n\n", last_item[2])
+        self._queue[-1] = merged
+        self.bytes += self._item_size(merged) - self._item_size(last_item)
+        self.peak_bytes = max(self.peak_bytes, self.bytes)
+        self.coalesced += 1
+        return True
+
+    def _drop_oldest_token_event(self) -> None:
+        for index, queued_item in enumerate(self._queue):
+            if self._is_token_event(queued_item):
+                del self._queue[index]
+                self.bytes -= self._item_size(queued_item)
+                self.dropped += 1
+                # Keep the unfinished task count in line with the items actually in the queue.
+                self._unfinished_tasks -= 1
+                if self.dropped == 1:
+                    logger.warning("Event queue is full; dropping stale token events")
+                return
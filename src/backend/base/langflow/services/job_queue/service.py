@@ -6,6 +6,7 @@ from loguru import logger
 
 from langflow.events.event_manager import EventManager, create_default_event_manager
 from langflow.services.base import Service
+from langflow.services.job_queue.event_queue import EventQueue, EventQueueStats, OverflowPolicy
 
 
 class JobQueueNotFoundError(Exception):
@@ -41,6 +42,9 @@ class JobQueueService(Service):
               * The cleanup timestamp (if any).
         _cleanup_task (asyncio.Task | None): Background task for periodic cleanup.
         _closed (bool): Flag indicating whether the service is currently active.
+        max_queue_size (int): Number of queued events after which a job's queue applies its overflow policy.
+            0 means unbounded.
+        overflow_policy (OverflowPolicy): What a full queue does with new token events. See `EventQueue`.
         CLEANUP_GRACE_PERIOD (int): Number of seconds to wait after a task is marked for cleanup
             before actually removing it. This grace period allows for:
               * Pending operations to complete
@@ -61,17 +65,24 @@ class JobQueueService(Service):
 
     name = "job_queue_service"
 
-    def __init__(self) -> None:
+    def __init__(self, max_queue_size: int = 0, overflow_policy: OverflowPolicy = "coalesce") -> None:
         """Initialize the JobQueueService.
 
         Sets up the internal registry for job queues, initializes the cleanup task, and sets the service state
         to active.
+
+        Args:
+            max_queue_size (int): Number of queued events after which a job's queue applies its overflow policy.
+                0 means unbounded.
+            overflow_policy (OverflowPolicy): What a full queue does with new token events.
         """
         self._queues: dict[str, tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]] = {}
         self._cleanup_task: asyncio.Task | None = None
         self._closed = False
         self.ready = False
         self.CLEANUP_GRACE_PERIOD = 300  # 5 minutes before cleaning up marked tasks
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
 
     def is_started(self) -> bool:
         """Check if the JobQueueService has started.
@@ -143,7 +154,7 @@ class JobQueueService(Service):
             logger.error(msg)
             raise RuntimeError(msg)
 
-        main_queue: asyncio.Queue = asyncio.Queue()
+        main_queue = EventQueue(max_size=self.max_queue_size, overflow_policy=self.overflow_policy)
         event_manager = create_default_event_manager(main_queue)
 
         # Register the queue without an active task.
@@ -209,6 +220,31 @@ class JobQueueService(Service):
         except KeyError as exc:
             raise JobQueueNotFoundError(job_id) from exc
 
+    def get_memory_usage(self, job_id: str) -> EventQueueStats:
+        """Return the size and memory accounting of a job's event queue.
+
+        Args:
+            job_id (str): Unique identifier for the job.
+
+        Returns:
+            EventQueueStats: The number of queued events, the bytes they hold, the peak byte count and how many
+                token events were coalesced or dropped.
+
+        Raises:
+            JobQueueNotFoundError: If the job_id is not found.
+        """
+        try:
+            main_queue = self._queues[job_id][0]
+        except KeyError as exc:
+            raise JobQueueNotFoundError(job_id) from exc
+        if isinstance(main_queue, EventQueue):
+            return main_queue.stats()
+        return EventQueueStats(size=main_queue.qsize(), max_size=0, bytes=0, peak_bytes=0, coalesced=0, dropped=0)
+
+    def get_total_memory_usage(self) -> int:
+        """Return the number of payload bytes queued across every job."""
+        return sum(queue.bytes for queue, *_ in self._queues.values() if isinstance(queue, EventQueue))
+
     async def cleanup_job(self, job_id: str) -> None:
         """Clean up and release resources for a specific job.
 
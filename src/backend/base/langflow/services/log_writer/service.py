@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.database.models.transactions.crud import delete_older_transactions
+from langflow.services.database.models.transactions.model import TransactionTable
+from langflow.services.database.models.vertex_builds.crud import (
+    delete_older_vertex_builds,
+    delete_older_vertex_builds_globally,
+    update_vertex_build_stats,
+)
+from langflow.services.database.models.vertex_builds.model import VertexBuildTable
+from langflow.services.database.utils import session_getter
+from langflow.services.deps import get_db_service
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from langflow.services.database.models.transactions.model import TransactionBase
+    from langflow.services.database.models.vertex_builds.model import VertexBuildBase
+    from langflow.services.settings.service import SettingsService
+
+
+class LogWriterService(Service):
+    """Buffers vertex build and transaction logs and writes them to the database in batches.
+
+    The build times of each run are buffered the same way and added to the build time statistics of the vertices
+    when the batch is written.
+
+    Logging a record only appends it to an in-memory buffer. A background task inserts everything buffered
+    in a single transaction every `log_writer_flush_interval_ms`, or sooner once `log_writer_max_batch_size`
+    records are waiting. Deleting the records beyond `max_transactions_to_keep`, `max_vertex_builds_per_vertex`
+    and `max_vertex_builds_to_keep` happens every `log_retention_interval` seconds instead of on every insert.
+
+    Readers that need to see every logged record, such as the monitor endpoints, call `flush` first.
+    """
+
+    name = "log_writer_service"
+
+    def __init__(self, settings_service: SettingsService):
+        self.settings_service = settings_service
+        self._transactions: list[TransactionTable] = []
+        self._vertex_builds: list[VertexBuildTable] = []
+        self._build_times: list[tuple[UUID, dict[str, float]]] = []
+        self._flows_to_prune: set[UUID] = set()
+        self._vertices_to_prune: set[tuple[UUID, str]] = set()
+        self._last_prune_time = time.monotonic()
+        self._flush_task: asyncio.Task | None = None
+
+    @property
+    def flush_interval(self) -> float:
+        return self.settings_service.settings.log_writer_flush_interval_ms / 1000
+
+    @property
+    def pending(self) -> int:
+        """The number of records waiting to be written."""
+        return len(self._transactions) + len(self._vertex_builds) + len(self._build_times)
+
+    async def log_transaction(self, transaction: TransactionBase) -> None:
+        """Buffer a transaction to be written with the next batch."""
+        if not transaction.flow_id:
+            logger.debug("Transaction flow_id is None")
+            return
+        self._transactions.append(TransactionTable(**transaction.model_dump()))
+        self._flows_to_prune.add(transaction.flow_id)
+        await self._schedule_flush()
+
+    async def log_vertex_build(self, vertex_build: VertexBuildBase) -> None:
+        """Buffer a vertex build to be written with the next batch."""
+        self._vertex_builds.append(VertexBuildTable(**vertex_build.model_dump()))
+        self._vertices_to_prune.add((vertex_build.flow_id, vertex_build.id))
+        await self._schedule_flush()
+
+    async def log_build_times(self, flow_id: UUID, build_times: dict[str, float]) -> None:
+        """Buffer the build times of one run of a flow to be added to its build time statistics."""
+        if not build_times:
+            return
+        self._build_times.append((flow_id, build_times))
+        await self._schedule_flush()
+
+    async def flush(self) -> None:
+        """Write every buffered record to the database in a single transaction."""
+        records: list[TransactionTable | VertexBuildTable] = [*self._transactions, *self._vertex_builds]
+        self._transactions = []
+        self._vertex_builds = []
+        build_times, self._build_times = self._build_times, []
+        if build_times:
+            await self._write_build_times(build_times)
+        if not records:
+            return
+        try:
+            async with session_getter(get_db_service()) as session:
+                session.add_all(records)
+                await session.commit()
+        except Exception:  # noqa: BLE001
+            # A single bad record, e.g. one whose flow was deleted in the meantime, should not lose the batch.
+            logger.warning(f"Error writing a batch of {len(records)} logs, writing them one at a time")
+            await self._write_one_by_one(records)
+        else:
+            logger.debug(f"Wrote {len(records)} logs")
+
+        if time.monotonic() - self._last_prune_time >= self.settings_service.settings.log_retention_interval:
+            await self.prune()
+
+    async def prune(self) -> None:
+        """Delete the records beyond the configured limits for the flows and vertices logged since the last prune."""
+        flows, self._flows_to_prune = self._flows_to_prune, set()
+        vertices, self._vertices_to_prune = self._vertices_to_prune, set()
+        self._last_prune_time = time.monotonic()
+        if not flows and not vertices:
+            return
+        settings = self.settings_service.settings
+        try:
+            async with session_getter(get_db_service()) as session:
+                for flow_id in flows:
+                    await delete_older_transactions(session, flow_id, settings.max_transactions_to_keep)
+                for flow_id, vertex_id in vertices:
+                    await delete_older_vertex_builds(session, flow_id, vertex_id, settings.max_vertex_builds_per_vertex)
+                if vertices:
+                    await delete_older_vertex_builds_globally(session, settings.max_vertex_builds_to_keep)
+                await session.commit()
+        except Exception:  # noqa: BLE001
+            logger.exception("Error pruning vertex builds and transactions")
+
+    async def teardown(self) -> None:
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            await asyncio.wait([self._flush_task])
+        self._flush_task = None
+        await self.flush()
+        await self.prune()
+
+    async def _schedule_flush(self) -> None:
+        if self.flush_interval <= 0 or self.pending >= self.settings_service.settings.log_writer_max_batch_size:
+            await self.flush()
+            return
+        loop = asyncio.get_running_loop()
+        if self._flush_task is None or self._flush_task.done() or self._flush_task.get_loop() is not loop:
+            self._flush_task = loop.create_task(self._flush_after_interval())
+
+    async def _flush_after_interval(self) -> None:
+        while self.pending:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:  # noqa: BLE001
+                logger.exception("Error flushing vertex builds and transactions")
+
+    async def _write_build_times(self, build_times: list[tuple[UUID, dict[str, float]]]) -> None:
+        try:
+            async with session_getter(get_db_service()) as session:
+                for flow_id, run_build_times in build_times:
+                    await update_vertex_build_stats(session, flow_id, run_build_times)
+                await session.commit()
+        except Exception:  # noqa: BLE001
+            # The statistics only guide scheduling, so losing the times of a few runs is fine.
+            logger.opt(exception=True).debug(f"Error updating the build time statistics of {len(build_times)} runs")
+
+    async def _write_one_by_one(self, records: list[TransactionTable | VertexBuildTable]) -> None:
+        for record in records:
+            try:
+                async with session_getter(get_db_service()) as session:
+                    session.add(record)
+                    await session.commit()
+            except Exception:  # noqa: BLE001
+                logger.error(f"Error writing {type(record).__name__} for flow {record.flow_id}")
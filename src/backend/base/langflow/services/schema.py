@@ -20,3 +20,6 @@ class ServiceType(str, Enum):
     TRACING_SERVICE = "tracing_service"
     TELEMETRY_SERVICE = "telemetry_service"
     JOB_QUEUE_SERVICE = "job_queue_service"
+    LOG_WRITER_SERVICE = "log_writer_service"
+    VERTEX_CACHE_SERVICE = "vertex_cache_service"
+    HTTP_CLIENT_SERVICE = "http_client_service"
@@ -126,6 +126,17 @@ class Settings(BaseSettings):
     """The cache type can be 'async' or 'redis'."""
     cache_expire: int = 3600
     """The cache expire in seconds."""
+    vertex_cache_type: Literal["disk", "redis"] = "disk"
+    """Where the results of components that set `cache_results` are kept between runs. 'disk' stores them in
+    `vertex_cache_dir`, shared by the workers of one host. 'redis' stores them on the Redis server configured above,
+    shared by every host, and leaves eviction to the server's maxmemory policy."""
+    vertex_cache_dir: str | None = None
+    """The directory of the disk vertex result cache. Defaults to a `vertex_cache` directory in the config dir."""
+    vertex_cache_max_size_mb: int = 1024
+    """The size above which the disk vertex result cache evicts the least recently used results. 0 disables the
+    vertex result cache."""
+    vertex_cache_expire: int = 7 * 24 * 60 * 60
+    """The time in seconds after which a cached vertex result expires."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
 
@@ -157,7 +168,29 @@ class Settings(BaseSettings):
     download_webhook_url: str | None = "https://api.langflow.store/flows/trigger/ec611a61-8460-4438-b187-a4f65e5559d4"
     like_webhook_url: str | None = "https://api.langflow.store/flows/trigger/64275852-ec00-45c1-984e-3bff814732da"
 
+    http_client_max_connections: int = 100
+    """The maximum number of connections of the HTTP client shared by components."""
+    http_client_max_keepalive_connections: int = 20
+    """The maximum number of idle connections the shared HTTP client keeps alive for reuse."""
+    http_client_keepalive_expiry: float = 30.0
+    """How long, in seconds, the shared HTTP client keeps an idle connection alive."""
+    http_client_max_connections_per_host: int = 10
+    """The maximum number of requests the shared HTTP client sends to the same host at once. The others wait."""
+    http_client_cache_max_entries: int = 0
+    """The number of responses the shared HTTP client caches, following their Cache-Control and Expires headers.
+    0 disables the cache."""
+
     storage_type: str = "local"
+    storage_s3_bucket: str = "langflow"
+    """The bucket used by the S3 storage."""
+    storage_s3_endpoint_url: str | None = None
+    """The endpoint of the S3 storage. Set it to use an S3-compatible server, such as MinIO, instead of AWS."""
+    storage_s3_max_concurrency: int = 10
+    """The maximum number of S3 requests in flight at once, shared by all transfers. It sizes both the thread pool
+    that runs the S3 client and its connection pool."""
+    storage_s3_part_size_mb: int = 8
+    """The size, in MB, of the parts of multipart uploads and ranged downloads. Files up to this size are transferred
+    with a single request. S3 requires parts of at least 5 MB."""
 
     celery_enabled: bool = False
 
@@ -220,6 +253,21 @@ class Settings(BaseSettings):
     """The maximum number of vertex builds to keep in the database."""
     max_vertex_builds_per_vertex: int = 2
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
+    log_writer_flush_interval_ms: int = 500
+    """How often buffered vertex builds and transactions are written to the database, in ms. Each flush
+    inserts everything buffered in a single transaction. Set to 0 to write every record right away."""
+    log_writer_max_batch_size: int = 500
+    """The number of buffered vertex builds and transactions that triggers a flush before the interval elapses."""
+    log_retention_interval: int = 60
+    """How often, in seconds, vertex builds and transactions beyond the configured limits are deleted."""
+    api_key_cache_ttl: int = 0
+    """How long, in seconds, a validated API key and its user are kept in memory before being checked against the
+    database again. 0, the default, checks every request. Deleting a key or updating its user only removes it from
+    the cache of the worker that handled the change, so with several workers a deleted key or a deactivated user
+    can keep working on the other workers for up to this many seconds."""
+    api_key_usage_flush_interval: float = 10.0
+    """How often, in seconds, the API key use counts aggregated in memory are written to the database. Set to 0
+    to write every use immediately."""
     webhook_polling_interval: int = 5000
     """The polling interval for the webhook in ms."""
     fs_flows_polling_interval: int = 10000
@@ -244,6 +292,38 @@ class Settings(BaseSettings):
     Default is 24 hours (86400 seconds). Minimum is 600 seconds (10 minutes)."""
     event_delivery: Literal["polling", "streaming", "direct"] = "polling"
     """How to deliver build events to the frontend. Can be 'polling', 'streaming' or 'direct'."""
+    job_queue_max_size: int = 1000
+    """The number of events a build job can queue for a client before the overflow policy applies.
+    Set to 0 to never bound the queues."""
+    job_queue_overflow_policy: Literal["coalesce", "drop_oldest", "block"] = "coalesce"
+    """What a full build event queue does with new token events. 'coalesce' merges them into the last queued token
+    of the same message, 'drop_oldest' drops the oldest queued token and 'block' pauses the stream until the client
+    catches up. Other events are never dropped."""
+    vertex_scheduling: Literal["layered", "streaming"] = "layered"
+    """How vertices are scheduled when a flow runs. 'layered' waits for every vertex in a layer to finish
+    before starting the next layer, 'streaming' starts each vertex as soon as its own predecessors are built."""
+    graph_template_cache_size: int = 128
+    """The maximum number of compiled flow graphs kept in memory by the run endpoint, keyed by flow version
+    and tweaks. Each run gets a fresh clone of the cached graph. Set to 0 to build the graph on every run."""
+    batch_run_concurrency: int = 1
+    """The maximum number of values of a list `input_value` in a simplified run request that run at the same time.
+    Each value runs on its own clone of the flow graph. The values share the session of the request, so when more
+    than one runs at a time, their messages may reach the chat history out of the order of the list."""
+    use_vertex_build_stats: bool = True
+    """If set to True, the build time of each vertex is recorded per flow, and later runs of the flow start the
+    vertices on the longest expected chain of builds first."""
+    expensive_vertex_build_time: float = 10.0
+    """The 95th percentile build time, in seconds, from which a vertex counts as expensive to build."""
+    max_concurrent_expensive_builds: int = 0
+    """The maximum number of expensive vertices of a run that build at the same time. 0 means no limit."""
+    use_component_registry: bool = True
+    """If set to True, the templates built from the component files are saved to a registry in the config
+    directory, keyed by the hash of each file, the Langflow version and a fingerprint of the Langflow sources and
+    the installed packages. Later starts load unchanged components from the registry instead of building them
+    again."""
+    component_build_workers: int = 0
+    """The number of processes used to build the component files that are missing from the component registry.
+    Set to 0 to build them in the server process."""
     lazy_load_components: bool = False
     """If set to True, Langflow will only partially load components at startup and fully load them on demand.
     This significantly reduces startup time but may cause a slight delay when a component is first used."""
@@ -1,8 +1,21 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import anyio
 from aiofile import async_open
 from loguru import logger
 
-from .service import StorageService
+from .service import STORAGE_CHUNK_SIZE, StorageService
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+PARTIAL_FILE_SUFFIX = ".part"
+
+
+def _is_partial_file(file_name: str) -> bool:
+    return file_name.startswith(".") and file_name.endswith(PARTIAL_FILE_SUFFIX)
 
 
 class LocalStorageService(StorageService):
@@ -67,6 +80,78 @@ class LocalStorageService(StorageService):
         logger.debug(f"File {file_name} retrieved successfully from flow {flow_id}.")
         return content
 
+    async def open_read(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STORAGE_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read a file from the local storage in chunks.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be read.
+            start: The offset of the first byte to read.
+            end: The offset of the last byte to read, inclusive. Reads to the end of the file if None.
+            chunk_size: The maximum size of each chunk.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        file_path = self.data_dir / flow_id / file_name
+        if not await file_path.exists():
+            logger.warning(f"File {file_name} not found in flow {flow_id}.")
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+
+        remaining = None if end is None else end - start + 1
+        async with async_open(str(file_path), "rb") as f:
+            f.seek(start)
+            while remaining is None or remaining > 0:
+                chunk = await f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    async def open_write(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Save a file in the local storage from chunks.
+
+        The chunks are written to a temporary file that replaces the target once all of them are written,
+        so a failed upload never leaves a partial file behind.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be saved.
+            chunks: The content of the file.
+
+        Returns:
+            The number of bytes written.
+        """
+        folder_path = self.data_dir / flow_id
+        await folder_path.mkdir(parents=True, exist_ok=True)
+        file_path = folder_path / file_name
+        partial_path = folder_path / f".{file_name}{PARTIAL_FILE_SUFFIX}"
+
+        size = 0
+        try:
+            async with async_open(str(partial_path), "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+                    size += len(chunk)
+            await partial_path.replace(file_path)
+        except Exception:
+            logger.exception(f"Error saving file {file_name} in flow {flow_id}")
+            raise
+        finally:
+            await partial_path.unlink(missing_ok=True)
+        logger.info(f"File {file_name} saved successfully in flow {flow_id}.")
+        return size
+
     async def list_files(self, flow_id: str):
         """List all files in a specified flow.
 
@@ -90,7 +175,7 @@ class LocalStorageService(StorageService):
         files = [
             file.name
             async for file in await anyio.to_thread.run_sync(folder_path.iterdir)
-            if await anyio.Path(file).is_file()
+            if await anyio.Path(file).is_file() and not _is_partial_file(file.name)
         ]
 
         logger.info(f"Listed {len(files)} files in flow {flow_id}.")
@@ -113,7 +198,7 @@ class LocalStorageService(StorageService):
         """Perform any cleanup operations when the service is being torn down."""
         # No specific teardown actions required for local
 
-    async def get_file_size(self, flow_id: str, file_name: str) -> None:
+    async def get_file_size(self, flow_id: str, file_name: str) -> int:
         """Get the size of a file in the local storage."""
         # Get the file size from the file path
         file_path = self.data_dir / flow_id / file_name
@@ -1,46 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeVar
+
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from loguru import logger
 
-from .service import StorageService
+from .service import STORAGE_CHUNK_SIZE, StorageService
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Callable
+
+T = TypeVar("T")
+
+# S3 requires every part of a multipart upload except the last to be at least 5 MiB.
+MIN_PART_SIZE = 5 * 1024 * 1024
+# The number of parts of one transfer that are sent or fetched at the same time. With the part size, it bounds the
+# memory held by a transfer.
+MAX_PARTS_IN_FLIGHT = 4
 
 
 class S3StorageService(StorageService):
-    """A service class for handling operations with AWS S3 storage."""
+    """A service class for handling operations with AWS S3 storage.
+
+    The S3 client is synchronous, so every request runs in a thread pool of `storage_s3_max_concurrency` threads
+    that share one client and its connection pool. Files larger than one part are uploaded as multipart uploads
+    and downloaded with ranged GETs, with up to `MAX_PARTS_IN_FLIGHT` parts of a file in flight at once.
+    """
 
     def __init__(self, session_service, settings_service) -> None:
         """Initialize the S3 storage service with session and settings services."""
         super().__init__(session_service, settings_service)
-        self.bucket = "langflow"
-        self.s3_client = boto3.client("s3")
+        settings = settings_service.settings
+        self.bucket = settings.storage_s3_bucket
+        self.part_size = max(settings.storage_s3_part_size_mb * 1024 * 1024, MIN_PART_SIZE)
+        self.max_concurrency = settings.storage_s3_max_concurrency
+        self.endpoint_url = settings.storage_s3_endpoint_url
+        # Creating a boto3 client reads configuration files, so it is created in the thread pool on first use.
+        self.s3_client = None
+        self._client_lock = asyncio.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="s3_storage")
         self.set_ready()
 
-    async def save_file(self, folder: str, file_name: str, data) -> None:
+    async def _run(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run a blocking call to the S3 client in the service's thread pool."""
+        await self._get_client()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def _call(self, operation: str, **kwargs: Any) -> Any:
+        """Call an operation of the S3 client on the bucket, such as `await self._call("head_object", Key=key)`."""
+        client = await self._get_client()
+        return await self._run(getattr(client, operation), Bucket=self.bucket, **kwargs)
+
+    async def _get_client(self):
+        if self.s3_client is None:
+            async with self._client_lock:
+                if self.s3_client is None:
+                    loop = asyncio.get_running_loop()
+                    self.s3_client = await loop.run_in_executor(self._executor, self._create_client)
+        return self.s3_client
+
+    def _create_client(self):
+        return boto3.client(
+            "s3",
+            endpoint_url=self.endpoint_url,
+            config=Config(max_pool_connections=self.max_concurrency),
+        )
+
+    async def save_file(self, flow_id: str, file_name: str, data: bytes) -> None:
         """Save a file to the S3 bucket.
 
         Args:
-            folder: The folder in the bucket to save the file.
+            flow_id: The folder in the bucket to save the file.
             file_name: The name of the file to be saved.
             data: The byte content of the file.
 
         Raises:
             Exception: If an error occurs during file saving.
         """
-        try:
-            self.s3_client.put_object(Bucket=self.bucket, Key=f"{folder}/{file_name}", Body=data)
-            logger.info(f"File {file_name} saved successfully in folder {folder}.")
-        except NoCredentialsError:
-            logger.exception("Credentials not available for AWS S3.")
-            raise
-        except ClientError:
-            logger.exception(f"Error saving file {file_name} in folder {folder}")
-            raise
+        await self.open_write(flow_id, file_name, _iter_bytes(data, self.part_size))
 
-    async def get_file(self, folder: str, file_name: str):
+    async def get_file(self, flow_id: str, file_name: str) -> bytes:
         """Retrieve a file from the S3 bucket.
 
+        Files larger than one part are fetched with parallel ranged GETs.
+
         Args:
-            folder: The folder in the bucket where the file is stored.
+            flow_id: The folder in the bucket where the file is stored.
             file_name: The name of the file to be retrieved.
 
         Returns:
@@ -49,19 +101,184 @@ class S3StorageService(StorageService):
         Raises:
             Exception: If an error occurs during file retrieval.
         """
+        key = f"{flow_id}/{file_name}"
         try:
-            response = self.s3_client.get_object(Bucket=self.bucket, Key=f"{folder}/{file_name}")
-            logger.info(f"File {file_name} retrieved successfully from folder {folder}.")
-            return response["Body"].read()
+            size = await self.get_file_size(flow_id, file_name)
+            if size <= self.part_size:
+                content = await self._run(self._get_object, key)
+            else:
+                parts = await asyncio.gather(
+                    *(self._run(self._get_object, key, start, end) for start, end in self._part_ranges(0, size - 1))
+                )
+                content = b"".join(parts)
         except ClientError:
-            logger.exception(f"Error retrieving file {file_name} from folder {folder}")
+            logger.exception(f"Error retrieving file {file_name} from folder {flow_id}")
             raise
+        logger.info(f"File {file_name} retrieved successfully from folder {flow_id}.")
+        return content
+
+    async def open_read(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STORAGE_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read a file from the S3 bucket in chunks.
+
+        The file is fetched one part at a time with ranged GETs, fetching the next parts while the current one
+        is consumed.
+
+        Args:
+            flow_id: The folder in the bucket where the file is stored.
+            file_name: The name of the file to be read.
+            start: The offset of the first byte to read.
+            end: The offset of the last byte to read, inclusive. Reads to the end of the file if None.
+            chunk_size: The maximum size of each chunk.
+
+        Raises:
+            Exception: If an error occurs during file retrieval.
+        """
+        key = f"{flow_id}/{file_name}"
+        if end is None:
+            end = await self.get_file_size(flow_id, file_name) - 1
+        ranges = iter(self._part_ranges(start, end))
+        pending: deque[asyncio.Future[bytes]] = deque()
+        try:
+            for _ in range(MAX_PARTS_IN_FLIGHT):
+                if (part_range := next(ranges, None)) is not None:
+                    pending.append(asyncio.ensure_future(self._run(self._get_object, key, *part_range)))
+            while pending:
+                try:
+                    data = await pending.popleft()
+                except ClientError:
+                    logger.exception(f"Error retrieving file {file_name} from folder {flow_id}")
+                    raise
+                if (part_range := next(ranges, None)) is not None:
+                    pending.append(asyncio.ensure_future(self._run(self._get_object, key, *part_range)))
+                for offset in range(0, len(data), chunk_size):
+                    yield data[offset : offset + chunk_size]
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def open_write(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Save a file to the S3 bucket from chunks.
+
+        Files up to one part are saved with a single request. Larger files are sent as a multipart upload whose
+        parts are uploaded while the next ones are read.
 
-    async def list_files(self, folder: str):
+        Args:
+            flow_id: The folder in the bucket to save the file.
+            file_name: The name of the file to be saved.
+            chunks: The content of the file.
+
+        Returns:
+            The number of bytes written.
+
+        Raises:
+            Exception: If an error occurs during file saving.
+        """
+        try:
+            size = await self._write_chunks(f"{flow_id}/{file_name}", chunks)
+        except NoCredentialsError:
+            logger.exception("Credentials not available for AWS S3.")
+            raise
+        except ClientError:
+            logger.exception(f"Error saving file {file_name} in folder {flow_id}")
+            raise
+        logger.info(f"File {file_name} saved successfully in folder {flow_id}.")
+        return size
+
+    async def _write_chunks(self, key: str, chunks: AsyncIterable[bytes]) -> int:
+        buffer = bytearray()
+        size = 0
+        upload_id = None
+        uploads: list[asyncio.Task[dict]] = []
+        in_flight = asyncio.Semaphore(MAX_PARTS_IN_FLIGHT)
+
+        async def upload_part(data: bytes) -> None:
+            nonlocal upload_id
+            if upload_id is None:
+                response = await self._call("create_multipart_upload", Key=key)
+                upload_id = response["UploadId"]
+            await in_flight.acquire()
+            uploads.append(asyncio.create_task(self._upload_part(key, upload_id, len(uploads) + 1, data, in_flight)))
+
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                size += len(chunk)
+                while len(buffer) > self.part_size:
+                    await upload_part(bytes(buffer[: self.part_size]))
+                    del buffer[: self.part_size]
+
+            if upload_id is None:
+                await self._call("put_object", Key=key, Body=bytes(buffer))
+                return size
+            if buffer:
+                await upload_part(bytes(buffer))
+            parts = await asyncio.gather(*uploads)
+            await self._call(
+                "complete_multipart_upload",
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            for task in uploads:
+                task.cancel()
+            await asyncio.gather(*uploads, return_exceptions=True)
+            # Abort so that S3 does not keep (and bill for) the parts of an upload that will never complete.
+            if upload_id is not None:
+                await self._call("abort_multipart_upload", Key=key, UploadId=upload_id)
+            raise
+        return size
+
+    async def _upload_part(
+        self, key: str, upload_id: str, part_number: int, data: bytes, in_flight: asyncio.Semaphore
+    ) -> dict:
+        try:
+            response = await self._call(
+                "upload_part",
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=data,
+            )
+        finally:
+            in_flight.release()
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
+    def _get_object(self, key: str, start: int | None = None, end: int | None = None) -> bytes:
+        kwargs = {} if start is None else {"Range": f"bytes={start}-{end}"}
+        response = self.s3_client.get_object(Bucket=self.bucket, Key=key, **kwargs)
+        with response["Body"] as body:
+            return body.read()
+
+    def _part_ranges(self, start: int, end: int) -> list[tuple[int, int]]:
+        return [(offset, min(offset + self.part_size, end + 1) - 1) for offset in range(start, end + 1, self.part_size)]
+
+    async def get_file_size(self, flow_id: str, file_name: str) -> int:
+        """Get the size of a file in the S3 bucket.
+
+        Raises:
+            Exception: If an error occurs while reading the file metadata.
+        """
+        try:
+            response = await self._call("head_object", Key=f"{flow_id}/{file_name}")
+        except ClientError:
+            logger.exception(f"Error retrieving the size of file {file_name} from folder {flow_id}")
+            raise
+        return response["ContentLength"]
+
+    async def list_files(self, flow_id: str):
         """List all files in a specified folder of the S3 bucket.
 
         Args:
-            folder: The folder in the bucket to list files from.
+            flow_id: The folder in the bucket to list files from.
 
         Returns:
             A list of file names.
@@ -69,33 +286,49 @@ class S3StorageService(StorageService):
         Raises:
             Exception: If an error occurs during file listing.
         """
+        prefix = f"{flow_id}/"
         try:
-            response = self.s3_client.list_objects_v2(Bucket=self.bucket, Prefix=folder)
+            keys = await self._run(self._list_keys, prefix)
         except ClientError:
-            logger.exception(f"Error listing files in folder {folder}")
+            logger.exception(f"Error listing files in folder {flow_id}")
             raise
 
-        files = [item["Key"] for item in response.get("Contents", []) if "/" not in item["Key"][len(folder) :]]
-        logger.info(f"{len(files)} files listed in folder {folder}.")
+        files = [key[len(prefix) :] for key in keys if "/" not in key[len(prefix) :]]
+        logger.info(f"{len(files)} files listed in folder {flow_id}.")
         return files
 
-    async def delete_file(self, folder: str, file_name: str) -> None:
+    def _list_keys(self, prefix: str) -> list[str]:
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        return [
+            item["Key"]
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix)
+            for item in page.get("Contents", [])
+        ]
+
+    async def delete_file(self, flow_id: str, file_name: str) -> None:
         """Delete a file from the S3 bucket.
 
         Args:
-            folder: The folder in the bucket where the file is stored.
+            flow_id: The folder in the bucket where the file is stored.
             file_name: The name of the file to be deleted.
 
         Raises:
             Exception: If an error occurs during file deletion.
         """
         try:
-            self.s3_client.delete_object(Bucket=self.bucket, Key=f"{folder}/{file_name}")
-            logger.info(f"File {file_name} deleted successfully from folder {folder}.")
+            await self._call("delete_object", Key=f"{flow_id}/{file_name}")
+            logger.info(f"File {file_name} deleted successfully from folder {flow_id}.")
         except ClientError:
-            logger.exception(f"Error deleting file {file_name} from folder {folder}")
+            logger.exception(f"Error deleting file {file_name} from folder {flow_id}")
             raise
 
     async def teardown(self) -> None:
         """Perform any cleanup operations when the service is being torn down."""
-        # No specific teardown actions required for S3 storage at the moment.
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self.s3_client is not None:
+            self.s3_client.close()
+
+
+async def _iter_bytes(data: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), chunk_size):
+        yield data[start : start + chunk_size]
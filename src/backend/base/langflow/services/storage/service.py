@@ -7,7 +7,11 @@ import anyio
 
 from langflow.services.base import Service
 
+STORAGE_CHUNK_SIZE = 1024 * 1024
+
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
 
@@ -35,6 +39,45 @@ class StorageService(Service):
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         raise NotImplementedError
 
+    @abstractmethod
+    def open_read(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STORAGE_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read a file in chunks of at most `chunk_size` bytes.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be read.
+            start: The offset of the first byte to read.
+            end: The offset of the last byte to read, inclusive. Reads to the end of the file if None.
+            chunk_size: The maximum size of each chunk.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def open_write(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Write a file from chunks without holding the whole file in memory.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be saved.
+            chunks: The content of the file.
+
+        Returns:
+            The number of bytes written.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_file_size(self, flow_id: str, file_name: str) -> int:
+        raise NotImplementedError
+
     @abstractmethod
     async def list_files(self, flow_id: str) -> list[str]:
         raise NotImplementedError
@@ -136,6 +136,18 @@ async def teardown_services() -> None:
             await teardown_superuser(get_settings_service(), session)
     except Exception as exc:  # noqa: BLE001
         logger.exception(exc)
+    try:
+        from langflow.services.database.models.api_key.crud import teardown_api_keys
+
+        await teardown_api_keys()
+    except Exception as exc:  # noqa: BLE001
+        logger.exception(exc)
+    try:
+        from langflow.base.data.url_crawler import shutdown_parse_executor
+
+        shutdown_parse_executor()
+    except Exception as exc:  # noqa: BLE001
+        logger.exception(exc)
     try:
         from langflow.services.manager import service_manager
 
@@ -1,4 +1,5 @@
 import abc
+from collections.abc import Sequence
 from uuid import UUID
 
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -35,6 +36,27 @@ class VariableService(Service):
             The value of the variable.
         """
 
+    async def get_variables(self, user_id: UUID | str, names: Sequence[str], session: AsyncSession) -> dict[str, str]:
+        """Async get the values of several variables at once.
+
+        Services that can look up many variables in one query should override this.
+
+        Args:
+            user_id: The user ID.
+            names: The names of the variables.
+            session: The database session.
+
+        Returns:
+            A mapping of variable names to values. Variables that do not exist are left out.
+        """
+        values = {}
+        for name in names:
+            try:
+                values[name] = await self.get_variable(user_id=user_id, name=name, field="", session=session)
+            except ValueError:
+                continue
+        return values
+
     @abc.abstractmethod
     async def list_variables(self, user_id: UUID | str, session: AsyncSession) -> list[str | None]:
         """List all variables.
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from cachetools import TTLCache
+
+from langflow.services.deps import get_variable_service, session_scope
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from uuid import UUID
+
+VARIABLE_CACHE_TTL = 60
+VARIABLE_CACHE_SIZE = 1024
+
+
+class RunVariableCache:
+    """Decrypted variables of one user, shared by every component of a graph run.
+
+    The first lookup loads every variable the graph needs with a single `VariableService.get_variables` call.
+    Values are kept for `ttl` seconds so a long-lived graph picks up variables that change while it runs.
+
+    Args:
+        user_id: The user whose variables are resolved.
+        names: The variable names the graph is expected to need.
+        ttl: How long a resolved value is kept, in seconds.
+    """
+
+    def __init__(self, user_id: UUID, names: Iterable[str] = (), ttl: float = VARIABLE_CACHE_TTL) -> None:
+        self.user_id = user_id
+        self.names = set(names)
+        self._values: TTLCache[str, str | None] = TTLCache(maxsize=VARIABLE_CACHE_SIZE, ttl=ttl)
+        self._lock = asyncio.Lock()
+
+    async def get(self, name: str, field: str) -> str:
+        """Return the value of a variable.
+
+        Raises:
+            ValueError: If the variable does not exist.
+            TypeError: If a credential is used in a session ID field.
+        """
+        if field == "session_id":
+            # Only the service knows the variable type needed to keep credentials out of session IDs.
+            async with session_scope() as session:
+                return await get_variable_service().get_variable(
+                    user_id=self.user_id, name=name, field=field, session=session
+                )
+
+        if name not in self._values:
+            async with self._lock:
+                if name not in self._values:
+                    await self._load({name, *self.names})
+        value = self._values.get(name)
+        if not value:
+            msg = f"{name} variable not found."
+            raise ValueError(msg)
+        return value
+
+    async def _load(self, names: set[str]) -> None:
+        names_to_load = sorted(name for name in names if name not in self._values)
+        async with session_scope() as session:
+            values = await get_variable_service().get_variables(
+                user_id=self.user_id, names=names_to_load, session=session
+            )
+        for name in names_to_load:
+            self._values[name] = values.get(name)
@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 from loguru import logger
-from sqlmodel import select
+from sqlmodel import col, select
 from typing_extensions import override
 
 from langflow.services.auth import utils as auth_utils
@@ -80,6 +80,18 @@ class DatabaseVariableService(VariableService, Service):
         # we decrypt the value
         return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
 
+    @override
+    async def get_variables(self, user_id: UUID | str, names: Sequence[str], session: AsyncSession) -> dict[str, str]:
+        if not names:
+            return {}
+        stmt = select(Variable).where(Variable.user_id == user_id, col(Variable.name).in_(names))
+        variables = (await session.exec(stmt)).all()
+        return {
+            variable.name: auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+            for variable in variables
+            if variable.value
+        }
+
     async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
         stmt = select(Variable).where(Variable.user_id == user_id)
         variables = list((await session.exec(stmt)).all())
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import pickle
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.cache.utils import CACHE_MISS
+
+if TYPE_CHECKING:
+    from diskcache import Cache
+
+    from langflow.services.cache.service import RedisCache
+    from langflow.services.settings.service import SettingsService
+
+REDIS_KEY_PREFIX = "vertex_result:"
+
+
+class VertexCacheService(Service):
+    """Keeps the results of vertex builds between runs, keyed by a hash of everything the build depends on.
+
+    Only components that set `cache_results` use it. Unlike the chat service cache, which holds the results of
+    frozen vertices in memory by vertex ID, the results are stored on disk or in Redis, so they survive restarts
+    and are shared by the workers that use the same backend.
+
+    The disk backend evicts the least recently used results once the cache grows past `vertex_cache_max_size_mb`.
+    The backend is only created on first use.
+    """
+
+    name = "vertex_cache_service"
+
+    def __init__(self, settings_service: SettingsService):
+        self.settings_service = settings_service
+        self.hits = 0
+        self.misses = 0
+        self._disk_cache: Cache | None = None
+        self._redis_cache: RedisCache | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.settings_service.settings.vertex_cache_max_size_mb > 0
+
+    async def get(self, key: str) -> Any:
+        """Returns the result cached for the key, or `CACHE_MISS`."""
+        if not self.enabled:
+            return CACHE_MISS
+        try:
+            if self.settings_service.settings.vertex_cache_type == "redis":
+                value = await self._get_redis_cache().get(REDIS_KEY_PREFIX + key)
+            else:
+                value = await asyncio.to_thread(self._disk_get, key)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug(f"Error reading the vertex result cache for key {key}")
+            value = CACHE_MISS
+        if value is CACHE_MISS:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        """Caches the result for the key. Results that cannot be pickled are not cached."""
+        if not self.enabled:
+            return
+        try:
+            if self.settings_service.settings.vertex_cache_type == "redis":
+                await self._get_redis_cache().set(REDIS_KEY_PREFIX + key, value)
+            else:
+                await asyncio.to_thread(self._disk_set, key, value)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug(f"Error writing the vertex result cache for key {key}")
+
+    def _disk_get(self, key: str) -> Any:
+        pickled = self._get_disk_cache().get(key)
+        return CACHE_MISS if pickled is None else pickle.loads(pickled)  # noqa: S301
+
+    def _disk_set(self, key: str, value: Any) -> None:
+        # Pickle before writing so that a result that cannot be pickled leaves nothing behind.
+        pickled = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._get_disk_cache().set(key, pickled, expire=self.settings_service.settings.vertex_cache_expire)
+
+    def _get_disk_cache(self) -> Cache:
+        if self._disk_cache is None:
+            from diskcache import Cache
+
+            settings = self.settings_service.settings
+            directory = settings.vertex_cache_dir or str(Path(settings.config_dir or ".") / "vertex_cache")
+            self._disk_cache = Cache(
+                directory,
+                size_limit=settings.vertex_cache_max_size_mb * 1024 * 1024,
+                eviction_policy="least-recently-used",
+            )
+        return self._disk_cache
+
+    def _get_redis_cache(self) -> RedisCache:
+        if self._redis_cache is None:
+            from langflow.services.cache.service import RedisCache
+
+            settings = self.settings_service.settings
+            self._redis_cache = RedisCache(
+                host=settings.redis_host,
+                port=settings.redis_port,
+                db=settings.redis_db,
+                url=settings.redis_url,
+                expiration_time=settings.vertex_cache_expire,
+            )
+        return self._redis_cache
+
+    async def teardown(self) -> None:
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
@@ -1,19 +1,145 @@
+from __future__ import annotations
+
+import asyncio
 import gzip
-import json
-from typing import Any
+import hashlib
+import zlib
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-from fastapi import Response
+import orjson
+from fastapi import Request, Response, status
 from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 6
+COMPRESSION_MIN_SIZE = 1024
+STREAM_BATCH_SIZE = 100
+
+
+class EncodedPayload(NamedTuple):
+    """A JSON payload encoded once, together with its compressed variants and the ETag of the uncompressed JSON."""
+
+    etag: str
+    content: bytes
+    gzip: bytes
+    brotli: bytes | None
+
+
+async def compress_response(data: Any) -> Response:
+    """Compress data and return it as a FastAPI Response with appropriate headers.
+
+    Encoding and compression run in a worker thread so that large payloads do not block the event loop.
+    Payloads smaller than `COMPRESSION_MIN_SIZE` bytes are sent uncompressed. Lists longer than
+    `STREAM_BATCH_SIZE` items are encoded and compressed one batch at a time and streamed to the client.
+    """
+    if isinstance(data, list | tuple) and len(data) > STREAM_BATCH_SIZE:
+        return StreamingResponse(
+            _stream_compressed_json_list(data),
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+
+    content, compressed = await asyncio.to_thread(_encode_and_compress, data)
+    headers = {"Vary": "Accept-Encoding", "Content-Length": str(len(content))}
+    if compressed:
+        headers["Content-Encoding"] = "gzip"
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def _dumps(data: Any) -> bytes:
+    return orjson.dumps(jsonable_encoder(data))
+
+
+def _encode_and_compress(data: Any) -> tuple[bytes, bool]:
+    content = _dumps(data)
+    if len(content) < COMPRESSION_MIN_SIZE:
+        return content, False
+    return gzip.compress(content, compresslevel=GZIP_LEVEL), True
 
 
-def compress_response(data: Any) -> Response:
-    """Compress data and return it as a FastAPI Response with appropriate headers."""
-    json_data = json.dumps(jsonable_encoder(data)).encode("utf-8")
+async def _stream_compressed_json_list(items: list | tuple) -> AsyncIterator[bytes]:
+    # wbits=31 makes zlib write a gzip header and trailer around the deflate stream.
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    for start in range(0, len(items), STREAM_BATCH_SIZE):
+        batch = items[start : start + STREAM_BATCH_SIZE]
+        chunk = await asyncio.to_thread(_compress_json_batch, compressor, batch, first=start == 0)
+        if chunk:
+            yield chunk
+    yield compressor.compress(b"]") + compressor.flush()
 
-    compressed_data = gzip.compress(json_data, compresslevel=6)
 
-    return Response(
-        content=compressed_data,
-        media_type="application/json",
-        headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding", "Content-Length": str(len(compressed_data))},
+def _compress_json_batch(compressor: Any, batch: list | tuple, *, first: bool) -> bytes:
+    encoded = b",".join(_dumps(item) for item in batch)
+    return compressor.compress((b"[" if first else b",") + encoded)
+
+
+def encode_payload(data: Any) -> EncodedPayload:
+    """Encode data to JSON and compress it with gzip and, if it is installed, brotli.
+
+    This is CPU bound, so call it from a worker thread for large payloads.
+    """
+    try:
+        content = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        content = orjson.dumps(jsonable_encoder(data))
+    return EncodedPayload(
+        etag=f'"{hashlib.sha256(content).hexdigest()}"',
+        content=content,
+        gzip=gzip.compress(content, compresslevel=GZIP_LEVEL),
+        brotli=_brotli_compress(content),
     )
+
+
+def _brotli_compress(content: bytes) -> bytes | None:
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli.compress(content, quality=BROTLI_QUALITY)
+
+
+def encoded_payload_response(payload: EncodedPayload, request: Request) -> Response:
+    """Return the payload in the best encoding the client accepts, or 304 if the client already has it.
+
+    Each encoding gets its own ETag, the payload ETag with the encoding appended, so a cache never answers
+    a conditional request with bytes in an encoding the client did not ask for.
+    """
+    accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+    content = payload.content
+    encoding = None
+    if payload.brotli is not None and "br" in accepted:
+        content = payload.brotli
+        encoding = "br"
+    elif "gzip" in accepted:
+        content = payload.gzip
+        encoding = "gzip"
+
+    etag = payload.etag if encoding is None else f'{payload.etag[:-1]}-{encoding}"'
+    headers = {"ETag": etag, "Vary": "Accept-Encoding", "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        if params.strip().replace(" ", "") in {"q=0", "q=0.0", "q=0.00", "q=0.000"}:
+            continue
+        if coding:
+            accepted.add(coding.strip().lower())
+    return accepted
@@ -82,6 +82,11 @@ def blockbuster(request):
             for func in ["os.path.abspath", "os.scandir"]:
                 bb.functions[func].can_block_in("alembic/script/base.py", "_load_revisions")
 
+            # The mime types database is read on first use, e.g. when httpx encodes a multipart upload,
+            # unless an import such as a component module has already loaded it.
+            for func in ["os.stat", "io.TextIOWrapper.read"]:
+                bb.functions[func].can_block_in("mimetypes.py", "init")
+
             (
                 bb.functions["os.path.abspath"]
                 .can_block_in("loguru/_better_exceptions.py", {"_get_lib_dirs", "_format_exception"})
@@ -1,6 +1,8 @@
 from unittest.mock import patch
 
-from langflow.api.utils import get_suggestion_message
+import pytest
+from fastapi import HTTPException
+from langflow.api.utils import get_suggestion_message, parse_range_header
 from langflow.services.database.models.flow.utils import get_outdated_components
 from langflow.utils.version import get_version_info
 
@@ -43,3 +45,30 @@ def test_get_outdated_components():
         result = get_outdated_components(flow)
         # Assert the result is as expected
         assert result == expected_outdated_components
+
+
+@pytest.mark.parametrize(
+    ("range_header", "expected"),
+    [
+        (None, None),
+        ("bytes=0-9", (0, 9)),
+        ("bytes=10-", (10, 99)),
+        ("bytes=90-200", (90, 99)),
+        ("bytes=-10", (90, 99)),
+        ("bytes=-200", (0, 99)),
+        ("bytes=0-1,5-6", None),
+        ("bytes=9-0", None),
+        ("items=0-9", None),
+        ("bytes=a-b", None),
+    ],
+)
+def test_parse_range_header(range_header, expected):
+    assert parse_range_header(range_header, 100) == expected
+
+
+def test_parse_range_header_not_satisfiable():
+    with pytest.raises(HTTPException) as exc_info:
+        parse_range_header("bytes=100-", 100)
+
+    assert exc_info.value.status_code == 416
+    assert exc_info.value.headers == {"Content-Range": "bytes */100"}
@@ -1,5 +1,8 @@
 from fastapi import status
 from httpx import AsyncClient
+from langflow.services.database.models.api_key import crud
+from langflow.services.database.models.api_key.crud import flush_api_key_usage
+from langflow.services.deps import get_settings_service
 
 
 async def test_create_folder(client: AsyncClient, logged_in_headers):
@@ -62,3 +65,28 @@ async def test_save_store_api_key(client: AsyncClient, logged_in_headers):
     assert response.status_code == status.HTTP_200_OK
     assert isinstance(result, dict), "The result must be a dictionary"
     assert "detail" in result, "The dictionary must contain a key called 'detail'"
+
+
+async def test_api_key_is_cached_until_deleted(client: AsyncClient, logged_in_headers, monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "api_key_cache_ttl", 60)
+    response = await client.post("api/v1/api_key/", json={"name": "cached"}, headers=logged_in_headers)
+    api_key = response.json()
+    headers = {"x-api-key": api_key["api_key"]}
+
+    for _ in range(2):
+        response = await client.get("api/v1/api_key/", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+    assert api_key["api_key"] in crud._api_key_cache
+
+    await flush_api_key_usage()
+    response = await client.get("api/v1/api_key/", headers=logged_in_headers)
+    stored = next(key for key in response.json()["api_keys"] if key["id"] == api_key["id"])
+    assert stored["total_uses"] == 2
+    assert stored["last_used_at"] is not None
+
+    response = await client.delete(f"api/v1/api_key/{api_key['id']}", headers=logged_in_headers)
+    assert response.status_code == status.HTTP_200_OK
+
+    assert api_key["api_key"] not in crud._api_key_cache
+    response = await client.get("api/v1/api_key/", headers=headers)
+    assert response.status_code == status.HTTP_403_FORBIDDEN
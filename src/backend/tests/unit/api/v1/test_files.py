@@ -5,6 +5,7 @@ import tempfile
 from contextlib import suppress
 from io import BytesIO
 from pathlib import Path
+from unittest.mock import Mock
 
 # we need to import tmpdir
 import anyio
@@ -18,10 +19,14 @@ from langflow.services.database.models.flow.model import Flow, FlowCreate
 from langflow.services.database.models.user.model import User, UserRead
 from langflow.services.database.utils import session_getter
 from langflow.services.deps import get_db_service
+from langflow.services.manager import service_manager
+from langflow.services.schema import ServiceType
+from langflow.services.storage.s3 import S3StorageService
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
 from tests.conftest import _delete_transactions_and_vertex_builds
+from tests.unit.services.storage.test_s3 import FakeS3Client
 
 
 @pytest.fixture(name="files_created_api_key")
@@ -111,6 +116,21 @@ def max_file_size_upload_10mb_fixture(monkeypatch):
     monkeypatch.undo()
 
 
+@pytest.fixture
+async def s3_storage_service(files_client, monkeypatch, tmp_path):  # noqa: ARG001
+    settings_service = Mock()
+    settings_service.settings.config_dir = str(tmp_path)
+    settings_service.settings.storage_s3_bucket = "bucket"
+    settings_service.settings.storage_s3_endpoint_url = "http://localhost:9000"
+    settings_service.settings.storage_s3_max_concurrency = 4
+    settings_service.settings.storage_s3_part_size_mb = 5
+    service = S3StorageService(Mock(), settings_service)
+    service.s3_client = FakeS3Client()
+    monkeypatch.setitem(service_manager.services, ServiceType.STORAGE_SERVICE, service)
+    yield service
+    await service.teardown()
+
+
 @pytest.fixture(name="files_client")
 async def files_client_fixture(
     monkeypatch,
@@ -286,3 +306,65 @@ async def test_upload_file_size_limit(files_client, files_created_api_key, files
 
     assert response.status_code == 413, f"Expected 413, got {response.status_code}: {response.json()}"
     assert "Content size limit exceeded. Maximum allowed is 1MB and got 1.001MB." in response.json()["detail"]
+
+
+async def test_download_file_range(files_client, files_created_api_key, files_flow):
+    headers = {"x-api-key": files_created_api_key.api_key}
+    response = await files_client.post(
+        f"api/v1/files/upload/{files_flow.id}",
+        files={"file": ("test.txt", b"0123456789")},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    file_name = response.json()["file_path"].split("/")[-1]
+    url = f"api/v1/files/download/{files_flow.id}/{file_name}"
+
+    response = await files_client.get(url, headers={**headers, "Range": "bytes=2-5"})
+    assert response.status_code == 206
+    assert response.content == b"2345"
+    assert response.headers["content-range"] == "bytes 2-5/10"
+    assert response.headers["content-length"] == "4"
+
+    response = await files_client.get(url, headers={**headers, "Range": "bytes=-3"})
+    assert response.status_code == 206
+    assert response.content == b"789"
+
+    response = await files_client.get(url, headers={**headers, "Range": "bytes=10-"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */10"
+
+    response = await files_client.get(url, headers=headers)
+    assert response.status_code == 200
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.content == b"0123456789"
+
+
+async def test_file_operations_with_s3_storage(files_client, files_created_api_key, files_flow, s3_storage_service):
+    headers = {"x-api-key": files_created_api_key.api_key}
+
+    response = await files_client.post(
+        f"api/v1/files/upload/{files_flow.id}",
+        files={"file": ("test.txt", b"Hello, S3!")},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    file_name = response.json()["file_path"].split("/")[-1]
+    assert s3_storage_service.s3_client.objects[f"{files_flow.id}/{file_name}"] == b"Hello, S3!"
+
+    response = await files_client.get(f"api/v1/files/list/{files_flow.id}", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["files"] == [file_name]
+
+    response = await files_client.get(f"api/v1/files/download/{files_flow.id}/{file_name}", headers=headers)
+    assert response.status_code == 200
+    assert response.content == b"Hello, S3!"
+
+    response = await files_client.get(
+        f"api/v1/files/download/{files_flow.id}/{file_name}", headers={**headers, "Range": "bytes=7-"}
+    )
+    assert response.status_code == 206
+    assert response.content == b"S3!"
+
+    response = await files_client.delete(f"api/v1/files/delete/{files_flow.id}/{file_name}", headers=headers)
+    assert response.status_code == 200
+    assert not s3_storage_service.s3_client.objects
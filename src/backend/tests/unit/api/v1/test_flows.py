@@ -4,7 +4,11 @@ import uuid
 from anyio import Path
 from fastapi import status
 from httpx import AsyncClient
+from langflow.api.v1.mcp import handle_list_tools
+from langflow.base.mcp.util import get_flow_snake_case
 from langflow.services.database.models import Flow
+from langflow.services.deps import session_scope
+from sqlmodel import select
 
 
 async def test_create_flow(client: AsyncClient, logged_in_headers):
@@ -67,6 +71,86 @@ async def test_read_flows(client: AsyncClient, logged_in_headers):
     assert isinstance(result, list), "The result must be a list"
 
 
+async def test_read_flow_headers(client: AsyncClient, logged_in_headers):
+    chat_input = {
+        "id": "ChatInput-abc12",
+        "data": {"node": {"template": {"input_value": {"show": True, "type": "str", "info": "Message"}}}},
+    }
+    flow_case = {"name": "header_flow", "data": {"nodes": [chat_input], "edges": []}, "is_component": False}
+    component_case = {"name": "header_component", "data": {"nodes": [chat_input], "edges": []}, "is_component": True}
+    for case in (flow_case, component_case):
+        response = await client.post("api/v1/flows/", json=case, headers=logged_in_headers)
+        assert response.status_code == status.HTTP_201_CREATED
+
+    params = {"get_all": True, "header_flows": True}
+    response = await client.get("api/v1/flows/", params=params, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_200_OK
+    headers = {header["name"]: header for header in response.json()}
+    assert "updated_at" not in headers["header_flow"]
+    assert headers["header_flow"]["data"] is None
+    assert headers["header_component"]["data"] == component_case["data"]
+
+    async with session_scope() as session:
+        flow = (await session.exec(select(Flow).where(Flow.name == "header_flow"))).one()
+    assert flow.input_schema == {
+        "type": "object",
+        "properties": {"input_value": {"type": "string", "description": "Message"}},
+        "required": [],
+    }
+
+
+async def test_flow_mcp_tool_name(client: AsyncClient, logged_in_headers, active_user):
+    flow_case = {"name": "My Tool Flow", "data": {"nodes": [], "edges": []}}
+    response = await client.post("api/v1/flows/", json=flow_case, headers=logged_in_headers)
+    flow_id = response.json()["id"]
+    response = await client.patch(f"api/v1/flows/{flow_id}", json={"name": "Renamed Tool"}, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_200_OK
+
+    async with session_scope() as session:
+        assert await get_flow_snake_case("my_tool_flow", active_user.id, session) is None
+        flow = await get_flow_snake_case("renamed_tool", active_user.id, session)
+    assert str(flow.id) == flow_id
+
+    # Names that differ only in case or spacing get a numeric suffix, as in the migration
+    flow_case = {"name": "renamed  tool", "data": {"nodes": [], "edges": []}}
+    response = await client.post("api/v1/flows/", json=flow_case, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_201_CREATED
+    flow_ids = {"renamed_tool": flow_id, "renamed_tool_2": response.json()["id"]}
+
+    flows = [{"name": name, "data": {"nodes": [], "edges": []}} for name in ["Renamed TOOL", "renamed tool "]]
+    response = await client.post("api/v1/flows/batch/", json={"flows": flows}, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_201_CREATED
+    flow_ids.update(renamed_tool_3=response.json()[0]["id"], renamed_tool_4=response.json()[1]["id"])
+
+    # Renaming a flow to a name with its own tool name keeps it
+    response = await client.patch(f"api/v1/flows/{flow_id}", json={"name": "Renamed  Tool"}, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_200_OK
+
+    async with session_scope() as session:
+        for mcp_tool_name, expected_id in flow_ids.items():
+            flow = await get_flow_snake_case(mcp_tool_name, active_user.id, session)
+            assert str(flow.id) == expected_id
+
+
+async def test_list_mcp_tools_skips_flows_without_tool_name(client: AsyncClient, logged_in_headers):
+    flow_ids = []
+    for name in ["Listed Tool", "Unnamed Tool"]:
+        response = await client.post(
+            "api/v1/flows/", json={"name": name, "data": {"nodes": [], "edges": []}}, headers=logged_in_headers
+        )
+        flow_ids.append(uuid.UUID(response.json()["id"]))
+    async with session_scope() as session:
+        flow = await session.get(Flow, flow_ids[1])
+        flow.mcp_tool_name = None
+        session.add(flow)
+
+    tool_names = [tool.name for tool in await handle_list_tools()]
+
+    assert "listed_tool" in tool_names
+    assert "unnamed_tool" not in tool_names
+    assert None not in tool_names
+
+
 async def test_read_flow(client: AsyncClient, logged_in_headers):
     basic_case = {
         "name": "string",
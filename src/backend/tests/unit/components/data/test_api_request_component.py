@@ -250,6 +250,19 @@ class TestAPIRequestComponent(ComponentTestBaseWithoutClient):
             assert isinstance(data_result, list)
             assert all(isinstance(item, Data) for item in data_result)
 
+    @respx.mock
+    async def test_make_requests_uses_shared_client(self, component):
+        urls = [f"https://example.com/api/test/{i}" for i in range(3)]
+        for i, url in enumerate(urls):
+            respx.get(url).mock(return_value=Response(200, json={"index": i}))
+        component.urls = urls
+        component.query_params = None
+
+        results = await component.make_requests()
+
+        assert [result.data["result"] for result in results] == [{"index": i} for i in range(3)]
+        assert component.http_client is component.http_client
+
     async def test_invalid_urls(self, component):
         # Test invalid URL handling
         component.urls = ["not_a_valid_url"]
@@ -1,8 +1,10 @@
+import asyncio
 from unittest.mock import Mock, patch
 
 import pytest
 import respx
 from httpx import Response
+from langflow.base.data import url_crawler
 from langflow.components.data import URLComponent
 from langflow.schema import DataFrame, Message
 
@@ -42,7 +44,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         with patch("langchain_community.document_loaders.RecursiveUrlLoader.load") as mock:
             yield mock
 
-    def test_recursive_url_component(self, mock_recursive_loader):
+    async def test_recursive_url_component(self, mock_recursive_loader):
         """Test basic URLComponent functionality."""
         component = URLComponent()
         component.set_attributes({"urls": ["https://example.com"], "max_depth": 2})
@@ -51,12 +53,12 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
             Mock(page_content="test content", metadata={"source": "https://example.com"})
         ]
 
-        data_ = component.fetch_content()
+        data_ = await component.fetch_content()
         assert all(value.data for value in data_)
         assert all(value.text for value in data_)
         assert all(value.source for value in data_)
 
-    def test_recursive_url_component_as_dataframe(self, mock_recursive_loader):
+    async def test_recursive_url_component_as_dataframe(self, mock_recursive_loader):
         """Test URLComponent's as_dataframe method."""
         component = URLComponent()
         urls = ["https://example1.com", "https://example2.com"]
@@ -69,7 +71,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         ]
 
         # Test as_dataframe
-        data_frame = component.as_dataframe()
+        data_frame = await component.as_dataframe()
         assert isinstance(data_frame, DataFrame), "Expected DataFrame instance"
         assert len(data_frame) == 4
 
@@ -87,7 +89,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         assert data_frame.iloc[3]["text"] == "content2"
         assert data_frame.iloc[3]["source"] == urls[1]
 
-    def test_recursive_url_component_fetch_content_text(self, mock_recursive_loader):
+    async def test_recursive_url_component_fetch_content_text(self, mock_recursive_loader):
         """Test URLComponent's fetch_content_text method."""
         component = URLComponent()
         component.set_attributes({"urls": ["https://example.com"], "max_depth": 1})
@@ -97,7 +99,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         ]
 
         # Test fetch_content_text
-        message = component.fetch_content_text()
+        message = await component.fetch_content_text()
         assert isinstance(message, Message), "Expected Message instance"
         assert message.text == "test content"
 
@@ -115,7 +117,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         fixed_url = component.ensure_url(url)
         assert fixed_url == "http://example.com"
 
-    def test_recursive_url_component_multiple_urls(self, mock_recursive_loader):
+    async def test_recursive_url_component_multiple_urls(self, mock_recursive_loader):
         """Test URLComponent with multiple URLs."""
         component = URLComponent()
         urls = ["https://example1.com", "https://example2.com", "https://example3.com"]
@@ -127,7 +129,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         ]
 
         # Test fetch_content
-        content = component.fetch_content()
+        content = await component.fetch_content()
         assert len(content) == 3, f"Expected 3 content items, got {len(content)}"
 
         for i, item in enumerate(content):
@@ -135,7 +137,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
             assert item.text == f"content{i + 1}"
 
     @patch("langflow.components.data.URLComponent.ensure_url")
-    def test_recursive_url_component_error_handling(self, mock_recursive_loader):
+    async def test_recursive_url_component_error_handling(self, mock_recursive_loader):
         """Test error handling in URLComponent."""
         component = URLComponent()
         component.set_attributes({"urls": ["https://example.com"]})
@@ -145,9 +147,9 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
 
         # Test that exceptions are properly handled
         with pytest.raises(ValueError, match="Error loading documents: Connection error"):
-            component.fetch_content()
+            await component.fetch_content()
 
-    def test_recursive_url_component_format_options(self, mock_recursive_loader):
+    async def test_recursive_url_component_format_options(self, mock_recursive_loader):
         """Test URLComponent with different format options."""
         component = URLComponent()
 
@@ -156,7 +158,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         mock_recursive_loader.return_value = [
             Mock(page_content="extracted text", metadata={"source": "https://example.com"})
         ]
-        content_text = component.fetch_content()
+        content_text = await component.fetch_content()
         assert content_text[0].text == "extracted text"
 
         # Test with Raw HTML format
@@ -164,7 +166,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         mock_recursive_loader.return_value = [
             Mock(page_content="<html>raw html</html>", metadata={"source": "https://example.com"})
         ]
-        content_html = component.fetch_content()
+        content_html = await component.fetch_content()
         assert content_html[0].text == "<html>raw html</html>"
 
     @respx.mock
@@ -178,6 +180,108 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
 
         mock_recursive_loader.return_value = [Mock(page_content="test content", metadata={"source": url})]
 
-        result = component.fetch_content()
+        result = await component.fetch_content()
         assert len(result) == 1
         assert result[0].source == url
+
+    @respx.mock
+    async def test_concurrent_crawl_fetches_each_page_once(self):
+        """Test that pages linked from several root URLs are only fetched once."""
+        pages = {
+            "https://example.com/docs/": '<a href="/docs/intro">Intro</a><a href="/docs/page#usage">Page</a>',
+            "https://example.com/docs/intro": '<a href="/docs/page">Page</a><a href="https://other.com/docs/">Other</a>',
+            "https://example.com/docs/page": '<html lang="en"><title>Page</title><a href="/docs/deeper">Deeper</a>',
+        }
+        routes = {url: respx.get(url).mock(return_value=Response(200, html=html)) for url, html in pages.items()}
+        outside_route = respx.get(url__startswith="https://other.com").mock(return_value=Response(200))
+        deeper_route = respx.get("https://example.com/docs/deeper").mock(return_value=Response(200))
+
+        component = URLComponent()
+        component.set_attributes(
+            {
+                "urls": ["https://example.com/docs/", "https://example.com/docs/intro"],
+                "max_depth": 2,
+                "concurrent_crawl": True,
+            }
+        )
+        data = await component.fetch_content()
+
+        assert sorted(item.source for item in data) == sorted(pages)
+        assert all(route.call_count == 1 for route in routes.values())
+        assert not outside_route.called
+        assert not deeper_route.called
+        page = next(item for item in data if item.source == "https://example.com/docs/page")
+        assert page.title == "Page"
+        assert page.language == "en"
+        assert page.text == "PageDeeper"
+
+    @respx.mock
+    async def test_concurrent_crawl_limits_requests_per_domain(self):
+        """Test that no more than max_concurrency_per_domain requests run against one domain at a time."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def respond(_request):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Response(200, html="<p>content</p>")
+
+        respx.get(url__startswith="https://example.com").mock(side_effect=respond)
+        urls = [f"https://example.com/page{i}" for i in range(8)]
+
+        component = URLComponent()
+        component.set_attributes(
+            {
+                "urls": urls,
+                "concurrent_crawl": True,
+                "max_concurrency": 8,
+                "max_concurrency_per_domain": 2,
+            }
+        )
+        data = await component.fetch_content()
+
+        assert len(data) == len(urls)
+        assert max_in_flight == 2
+
+    @respx.mock
+    async def test_concurrent_crawl_skips_failed_pages(self):
+        """Test that pages that respond with an error do not fail the crawl."""
+        respx.get("https://example.com/ok").mock(return_value=Response(200, html="<p>ok</p>"))
+        respx.get("https://example.com/missing").mock(return_value=Response(404, html="<p>not found</p>"))
+
+        component = URLComponent()
+        component.set_attributes(
+            {
+                "urls": ["https://example.com/ok", "https://example.com/missing"],
+                "concurrent_crawl": True,
+                "format": "HTML",
+            }
+        )
+        data = await component.fetch_content()
+
+        assert len(data) == 1
+        assert data[0].source == "https://example.com/ok"
+        assert data[0].text == "<p>ok</p>"
+
+    @respx.mock
+    async def test_concurrent_crawls_share_one_parse_pool(self):
+        """Test that crawls reuse the same parse pool until it is shut down."""
+        respx.get("https://example.com/page").mock(return_value=Response(200, html="<p>content</p>"))
+        component = URLComponent()
+        component.set_attributes({"urls": ["https://example.com/page"], "concurrent_crawl": True})
+
+        await component.fetch_content()
+        executor = url_crawler._parse_executor
+        await component.fetch_content()
+
+        assert executor is not None
+        assert url_crawler._parse_executor is executor
+
+        url_crawler.shutdown_parse_executor()
+        assert url_crawler._parse_executor is None
+        data = await component.fetch_content()
+        assert data[0].text == "content"
+        assert url_crawler._parse_executor not in {None, executor}
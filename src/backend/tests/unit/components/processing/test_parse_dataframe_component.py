@@ -140,3 +140,10 @@ class TestParseDataFrameComponent(ComponentTestBaseWithoutClient):
         assert len(result.text) > 0
         # Optionally, you can assert the result includes a substring from the middle
         assert "Row5000" in result.text
+
+    def test_mixed_column_types(self, component_class):
+        """Test that every column keeps its own type when the columns have different types."""
+        test_dataframe = DataFrame({"count": [1, 2], "ratio": [0.5, 1.5]})
+        component = component_class(df=test_dataframe, template="{count}: {ratio:.1f}", sep=", ")
+        result = component.parse_data()
+        assert result.text == "1: 0.5, 2: 1.5"
@@ -247,11 +247,11 @@ class TestSplitTextComponent(ComponentTestBaseWithoutClient):
         assert "Another text" in results[2].text, f"Expected 'Another text', got '{results[2].text}'"
         assert "Another line" in results[3].text, f"Expected 'Another line', got '{results[3].text}'"
 
-    def test_with_url_loader(self):
+    async def test_with_url_loader(self):
         """Test splitting text with URL loader."""
         component = SplitTextComponent()
         url = ["https://en.wikipedia.org/wiki/London", "https://en.wikipedia.org/wiki/Paris"]
-        data_frame = URLComponent(urls=url, format="Text").as_dataframe()
+        data_frame = await URLComponent(urls=url, format="Text").as_dataframe()
         assert isinstance(data_frame, DataFrame), "Expected DataFrame instance"
         assert len(data_frame) == 2, f"Expected DataFrame with 2 rows, got {len(data_frame)}"
         component.set_attributes(
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import time
 from typing import Any
 from unittest.mock import MagicMock
@@ -252,3 +253,38 @@ async def test_component_streaming_message():
             tokens.append(event)
 
     assert len(tokens) > 0
+
+
+async def test_component_stream_message_joins_chunks_once():
+    """Test that streaming sends the first chunk as the message and joins every chunk at the end."""
+    queue = asyncio.Queue()
+    event_manager = EventManager(queue)
+    event_manager.register_event("on_message", "message")
+    event_manager.register_event("on_token", "token")
+
+    component = ComponentForTesting()
+    component.set_event_manager(event_manager)
+
+    class StreamChunk:
+        def __init__(self, content: str):
+            self.content = content
+
+    async def text_generator():
+        for i in range(1000):
+            yield StreamChunk(f"{i} ")
+
+    message = Message(
+        id=str(uuid4()), sender="test_sender", sender_name="test_sender_name", session_id="test_session", text=""
+    )
+
+    complete_message = await component._stream_message(text_generator(), message)
+
+    assert complete_message == "".join(f"{i} " for i in range(1000))
+    assert message.text == ""
+    events = []
+    while not queue.empty():
+        _, event_data, _ = queue.get_nowait()
+        events.append(json.loads(event_data))
+    assert events[0]["event"] == "message"
+    assert events[0]["data"]["text"] == "0 "
+    assert "".join(event["data"]["chunk"] for event in events if event["event"] == "token") == complete_message
@@ -0,0 +1,96 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from langflow.custom.directory_reader.registry import ComponentRegistry
+from langflow.custom.directory_reader.utils import abuild_custom_component_list_from_path
+
+COMPONENT_CODE = """
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class EchoComponent(Component):
+    display_name = "Echo"
+    inputs = [MessageTextInput(name="input_value", display_name="Input")]
+    outputs = [Output(display_name="Message", name="message", method="echo")]
+
+    def echo(self) -> Message:
+        return Message(text=self.input_value)
+"""
+
+
+def _write_component(components_path: Path, code: str) -> None:
+    category_path = components_path / "echo"
+    category_path.mkdir(parents=True, exist_ok=True)
+    (category_path / "echo_component.py").write_text(code, encoding="utf-8")
+
+
+@pytest.fixture
+def components_path(tmp_path: Path) -> Path:
+    components_path = tmp_path / "components"
+    _write_component(components_path, COMPONENT_CODE)
+    return components_path
+
+
+async def _load_registry(registry_path: Path) -> ComponentRegistry:
+    registry = ComponentRegistry(registry_path)
+    await asyncio.to_thread(registry.load)
+    return registry
+
+
+async def test_component_registry_reuses_unchanged_files(tmp_path: Path, components_path: Path):
+    registry_path = tmp_path / "registry.json"
+
+    registry = await _load_registry(registry_path)
+    built = await abuild_custom_component_list_from_path(str(components_path), registry)
+    await asyncio.to_thread(registry.save)
+    assert (registry.hits, registry.misses) == (0, 1)
+    assert built["echo"]["EchoComponent"]["display_name"] == "Echo"
+
+    registry = await _load_registry(registry_path)
+    loaded = await abuild_custom_component_list_from_path(str(components_path), registry)
+    assert (registry.hits, registry.misses) == (1, 0)
+    assert loaded == built
+    assert loaded == await abuild_custom_component_list_from_path(str(components_path))
+
+
+async def test_component_registry_rebuilds_changed_files(tmp_path: Path, components_path: Path):
+    registry_path = tmp_path / "registry.json"
+    registry = ComponentRegistry(registry_path)
+    await abuild_custom_component_list_from_path(str(components_path), registry)
+    await asyncio.to_thread(registry.save)
+
+    await asyncio.to_thread(_write_component, components_path, COMPONENT_CODE.replace('"Echo"', '"Echo 2"'))
+    registry = await _load_registry(registry_path)
+    built = await abuild_custom_component_list_from_path(str(components_path), registry)
+
+    assert (registry.hits, registry.misses) == (0, 1)
+    assert built["echo"]["EchoComponent"]["display_name"] == "Echo 2"
+
+
+async def test_component_registry_ignores_other_versions(tmp_path: Path, components_path: Path):
+    registry_path = tmp_path / "registry.json"
+    registry = ComponentRegistry(registry_path)
+    await abuild_custom_component_list_from_path(str(components_path), registry)
+    registry.version = "0.0.0"
+    await asyncio.to_thread(registry.save)
+
+    registry = await _load_registry(registry_path)
+    await abuild_custom_component_list_from_path(str(components_path), registry)
+
+    assert (registry.hits, registry.misses) == (0, 1)
+
+
+async def test_component_registry_ignores_other_environments(tmp_path: Path, components_path: Path):
+    registry_path = tmp_path / "registry.json"
+    registry = ComponentRegistry(registry_path)
+    await abuild_custom_component_list_from_path(str(components_path), registry)
+    registry.fingerprint = "other-dependencies"
+    await asyncio.to_thread(registry.save)
+
+    registry = await _load_registry(registry_path)
+    await abuild_custom_component_list_from_path(str(components_path), registry)
+
+    assert (registry.hits, registry.misses) == (0, 1)
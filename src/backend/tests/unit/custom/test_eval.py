@@ -0,0 +1,52 @@
+import pytest
+from langflow.custom.eval import clear_component_class_cache, component_class_cache_info, eval_custom_component_code
+
+COMPONENT_CODE = """
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class EchoComponent(Component):
+    display_name = "Echo"
+    inputs = [MessageTextInput(name="input_value", display_name="Input")]
+    outputs = [Output(display_name="Message", name="message", method="echo")]
+
+    def echo(self) -> Message:
+        return Message(text=self.input_value)
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_class_cache():
+    clear_component_class_cache()
+    yield
+    clear_component_class_cache()
+
+
+def test_eval_custom_component_code_reuses_compiled_class():
+    first = eval_custom_component_code(COMPONENT_CODE)
+    second = eval_custom_component_code(COMPONENT_CODE)
+
+    assert first is second
+    assert first.__name__ == "EchoComponent"
+    info = component_class_cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.currsize == 1
+
+
+def test_eval_custom_component_code_compiles_changed_code():
+    first = eval_custom_component_code(COMPONENT_CODE)
+    second = eval_custom_component_code(COMPONENT_CODE.replace('"Echo"', '"Echo 2"'))
+
+    assert first is not second
+    assert second.display_name == "Echo 2"
+    assert component_class_cache_info().misses == 2
+
+
+def test_eval_custom_component_code_does_not_cache_errors():
+    with pytest.raises(ValueError, match="Invalid Python code"):
+        eval_custom_component_code("class Broken(Component:\n    pass")
+
+    assert component_class_cache_info().currsize == 0
@@ -1,5 +1,6 @@
 import asyncio
 import json
+import threading
 import time
 import uuid
 
@@ -210,3 +211,93 @@ class TestEventManager:
         # Accessing a non-registered event callback should return the 'noop' function
         callback = event_manager.on_non_existing_event
         assert callback.__name__ == "noop"
+
+    # Buffering token chunks per message and flushing them before other events
+    async def test_token_chunks_are_sent_as_one_event_before_other_events(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_token", "token")
+        manager.register_event("on_end", "end")
+
+        for chunk in ["Hel", "lo"]:
+            manager.on_token(data={"chunk": chunk, "id": "message"})
+        assert queue.empty()
+        assert manager.is_native_event("on_token")
+
+        manager.on_end(data={})
+        _, token_data, _ = queue.get_nowait()
+        _, end_data, _ = queue.get_nowait()
+        token_event = json.loads(token_data)
+        assert token_event["event"] == "token"
+        assert token_event["data"]["chunk"] == "Hello"
+        assert token_event["data"]["id"] == "message"
+        assert json.loads(end_data)["event"] == "end"
+
+    # Flushing buffered token chunks once the flush interval has passed
+    async def test_token_chunks_are_flushed_after_interval(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue, token_flush_interval=0.01)
+        manager.register_event("on_token", "token")
+
+        manager.on_token(data={"chunk": "Hello", "id": "message"})
+        _, token_data, _ = await asyncio.wait_for(queue.get(), timeout=1)
+        assert json.loads(token_data)["data"]["chunk"] == "Hello"
+
+    # Flushing buffered token chunks once enough bytes are buffered
+    def test_token_chunks_are_flushed_after_byte_limit(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue, token_flush_bytes=4)
+        manager.register_event("on_token", "token")
+
+        manager.on_token(data={"chunk": "He", "id": "message"})
+        assert queue.empty()
+        manager.on_token(data={"chunk": "llo", "id": "message"})
+        _, token_data, _ = queue.get_nowait()
+        assert json.loads(token_data)["data"]["chunk"] == "Hello"
+
+    # Custom token callbacks are not native events
+    def test_custom_token_callback_is_not_native(self):
+        def mock_callback(manager, event_type, data):
+            pass
+
+        manager = EventManager(asyncio.Queue())
+        manager.register_event("on_token", "token", mock_callback)
+        assert not manager.is_native_event("on_token")
+
+    # Events sent from a worker thread are handed to the event loop in order
+    async def test_events_from_worker_thread_run_on_the_event_loop(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_token", "token")
+        manager.register_event("on_message", "add_message")
+        loop_thread = threading.get_ident()
+        put_threads = []
+        put_event = manager._put_event
+
+        def record_put_event(event_type, jsonable_data):
+            put_threads.append(threading.get_ident())
+            put_event(event_type, jsonable_data)
+
+        manager._put_event = record_put_event
+        manager.on_token(data={"chunk": "Hello", "id": "message"})
+        await asyncio.to_thread(manager.on_message, data={"text": "done"})
+        manager.on_token(data={"chunk": "Bye", "id": "message"})
+        await asyncio.to_thread(manager.flush_tokens)
+
+        assert put_threads == [loop_thread] * 3
+        events = [json.loads(queue.get_nowait()[1])["event"] for _ in range(queue.qsize())]
+        assert events == ["token", "add_message", "token"]
+
+    # Events whose data orjson cannot encode on its own are still sent
+    def test_send_event_with_non_string_keys_and_big_integers(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_test_event", "test_type")
+
+        manager.on_test_event(data={1: "one", None: "none"})
+        manager.on_test_event(data={"big": 2**64})
+
+        _, non_str_keys_data, _ = queue.get_nowait()
+        _, big_integer_data, _ = queue.get_nowait()
+        assert json.loads(non_str_keys_data)["data"] == {"1": "one", "null": "none"}
+        assert json.loads(big_integer_data)["data"] == {"big": 2**64}
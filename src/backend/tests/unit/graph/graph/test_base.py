@@ -136,3 +136,27 @@ def test_graph_set_with_valid_component():
     tool = YfinanceToolComponent()
     tool_calling_agent = ToolCallingAgentComponent()
     tool_calling_agent.set(tools=[tool])
+
+
+def test_graph_edge_index_follows_vertex_removal():
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+    graph.prepare()
+
+    input_vertex = graph.get_vertex("chat_input")
+    output_vertex = graph.get_vertex("chat_output")
+    assert input_vertex.outgoing_edges == output_vertex.incoming_edges == graph.edges
+    assert input_vertex.incoming_edges == []
+    assert graph.get_incoming_edges("chat_output", "input_value") == graph.edges
+    assert graph.get_incoming_edges("chat_output", "sender_name") == []
+    assert graph.get_edges_between("chat_input", "chat_output") == graph.edges
+    assert graph.get_vertices_with_target("chat_output") == [input_vertex]
+    assert graph.get_vertex_neighbors(input_vertex) == {output_vertex: 1}
+
+    graph.remove_vertex("chat_input")
+
+    assert graph.edges == []
+    assert output_vertex.edges == []
+    assert graph.get_vertices_with_target("chat_output") == []
@@ -0,0 +1,44 @@
+import asyncio
+import contextlib
+
+from langflow.graph.graph.build_schedule import BuildSchedule
+
+
+def test_sort_starts_longest_chain_first():
+    schedule = BuildSchedule(expected_build_times={"fast": 0.1, "slow": 1.0, "after_fast": 5.0})
+    successor_map = {"fast": ["after_fast"], "slow": [], "after_fast": []}
+
+    assert schedule.sort(["slow", "fast", "unknown"], successor_map) == ["fast", "slow", "unknown"]
+
+
+def test_sort_keeps_order_without_build_times():
+    assert BuildSchedule().sort(["b", "a", "c"], {}) == ["b", "a", "c"]
+
+
+async def test_build_slot_limits_expensive_builds():
+    schedule = BuildSchedule(
+        expected_build_times={"expensive_1": 1.0, "expensive_2": 1.0},
+        expensive_vertex_ids=["expensive_1", "expensive_2"],
+        max_concurrent_expensive_builds=1,
+    )
+    running = 0
+    max_running = 0
+
+    async def build(vertex_id: str):
+        nonlocal running, max_running
+        async with schedule.build_slot(vertex_id):
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(build("expensive_1"), build("expensive_2"))
+
+    assert max_running == 1
+    assert isinstance(schedule.build_slot("cheap"), contextlib.nullcontext)
+
+
+def test_build_slot_without_limit():
+    schedule = BuildSchedule(expensive_vertex_ids=["expensive"])
+
+    assert isinstance(schedule.build_slot("expensive"), contextlib.nullcontext)
@@ -977,3 +977,20 @@ def test_filter_vertices_from_vertex():
         get_vertex_successors=get_successors,
     )
     assert result == {"A", "B", "C"}
+
+
+def test_get_critical_path_lengths():
+    successor_map = {"A": ["B", "C"], "B": ["D"], "C": ["D"], "D": []}
+    build_times = {"A": 1.0, "B": 5.0, "C": 1.0, "D": 2.0}
+
+    lengths = utils.get_critical_path_lengths(["A", "B", "C", "D"], successor_map, build_times)
+
+    assert lengths == {"A": 8.0, "B": 7.0, "C": 3.0, "D": 2.0}
+
+
+def test_get_critical_path_lengths_ignores_cycles():
+    successor_map = {"A": ["B"], "B": ["A", "C"], "C": []}
+
+    lengths = utils.get_critical_path_lengths(["A"], successor_map, {"A": 1.0, "B": 1.0, "C": 1.0})
+
+    assert lengths["A"] == 3.0
@@ -0,0 +1,216 @@
+import asyncio
+import inspect
+
+import pytest
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput
+from langflow.custom import Component
+from langflow.exceptions.component import ComponentBuildError
+from langflow.graph import Graph
+from langflow.io import FloatInput, MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class DelayComponent(Component):
+    display_name = "Delay"
+    inputs = [
+        MessageTextInput(name="input_value", display_name="Input"),
+        FloatInput(name="delay", display_name="Delay", value=0.0),
+    ]
+    outputs = [Output(display_name="Message", name="message", method="delayed_message")]
+
+    async def delayed_message(self) -> Message:
+        self.graph.context["events"].append(("start", self._id))
+        await asyncio.sleep(self.delay)
+        self.graph.context["events"].append(("end", self._id))
+        return Message(text=f"{self.input_value or ''}{self._id}")
+
+
+class JoinComponent(Component):
+    display_name = "Join"
+    inputs = [
+        MessageTextInput(name="first", display_name="First"),
+        MessageTextInput(name="second", display_name="Second"),
+    ]
+    outputs = [Output(display_name="Message", name="message", method="join")]
+
+    def join(self) -> Message:
+        self.graph.context["events"].append(("end", self._id))
+        return Message(text=f"{self.first}|{self.second}")
+
+
+class FailingComponent(Component):
+    display_name = "Failing"
+    inputs = [MessageTextInput(name="input_value", display_name="Input")]
+    outputs = [Output(display_name="Message", name="message", method="fail")]
+
+    def fail(self) -> Message:
+        msg = "Component failed"
+        raise ValueError(msg)
+
+
+def build_branching_graph() -> Graph:
+    source = DelayComponent(_id="source")
+    slow = DelayComponent(_id="slow", delay=0.5)
+    slow.set(input_value=source.delayed_message)
+    fast_a = DelayComponent(_id="fast_a")
+    fast_a.set(input_value=source.delayed_message)
+    fast_b = DelayComponent(_id="fast_b")
+    fast_b.set(input_value=fast_a.delayed_message)
+    join = JoinComponent(_id="join")
+    join.set(first=slow.delayed_message, second=fast_b.delayed_message)
+    return Graph(source, join, context={"events": []})
+
+
+async def test_process_streaming_does_not_wait_for_layer():
+    graph = build_branching_graph()
+    await graph.process_streaming(fallback_to_env_vars=False)
+
+    events = graph.context["events"]
+    assert events.index(("end", "fast_b")) < events.index(("end", "slow"))
+    assert events[-1] == ("end", "join")
+    assert graph.get_vertex("join").results["message"].text == "sourceslow|sourcefast_afast_b"
+
+
+async def test_process_layered_waits_for_layer():
+    graph = build_branching_graph()
+    await graph.process_layered(fallback_to_env_vars=False)
+
+    events = graph.context["events"]
+    assert events.index(("end", "slow")) < events.index(("start", "fast_b"))
+    assert events[-1] == ("end", "join")
+
+
+async def test_process_streaming_propagates_errors():
+    source = DelayComponent(_id="source")
+    failing = FailingComponent(_id="failing")
+    failing.set(input_value=source.delayed_message)
+    slow = DelayComponent(_id="slow", delay=0.5)
+    slow.set(input_value=source.delayed_message)
+    join = JoinComponent(_id="join")
+    join.set(first=failing.fail, second=slow.delayed_message)
+    graph = Graph(source, join, context={"events": []})
+
+    with pytest.raises(ComponentBuildError, match="Component failed"):
+        await graph.process_streaming(fallback_to_env_vars=False)
+    assert ("end", "join") not in graph.context["events"]
+
+
+async def test_process_streaming_builds_each_root_once():
+    fast_root = DelayComponent(_id="fast_root")
+    slow_root = DelayComponent(_id="slow_root", delay=0.3)
+    join = JoinComponent(_id="join")
+    join.set(first=fast_root.delayed_message, second=slow_root.delayed_message)
+    graph = Graph(fast_root, join, context={"events": []})
+    # Graphs loaded from a payload, as the run endpoint does, are not prepared, so no vertex is marked as being run.
+    graph.run_manager.vertices_being_run.clear()
+    build_vertex = graph.build_vertex
+    builds: list[str] = []
+
+    async def build_vertex_late(vertex_id: str, **kwargs):
+        builds.append(vertex_id)
+        # Let the fast root finish before the slow root's build starts.
+        if vertex_id == "slow_root":
+            await asyncio.sleep(0.1)
+        return await build_vertex(vertex_id=vertex_id, **kwargs)
+
+    graph.build_vertex = build_vertex_late
+    await graph.process_streaming(fallback_to_env_vars=False)
+
+    assert sorted(builds) == ["fast_root", "join", "slow_root"]
+    assert graph.get_vertex("join").results["message"].text == "fast_root|slow_root"
+
+
+class SharedEvents(list):
+    """An event list that graph clones share instead of deep copying their context."""
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+SLEEP_COMPONENT_IMPORTS = """import asyncio
+
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+"""
+
+
+class SleepComponent(Component):
+    display_name = "Sleep"
+    inputs = [MessageTextInput(name="input_value", display_name="Input")]
+    outputs = [Output(display_name="Message", name="message", method="sleep")]
+
+    async def sleep(self) -> Message:
+        # The input is "<name>:<seconds>", or "<name>:<seconds>:fail" to raise after sleeping.
+        name, delay, *fail = self.input_value.split(":")
+        self.graph.context["events"].append(("start", name))
+        try:
+            await asyncio.sleep(float(delay))
+        except asyncio.CancelledError:
+            self.graph.context["events"].append(("cancelled", name))
+            raise
+        if fail:
+            msg = f"Run {name} failed"
+            raise ValueError(msg)
+        self.graph.context["events"].append(("end", name))
+        return Message(text=name)
+
+
+SLEEP_COMPONENT_CODE = SLEEP_COMPONENT_IMPORTS + inspect.getsource(SleepComponent)
+
+
+def build_concurrent_graph() -> Graph:
+    chat_input = ChatInput()
+    chat_input.set(should_store_message=False)
+    sleep = SleepComponent(_id="sleep")
+    sleep.set(input_value=chat_input.message_response)
+    chat_output = ChatOutput()
+    chat_output.set(input_value=sleep.sleep, should_store_message=False)
+    payload = Graph(chat_input, chat_output).dump()["data"]
+    # The dumped code is this whole module, whose first component is not SleepComponent.
+    sleep_node = next(node for node in payload["nodes"] if node["id"] == "sleep")
+    sleep_node["data"]["node"]["template"]["code"]["value"] = SLEEP_COMPONENT_CODE
+    graph = Graph.from_payload(payload, flow_id="flow")
+    graph.context["events"] = SharedEvents()
+    return graph
+
+
+async def test_arun_concurrently_keeps_input_order():
+    graph = build_concurrent_graph()
+
+    results = await graph.arun(inputs=[{"input_value": "slow:0.3"}, {"input_value": "fast:0.0"}], max_concurrency=2)
+
+    events = graph.context["events"]
+    assert events.index(("end", "fast")) < events.index(("end", "slow"))
+    assert [result.inputs["input_value"] for result in results] == ["slow:0.3", "fast:0.0"]
+    assert [result.outputs[0].results["message"].text for result in results] == ["slow", "fast"]
+
+
+async def test_arun_concurrently_limits_concurrency():
+    graph = build_concurrent_graph()
+
+    await graph.arun(inputs=[{"input_value": f"run_{index}:0.1"} for index in range(5)], max_concurrency=2)
+
+    running = max_running = 0
+    for event, _ in graph.context["events"]:
+        running += 1 if event == "start" else -1
+        max_running = max(max_running, running)
+    assert max_running == 2
+
+
+async def test_arun_concurrently_cancels_other_runs_on_failure():
+    graph = build_concurrent_graph()
+
+    with pytest.raises(ValueError, match="Run failing failed"):
+        await graph.arun(
+            inputs=[{"input_value": "slow:5"}, {"input_value": "failing:0.1:fail"}, {"input_value": "queued:0"}],
+            max_concurrency=2,
+        )
+
+    events = graph.context["events"]
+    assert ("cancelled", "slow") in events
+    assert ("end", "slow") not in events
+    assert ("start", "queued") not in events
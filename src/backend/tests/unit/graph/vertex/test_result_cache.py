@@ -0,0 +1,122 @@
+import asyncio
+import itertools
+from types import SimpleNamespace
+
+import pytest
+from langflow.components.data import FileComponent
+from langflow.custom import Component
+from langflow.graph import Graph
+from langflow.io import MessageTextInput, Output
+from langflow.schema import Data
+from langflow.schema.message import Message
+from langflow.services.deps import get_settings_service
+from langflow.services.vertex_cache.service import VertexCacheService
+
+BUILDS: list[str] = []
+
+
+class UppercaseComponent(Component):
+    display_name = "Uppercase"
+    cache_results = True
+
+    inputs = [MessageTextInput(name="text", display_name="Text")]
+    outputs = [Output(display_name="Text", name="uppercase", method="uppercase")]
+
+    def uppercase(self) -> str:
+        BUILDS.append(self.text)
+        return self.text.upper()
+
+
+RUNS = itertools.count()
+
+
+class GreetingComponent(Component):
+    display_name = "Greeting"
+    outputs = [Output(display_name="Message", name="message", method="greet")]
+
+    def greet(self) -> Message:
+        # Every run produces a message with the same text but a new session and timestamp.
+        run = next(RUNS)
+        return Message(text="hello", session_id=f"session-{run}", timestamp=f"2024-01-01 00:00:{run % 60:02d} UTC")
+
+
+class ServerFileComponent(Component):
+    display_name = "Server File"
+    inputs = [MessageTextInput(name="server_path", display_name="Server Path")]
+    outputs = [Output(display_name="Data", name="server_file", method="server_file")]
+
+    def server_file(self) -> Data:
+        return Data(data={"file_path": self.server_path})
+
+
+@pytest.fixture
+async def vertex_cache(tmp_path, monkeypatch):
+    settings = get_settings_service().settings.model_copy(update={"vertex_cache_dir": str(tmp_path)})
+    service = VertexCacheService(SimpleNamespace(settings=settings))
+    monkeypatch.setattr("langflow.graph.vertex.base.get_vertex_cache_service", lambda: service)
+    BUILDS.clear()
+    yield service
+    await service.teardown()
+
+
+async def build(component_class: type[Component], text: str):
+    component = component_class(_id="uppercase", text=text)
+    graph = Graph()
+    graph.add_component(component)
+    vertex = graph.get_vertex("uppercase")
+    await vertex.build(fallback_to_env_vars=False)
+    return vertex
+
+
+@pytest.mark.usefixtures("vertex_cache")
+async def test_results_are_reused_for_the_same_inputs():
+    first = await build(UppercaseComponent, "hello")
+    second = await build(UppercaseComponent, "hello")
+    third = await build(UppercaseComponent, "world")
+
+    assert BUILDS == ["hello", "world"]
+    assert first.results == second.results == {"uppercase": "HELLO"}
+    assert third.results == {"uppercase": "WORLD"}
+
+
+@pytest.mark.usefixtures("vertex_cache")
+async def test_components_must_opt_in():
+    class NotCachedComponent(UppercaseComponent):
+        cache_results = False
+
+    await build(NotCachedComponent, "hello")
+    await build(NotCachedComponent, "hello")
+
+    assert BUILDS == ["hello", "hello"]
+
+
+@pytest.mark.usefixtures("vertex_cache")
+async def test_upstream_messages_are_hashed_by_content():
+    for _ in range(2):
+        greeting = GreetingComponent(_id="greeting")
+        uppercase = UppercaseComponent(_id="uppercase")
+        uppercase.set(text=greeting.greet)
+        graph = Graph(greeting, uppercase)
+        await graph.get_vertex("greeting").build(fallback_to_env_vars=False)
+        await graph.get_vertex("uppercase").build(fallback_to_env_vars=False)
+
+    assert BUILDS == ["hello"]
+
+
+@pytest.mark.usefixtures("vertex_cache")
+async def test_file_results_follow_the_file_on_disk(tmp_path):
+    file_path = tmp_path / "notes.txt"
+
+    async def load(text: str) -> str:
+        await asyncio.to_thread(file_path.write_text, text, encoding="utf-8")
+        server_file = ServerFileComponent(_id="server_file", server_path=str(file_path))
+        file = FileComponent(_id="file", delete_server_file_after_processing=False)
+        file.set(file_path=server_file.server_file)
+        graph = Graph(server_file, file)
+        await graph.get_vertex("server_file").build(fallback_to_env_vars=False)
+        vertex = graph.get_vertex("file")
+        await vertex.build(fallback_to_env_vars=False)
+        return vertex.results["message"].text
+
+    assert await load("first") == "first"
+    assert await load("second version") == "second version"
@@ -1,5 +1,6 @@
+import pandas as pd
 import pytest
-from langflow.helpers.data import data_to_text_list
+from langflow.helpers.data import data_to_text_list, dataframe_to_text_list
 from langflow.schema import Data
 
 
@@ -114,3 +115,45 @@ def test_data_to_text_list__data_contains_nested_data_key():
     assert isinstance(result[1], list)
     assert template not in result[0]
     assert data in result[1]
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "{name} is {age} years old",
+        "{name!r}: {score:.2f} ({age:>4})",
+        "{tags[0]} and {{literal}} {name.upper}",
+        "{name}, {name} and {age}",
+        "No placeholders",
+        "{}",
+        "{0}",
+        "{name:{width}}",
+    ],
+)
+def test_dataframe_to_text_list_matches_str_format(template):
+    dataframe = pd.DataFrame(
+        {
+            "name": ["Alice", "Bob"],
+            "age": [25, 30],
+            "score": [1.234, 5.0],
+            "tags": [["a", "b"], ["c"]],
+            "width": [8, 4],
+        }
+    )
+
+    try:
+        expected = [template.format(**row) for row in dataframe.to_dict(orient="records")]
+    except (IndexError, KeyError) as e:
+        with pytest.raises(type(e)):
+            dataframe_to_text_list(template, dataframe)
+    else:
+        assert dataframe_to_text_list(template, dataframe) == expected
+
+
+def test_dataframe_to_text_list__missing_column():
+    with pytest.raises(KeyError, match="color"):
+        dataframe_to_text_list("My favorite color is {color}", pd.DataFrame({"fruit": ["apple"]}))
+
+
+def test_dataframe_to_text_list__empty_dataframe():
+    assert dataframe_to_text_list("{color}", pd.DataFrame({"fruit": []})) == []
@@ -1,8 +1,11 @@
+import copy
+import pickle
+
 import pandas as pd
 import pytest
 from langchain_core.documents import Document
 from langflow.schema.data import Data
-from langflow.schema.dataframe import DataFrame
+from langflow.schema.dataframe import DataFrame, DataRow
 
 
 @pytest.fixture
@@ -22,6 +25,34 @@ class TestDataFrameSchema:
         assert data_list[0].data["name"] == "John"
         assert data_list[0].data["text"] == "name is John"
 
+    def test_to_data_view(self, sample_dataframe):
+        """Test the lazy Data view over the rows of the DataFrame."""
+        data_frame = DataFrame(sample_dataframe)
+        data_view = data_frame.to_data_view()
+        assert len(data_view) == len(sample_dataframe)
+        assert all(isinstance(row, DataRow) for row in data_view)
+        assert list(data_view) == data_frame.to_data_list()
+        assert data_view[-1].name == "Jane"
+        assert data_view[0].get_text() == "name is John"
+        assert [row.name for row in data_view[1:]] == ["Jane"]
+        assert data_view[0].to_data() == Data(data={"name": "John", "text": "name is John"})
+        assert data_view[0].to_lc_document() == data_frame.to_lc_documents()[0]
+        with pytest.raises(IndexError):
+            data_view[2]
+        with pytest.raises(AttributeError):
+            _ = data_view[0].age
+
+    def test_data_view_can_be_copied_and_pickled(self, sample_dataframe):
+        """Test that data views and their rows survive the copies and pickles vertex results go through."""
+        data_view = DataFrame(sample_dataframe).to_data_view()
+        row = data_view[0]
+        for copied in [copy.copy(row), copy.deepcopy(row), pickle.loads(pickle.dumps(row))]:  # noqa: S301
+            assert copied == row
+            assert copied.name == "John"
+            assert copied.get_text() == "name is John"
+        assert list(copy.deepcopy(data_view)) == list(data_view)
+        assert list(pickle.loads(pickle.dumps(data_view))) == list(data_view)  # noqa: S301
+
     def test_add_row(self, sample_dataframe):
         """Test adding a single row to DataFrame."""
         data_frame = DataFrame(sample_dataframe)
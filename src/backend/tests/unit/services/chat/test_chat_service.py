@@ -0,0 +1,165 @@
+import asyncio
+
+import pytest
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput
+from langflow.graph import Graph
+from langflow.services.cache.disk import AsyncDiskCache
+from langflow.services.cache.service import AsyncInMemoryCache, ThreadingInMemoryCache
+from langflow.services.cache.utils import CacheMiss
+from langflow.services.chat.service import CACHE_LOCK_STRIPES, ChatService
+
+
+def build_graph() -> Graph:
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False, input_value="hello")
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=chat_input.message_response, should_store_message=False)
+    graph = Graph(chat_input, chat_output)
+    payload = graph.dump()["data"]
+    return Graph.from_payload(payload, flow_id="flow", flow_name="Flow", user_id="user")
+
+
+@pytest.fixture
+def disk_chat_service(tmp_path):
+    chat_service = ChatService()
+    chat_service.cache_service = AsyncDiskCache(cache_dir=tmp_path)
+    return chat_service
+
+
+async def test_set_graph_keeps_reference_for_in_memory_cache():
+    chat_service = ChatService()
+    chat_service.cache_service = AsyncInMemoryCache()
+    graph = build_graph()
+
+    await chat_service.set_graph("flow", graph)
+
+    assert not chat_service.serializes_values
+    assert await chat_service.get_graph("flow") is graph
+
+
+async def test_set_graph_stores_build_states_under_their_own_keys_for_serializing_cache(disk_chat_service):
+    graph = build_graph()
+    graph.set_run_id()
+    graph.sort_vertices()
+    await disk_chat_service.set_graph("flow", graph)
+
+    await graph.build_vertex("chat_input")
+    await graph.get_next_runnable_vertices(graph._lock, vertex=graph.get_vertex("chat_input"), cache=False)
+    await disk_chat_service.set_graph("flow", graph, vertex_id="chat_input")
+
+    restored = await disk_chat_service.get_graph("flow")
+
+    assert disk_chat_service.serializes_values
+    assert restored is not graph
+    assert sorted(await asyncio.to_thread(list, disk_chat_service.cache_service.cache)) == [
+        "flow",
+        "flow:graph_data",
+        "flow:vertex:chat_input",
+    ]
+    restored_input = restored.get_vertex("chat_input")
+    assert restored_input.built
+    assert restored_input.results["message"].text == "hello"
+    assert not restored.get_vertex("chat_output").built
+    assert restored.run_manager.run_predecessors == graph.run_manager.run_predecessors
+    assert restored.run_manager.vertices_to_run == graph.run_manager.vertices_to_run
+    assert restored.run_id == graph.run_id
+
+
+async def test_set_graph_only_writes_the_built_vertex(disk_chat_service, monkeypatch):
+    graph = build_graph()
+    graph.set_run_id()
+    graph.sort_vertices()
+    await graph.build_vertex("chat_input")
+    await disk_chat_service.set_graph("flow", graph)
+
+    written = []
+    set_cache = disk_chat_service.set_cache
+
+    async def record_set_cache(key, data, lock=None):
+        written.append((key, data))
+        return await set_cache(key, data, lock=lock)
+
+    monkeypatch.setattr(disk_chat_service, "set_cache", record_set_cache)
+    await graph.build_vertex("chat_output")
+    await disk_chat_service.set_graph("flow", graph, vertex_id="chat_output")
+
+    assert [key for key, _ in written] == ["flow:vertex:chat_output", "flow"]
+    assert isinstance(written[0][1], bytes)
+    assert written[1][1]["built_vertex_ids"] == ["chat_input", "chat_output"]
+    assert graph.cached_vertex_ids == {"chat_input", "chat_output"}
+
+    restored = await disk_chat_service.get_graph("flow")
+    assert restored.get_vertex("chat_input").built
+    assert restored.get_vertex("chat_output").built
+
+
+async def test_get_graph_returns_cache_miss_when_a_build_state_expired(disk_chat_service):
+    graph = build_graph()
+    graph.set_run_id()
+    graph.sort_vertices()
+    await graph.build_vertex("chat_input")
+    await disk_chat_service.set_graph("flow", graph, vertex_id="chat_input")
+
+    await disk_chat_service._delete("flow:vertex:chat_input")
+
+    assert isinstance(await disk_chat_service.get_graph("flow"), CacheMiss)
+
+
+async def test_clear_cache_removes_the_graph(disk_chat_service):
+    graph = build_graph()
+    graph.set_run_id()
+    graph.sort_vertices()
+    await graph.build_vertex("chat_input")
+    await disk_chat_service.set_graph("flow", graph, vertex_id="chat_input")
+
+    await disk_chat_service.clear_cache("flow")
+
+    assert await asyncio.to_thread(list, disk_chat_service.cache_service.cache) == []
+    assert isinstance(await disk_chat_service.get_graph("flow"), CacheMiss)
+
+
+async def test_get_graph_returns_cache_miss(disk_chat_service):
+    assert isinstance(await disk_chat_service.get_graph("missing"), CacheMiss)
+
+
+async def test_cache_locks_are_bounded():
+    chat_service = ChatService()
+
+    locks = {id(chat_service.async_cache_locks[f"flow-{i}"]) for i in range(1000)}
+
+    assert len(locks) <= CACHE_LOCK_STRIPES
+    assert chat_service.async_cache_locks["flow-1"] is chat_service.async_cache_locks["flow-1"]
+
+
+async def test_in_memory_cache_runs_on_the_event_loop(monkeypatch):
+    chat_service = ChatService()
+    chat_service.cache_service = ThreadingInMemoryCache(max_size=2)
+
+    def fail_to_thread(*_args, **_kwargs):
+        msg = "The in-memory cache should not be called from a thread"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr("langflow.services.chat.service.asyncio.to_thread", fail_to_thread)
+    for key in ["a", "b", "c"]:
+        assert await chat_service.set_cache(key, key.upper())
+    assert (await chat_service.get_cache("c"))["result"] == "C"
+    assert isinstance(await chat_service.get_cache("a"), CacheMiss)
+    await chat_service.clear_cache("c")
+
+    stats = chat_service.get_cache_stats()
+    assert (stats.size, stats.max_size, stats.hits, stats.misses, stats.evictions) == (1, 2, 1, 1, 1)
+
+
+async def test_async_in_memory_cache_stats():
+    chat_service = ChatService()
+    chat_service.cache_service = AsyncInMemoryCache(max_size=2)
+
+    await chat_service.set_cache("a", 1)
+    await chat_service.set_cache("a", 2)
+    await chat_service.set_cache("b", 3)
+    await chat_service.set_cache("c", 4)
+
+    assert (await chat_service.get_cache("c"))["result"] == 4
+    stats = chat_service.get_cache_stats()
+    assert (stats.size, stats.hits, stats.misses, stats.evictions) == (2, 1, 0, 1)
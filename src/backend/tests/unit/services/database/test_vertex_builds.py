@@ -3,7 +3,11 @@ from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
-from langflow.services.database.models.vertex_builds.crud import log_vertex_build
+from langflow.services.database.models.vertex_builds.crud import (
+    get_vertex_build_stats,
+    log_vertex_build,
+    update_vertex_build_stats,
+)
 from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
 from langflow.services.settings.base import Settings
 from sqlalchemy import delete, func, select
@@ -314,3 +318,23 @@ async def test_concurrent_log_vertex_build(vertex_build_data, mock_settings):
         async with AsyncSession(engine) as session:
             count = await session.scalar(select(func.count()).select_from(VertexBuildTable))
             assert count <= mock_settings.max_vertex_builds_to_keep
+
+
+async def test_update_vertex_build_stats(async_session: AsyncSession):
+    flow_id = uuid4()
+
+    await update_vertex_build_stats(async_session, flow_id, {"fast": 1.0, "slow": 10.0})
+    await async_session.commit()
+    for build_time in [2.0] * 19:
+        await update_vertex_build_stats(async_session, flow_id, {"fast": build_time})
+        await async_session.commit()
+
+    stats = await get_vertex_build_stats(async_session, flow_id)
+
+    assert set(stats) == {"fast", "slow"}
+    assert stats["slow"].build_count == 1
+    assert stats["slow"].ewma == stats["slow"].p95 == 10.0
+    assert stats["fast"].build_count == 20
+    assert stats["fast"].recent_build_times == [1.0] + [2.0] * 19
+    assert stats["fast"].p95 == 2.0
+    assert 1.9 < stats["fast"].ewma < 2.0
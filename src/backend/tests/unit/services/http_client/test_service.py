@@ -0,0 +1,127 @@
+import asyncio
+from unittest.mock import Mock
+
+import httpx
+import pytest
+import respx
+from langflow.services.http_client.service import HTTPClientService
+
+
+@pytest.fixture
+async def http_client_service():
+    settings_service = Mock()
+    settings_service.settings.http_client_max_connections = 10
+    settings_service.settings.http_client_max_keepalive_connections = 5
+    settings_service.settings.http_client_keepalive_expiry = 5.0
+    settings_service.settings.http_client_max_connections_per_host = 2
+    settings_service.settings.http_client_cache_max_entries = 0
+    service = HTTPClientService(settings_service)
+    yield service
+    await service.teardown()
+
+
+async def test_client_is_shared(http_client_service):
+    assert http_client_service.client is http_client_service.client
+
+
+@respx.mock
+async def test_requests_per_host_are_limited(http_client_service):
+    running = 0
+    max_running = 0
+
+    async def slow_response(request):  # noqa: ARG001
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return httpx.Response(200)
+
+    respx.get(url__startswith="https://example.com/").mock(side_effect=slow_response)
+    respx.get("https://other.com/").mock(return_value=httpx.Response(200))
+
+    responses = await asyncio.gather(
+        *(http_client_service.get(f"https://example.com/{i}") for i in range(6)),
+        http_client_service.get("https://other.com/"),
+    )
+
+    assert [response.status_code for response in responses] == [200] * 7
+    assert max_running == 2
+
+
+@respx.mock
+async def test_cookies_are_not_shared_between_requests(http_client_service):
+    respx.get("https://example.com/login").mock(
+        return_value=httpx.Response(200, headers={"Set-Cookie": "session=secret; Path=/"})
+    )
+    route = respx.get("https://example.com/profile").mock(return_value=httpx.Response(200))
+
+    await http_client_service.get("https://example.com/login")
+    await http_client_service.get("https://example.com/profile")
+    await http_client_service.get("https://example.com/profile", cookies={"session": "mine"})
+
+    assert "cookie" not in route.calls[0].request.headers
+    assert route.calls[1].request.headers["cookie"] == "session=mine"
+    assert not http_client_service.client.cookies
+
+
+@respx.mock
+async def test_responses_are_not_cached_by_default(http_client_service):
+    route = respx.get("https://example.com/").mock(
+        return_value=httpx.Response(200, json={"a": 1}, headers={"Cache-Control": "max-age=60"})
+    )
+
+    await http_client_service.get("https://example.com/")
+    await http_client_service.get("https://example.com/")
+
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_responses_are_cached_following_cache_control(http_client_service):
+    http_client_service.settings_service.settings.http_client_cache_max_entries = 10
+    cached_route = respx.get("https://example.com/cached").mock(
+        return_value=httpx.Response(200, json={"a": 1}, headers={"Cache-Control": "public, max-age=60"})
+    )
+    no_store_route = respx.get("https://example.com/no-store").mock(
+        return_value=httpx.Response(200, json={"a": 1}, headers={"Cache-Control": "no-store, max-age=60"})
+    )
+    post_route = respx.post("https://example.com/cached").mock(
+        return_value=httpx.Response(200, headers={"Cache-Control": "max-age=60"})
+    )
+
+    first = await http_client_service.get("https://example.com/cached")
+    second = await http_client_service.get("https://example.com/cached")
+    await http_client_service.get("https://example.com/cached", headers={"Authorization": "Bearer other"})
+    await http_client_service.get("https://example.com/cached", headers={"Cache-Control": "no-cache"})
+    for _ in range(2):
+        await http_client_service.get("https://example.com/no-store")
+        await http_client_service.post("https://example.com/cached")
+
+    assert second.json() == first.json() == {"a": 1}
+    assert cached_route.call_count == 3
+    assert no_store_route.call_count == 2
+    assert post_route.call_count == 2
+    assert http_client_service.cache_hits == 1
+
+
+@respx.mock
+async def test_cached_responses_expire(http_client_service, monkeypatch):
+    http_client_service.settings_service.settings.http_client_cache_max_entries = 10
+    route = respx.get("https://example.com/").mock(
+        return_value=httpx.Response(
+            200,
+            headers={"Date": "Mon, 01 Jan 2024 00:00:00 GMT", "Expires": "Mon, 01 Jan 2024 00:00:30 GMT"},
+        )
+    )
+    now = 1000.0
+    monkeypatch.setattr("langflow.services.http_client.service.time.monotonic", lambda: now)
+
+    await http_client_service.get("https://example.com/")
+    now += 29
+    await http_client_service.get("https://example.com/")
+    assert route.call_count == 1
+
+    now += 2
+    await http_client_service.get("https://example.com/")
+    assert route.call_count == 2
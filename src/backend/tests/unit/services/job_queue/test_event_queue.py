@@ -0,0 +1,81 @@
+import asyncio
+import json
+
+import pytest
+from langflow.events.event_manager import create_default_event_manager
+from langflow.services.job_queue.event_queue import EventQueue
+from langflow.services.job_queue.service import JobQueueNotFoundError, JobQueueService
+
+
+def drain(queue: EventQueue) -> list[dict]:
+    events = []
+    while not queue.empty():
+        _, value, _ = queue.get_nowait()
+        events.append(json.loads(value))
+    return events
+
+
+def test_coalesces_token_events_when_full():
+    queue = EventQueue(max_size=2, overflow_policy="coalesce")
+    event_manager = create_default_event_manager(queue, token_flush_interval=0)
+
+    event_manager.on_build_start(data={"id": "vertex"})
+    for chunk in ["Hel", "lo", " wor", "ld"]:
+        event_manager.on_token(data={"chunk": chunk, "id": "message"})
+
+    events = drain(queue)
+    assert [event["event"] for event in events] == ["build_start", "token"]
+    assert events[1]["data"]["chunk"] == "Hello world"
+    assert queue.stats().coalesced == 3
+    assert queue.bytes == 0
+
+
+def test_drops_oldest_token_events_but_keeps_other_events():
+    queue = EventQueue(max_size=2, overflow_policy="drop_oldest")
+    event_manager = create_default_event_manager(queue, token_flush_interval=0)
+
+    event_manager.on_token(data={"chunk": "a", "id": "message"})
+    event_manager.on_token(data={"chunk": "b", "id": "message"})
+    event_manager.on_end_vertex(data={"build_data": {}})
+    event_manager.on_token(data={"chunk": "c", "id": "message"})
+
+    events = drain(queue)
+    assert [event["event"] for event in events] == ["token", "end_vertex", "token"]
+    assert [event["data"]["chunk"] for event in events if event["event"] == "token"] == ["b", "c"]
+    assert queue.stats().dropped == 1
+
+
+async def test_block_policy_waits_for_consumer():
+    queue = EventQueue(max_size=1, overflow_policy="block")
+    event_manager = create_default_event_manager(queue, token_flush_interval=0)
+    event_manager.on_token(data={"chunk": "a", "id": "message"})
+
+    waiter = asyncio.create_task(event_manager.wait_for_capacity())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await queue.get()
+    await asyncio.wait_for(waiter, timeout=1)
+
+
+async def test_service_reports_memory_usage():
+    service = JobQueueService(max_queue_size=10)
+    service.start()
+    try:
+        queue, event_manager = service.create_queue("job")
+        event_manager.on_token(data={"chunk": "x" * 100, "id": "message"})
+        event_manager.flush_tokens()
+
+        stats = service.get_memory_usage("job")
+        assert stats.size == 1
+        assert stats.max_size == 10
+        assert stats.bytes > 100
+        assert service.get_total_memory_usage() == stats.bytes
+
+        queue.get_nowait()
+        assert service.get_memory_usage("job").bytes == 0
+        assert service.get_memory_usage("job").peak_bytes == stats.bytes
+        with pytest.raises(JobQueueNotFoundError):
+            service.get_memory_usage("missing")
+    finally:
+        await service.stop()
@@ -0,0 +1,97 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from langflow.services.database.models.transactions.model import TransactionBase, TransactionTable
+from langflow.services.database.models.vertex_builds.crud import get_vertex_build_stats
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
+from langflow.services.deps import get_settings_service, session_scope
+from langflow.services.log_writer.service import LogWriterService
+from sqlmodel import select
+
+
+def create_log_writer(**settings) -> LogWriterService:
+    settings.setdefault("log_writer_flush_interval_ms", 50)
+    return LogWriterService(SimpleNamespace(settings=get_settings_service().settings.model_copy(update=settings)))
+
+
+def create_vertex_build(flow_id, vertex_id: str, offset: int = 0) -> VertexBuildBase:
+    return VertexBuildBase(
+        id=vertex_id,
+        flow_id=flow_id,
+        timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=offset),
+        artifacts={},
+        valid=True,
+    )
+
+
+async def count_rows(table, flow_id) -> int:
+    async with session_scope() as session:
+        return len((await session.exec(select(table).where(table.flow_id == flow_id))).all())
+
+
+@pytest.mark.usefixtures("client")
+async def test_logs_are_written_in_batches():
+    log_writer = create_log_writer()
+    flow_id = uuid4()
+
+    await log_writer.log_vertex_build(create_vertex_build(flow_id, "vertex"))
+    await log_writer.log_transaction(
+        TransactionBase(vertex_id="vertex", inputs={}, outputs={}, status="success", flow_id=flow_id)
+    )
+    assert log_writer.pending == 2
+    assert await count_rows(VertexBuildTable, flow_id) == 0
+
+    await asyncio.sleep(0.2)
+    assert log_writer.pending == 0
+    assert await count_rows(VertexBuildTable, flow_id) == 1
+    assert await count_rows(TransactionTable, flow_id) == 1
+
+
+@pytest.mark.usefixtures("client")
+async def test_prune_enforces_limits_once():
+    log_writer = create_log_writer(max_vertex_builds_per_vertex=2, max_transactions_to_keep=3)
+    flow_id = uuid4()
+
+    for i in range(5):
+        await log_writer.log_vertex_build(create_vertex_build(flow_id, "vertex", offset=i))
+        await log_writer.log_transaction(
+            TransactionBase(vertex_id="vertex", inputs={}, outputs={}, status="success", flow_id=flow_id)
+        )
+    await log_writer.flush()
+    assert await count_rows(VertexBuildTable, flow_id) == 5
+    assert await count_rows(TransactionTable, flow_id) == 5
+
+    await log_writer.prune()
+    assert await count_rows(VertexBuildTable, flow_id) == 2
+    assert await count_rows(TransactionTable, flow_id) == 3
+
+
+@pytest.mark.usefixtures("client")
+async def test_flush_interval_zero_writes_immediately():
+    log_writer = create_log_writer(log_writer_flush_interval_ms=0)
+    flow_id = uuid4()
+
+    await log_writer.log_vertex_build(create_vertex_build(flow_id, "vertex"))
+
+    assert log_writer.pending == 0
+    assert await count_rows(VertexBuildTable, flow_id) == 1
+
+
+@pytest.mark.usefixtures("client")
+async def test_build_times_update_stats_on_flush():
+    log_writer = create_log_writer()
+    flow_id = uuid4()
+
+    await log_writer.log_build_times(flow_id, {"vertex": 1.0})
+    await log_writer.log_build_times(flow_id, {"vertex": 3.0})
+    assert log_writer.pending == 2
+
+    await log_writer.flush()
+    async with session_scope() as session:
+        stats = await get_vertex_build_stats(session, flow_id)
+
+    assert stats["vertex"].build_count == 2
+    assert stats["vertex"].recent_build_times == [1.0, 3.0]
@@ -0,0 +1,50 @@
+from unittest.mock import Mock
+
+import pytest
+from langflow.services.storage.local import LocalStorageService
+
+
+@pytest.fixture
+def storage_service(tmp_path):
+    settings_service = Mock()
+    settings_service.settings.config_dir = str(tmp_path)
+    return LocalStorageService(Mock(), settings_service)
+
+
+async def chunks_of(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def read_all(storage_service, **kwargs) -> list[bytes]:
+    return [chunk async for chunk in storage_service.open_read("flow", "file.txt", **kwargs)]
+
+
+async def test_open_write_and_open_read(storage_service):
+    size = await storage_service.open_write("flow", "file.txt", chunks_of(b"0123", b"4567", b"89"))
+
+    assert size == 10
+    assert await storage_service.get_file("flow", "file.txt") == b"0123456789"
+    assert await read_all(storage_service, chunk_size=4) == [b"0123", b"4567", b"89"]
+    assert await read_all(storage_service, start=2, end=6, chunk_size=2) == [b"23", b"45", b"6"]
+    assert await read_all(storage_service, start=8) == [b"89"]
+    assert await storage_service.list_files("flow") == ["file.txt"]
+
+
+async def test_failed_open_write_leaves_no_file(storage_service):
+    async def failing_chunks():
+        yield b"partial"
+        msg = "Upload interrupted"
+        raise RuntimeError(msg)
+
+    await storage_service.open_write("flow", "file.txt", chunks_of(b"original"))
+    with pytest.raises(RuntimeError):
+        await storage_service.open_write("flow", "file.txt", failing_chunks())
+
+    assert await storage_service.list_files("flow") == ["file.txt"]
+    assert await storage_service.get_file("flow", "file.txt") == b"original"
+
+
+async def test_open_read_missing_file(storage_service):
+    with pytest.raises(FileNotFoundError):
+        await read_all(storage_service)
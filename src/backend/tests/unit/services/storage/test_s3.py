@@ -0,0 +1,144 @@
+import io
+import threading
+from unittest.mock import Mock
+
+import pytest
+from langflow.services.storage.s3 import S3StorageService
+
+
+class FakeS3Client:
+    """An in-memory stand-in for the parts of the boto3 S3 client used by the storage service."""
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.aborted: list[str] = []
+        self.requests: list[tuple[str, str]] = []
+
+    def _record(self, operation: str) -> None:
+        self.requests.append((operation, threading.current_thread().name))
+
+    def put_object(self, Bucket, Key, Body):  # noqa: N803, ARG002
+        self._record("put_object")
+        self.objects[Key] = bytes(Body)
+
+    def get_object(self, Bucket, Key, Range=None):  # noqa: N803, ARG002
+        self._record("get_object")
+        data = self.objects[Key]
+        if Range is not None:
+            start, end = Range.removeprefix("bytes=").split("-")
+            data = data[int(start) : int(end) + 1]
+        return {"Body": io.BytesIO(data)}
+
+    def head_object(self, Bucket, Key):  # noqa: N803, ARG002
+        self._record("head_object")
+        return {"ContentLength": len(self.objects[Key])}
+
+    def create_multipart_upload(self, Bucket, Key):  # noqa: N803, ARG002
+        self._record("create_multipart_upload")
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):  # noqa: N803, ARG002
+        self._record("upload_part")
+        self.uploads[UploadId][PartNumber] = Body
+        return {"ETag": f'"{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):  # noqa: N803, ARG002
+        self._record("complete_multipart_upload")
+        parts = self.uploads.pop(UploadId)
+        self.objects[Key] = b"".join(parts[part["PartNumber"]] for part in MultipartUpload["Parts"])
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):  # noqa: N803, ARG002
+        self._record("abort_multipart_upload")
+        self.uploads.pop(UploadId)
+        self.aborted.append(UploadId)
+
+    def delete_object(self, Bucket, Key):  # noqa: N803, ARG002
+        self._record("delete_object")
+        self.objects.pop(Key, None)
+
+    def get_paginator(self, operation_name):
+        assert operation_name == "list_objects_v2"
+        paginator = Mock()
+        paginator.paginate = lambda Bucket, Prefix: [  # noqa: ARG005, N803
+            {"Contents": [{"Key": key} for key in self.objects if key.startswith(Prefix)]}
+        ]
+        return paginator
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+async def storage_service(tmp_path):
+    settings_service = Mock()
+    settings_service.settings.config_dir = str(tmp_path)
+    settings_service.settings.storage_s3_bucket = "bucket"
+    settings_service.settings.storage_s3_endpoint_url = "http://localhost:9000"
+    settings_service.settings.storage_s3_max_concurrency = 4
+    settings_service.settings.storage_s3_part_size_mb = 5
+    service = S3StorageService(Mock(), settings_service)
+    service.s3_client = FakeS3Client()
+    # Parts are at least 5 MB in S3, but small parts keep the tests fast.
+    service.part_size = 4
+    yield service
+    await service.teardown()
+
+
+async def chunks_of(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def test_small_file_is_saved_with_one_request(storage_service):
+    await storage_service.save_file("flow", "file.txt", b"0123")
+
+    assert [operation for operation, _ in storage_service.s3_client.requests] == ["put_object"]
+    assert await storage_service.get_file("flow", "file.txt") == b"0123"
+    assert await storage_service.list_files("flow") == ["file.txt"]
+
+
+async def test_large_file_uses_multipart_upload_and_ranged_gets(storage_service):
+    client = storage_service.s3_client
+
+    size = await storage_service.open_write("flow", "file.txt", chunks_of(b"012", b"3456789", b"", b"abcdef"))
+
+    assert size == 16
+    assert client.objects["flow/file.txt"] == b"0123456789abcdef"
+    operations = [operation for operation, _ in client.requests]
+    assert operations.count("upload_part") == 4
+    assert operations[-1] == "complete_multipart_upload"
+
+    client.requests.clear()
+    assert await storage_service.get_file("flow", "file.txt") == b"0123456789abcdef"
+    assert [operation for operation, _ in client.requests].count("get_object") == 4
+
+    chunks = [chunk async for chunk in storage_service.open_read("flow", "file.txt", start=3, end=12, chunk_size=3)]
+    assert chunks == [b"345", b"6", b"789", b"a", b"bc"]
+    assert all(thread_name.startswith("s3_storage") for _, thread_name in client.requests)
+
+
+async def test_failed_multipart_upload_is_aborted(storage_service):
+    async def failing_chunks():
+        yield b"0123456789"
+        msg = "Upload interrupted"
+        raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError):
+        await storage_service.open_write("flow", "file.txt", failing_chunks())
+
+    assert storage_service.s3_client.aborted == ["upload-0"]
+    assert "flow/file.txt" not in storage_service.s3_client.objects
+
+
+async def test_list_and_delete_files(storage_service):
+    await storage_service.save_file("flow", "a.txt", b"a")
+    await storage_service.save_file("flow", "nested/b.txt", b"b")
+    await storage_service.save_file("other", "c.txt", b"c")
+
+    assert await storage_service.list_files("flow") == ["a.txt"]
+
+    await storage_service.delete_file("flow", "a.txt")
+    assert await storage_service.list_files("flow") == []
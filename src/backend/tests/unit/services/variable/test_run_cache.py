@@ -0,0 +1,52 @@
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from langflow.services.variable.run_cache import RunVariableCache
+
+
+@pytest.fixture
+def variable_service():
+    variable_service = AsyncMock()
+    variable_service.get_variables.return_value = {"OPENAI_API_KEY": "openai", "ASTRA_TOKEN": "astra"}
+    with (
+        patch("langflow.services.variable.run_cache.get_variable_service", return_value=variable_service),
+        patch("langflow.services.variable.run_cache.session_scope") as session_scope,
+    ):
+        session_scope.return_value.__aenter__.return_value = "session"
+        yield variable_service
+
+
+async def test_run_variable_cache_loads_all_names_at_once(variable_service):
+    user_id = uuid4()
+    cache = RunVariableCache(user_id, {"OPENAI_API_KEY", "ASTRA_TOKEN"})
+
+    assert await cache.get("OPENAI_API_KEY", "api_key") == "openai"
+    assert await cache.get("ASTRA_TOKEN", "token") == "astra"
+
+    variable_service.get_variables.assert_awaited_once_with(
+        user_id=user_id, names=["ASTRA_TOKEN", "OPENAI_API_KEY"], session="session"
+    )
+
+
+async def test_run_variable_cache_caches_missing_variables(variable_service):
+    cache = RunVariableCache(uuid4())
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="MISSING variable not found."):
+            await cache.get("MISSING", "api_key")
+
+    assert variable_service.get_variables.await_count == 1
+
+
+async def test_run_variable_cache_checks_session_id_fields_with_the_service(variable_service):
+    variable_service.get_variable.return_value = "session-value"
+    user_id = uuid4()
+    cache = RunVariableCache(user_id, {"OPENAI_API_KEY"})
+
+    assert await cache.get("SESSION", "session_id") == "session-value"
+
+    variable_service.get_variable.assert_awaited_once_with(
+        user_id=user_id, name="SESSION", field="session_id", session="session"
+    )
+    variable_service.get_variables.assert_not_awaited()
@@ -75,6 +75,17 @@ async def test_get_variable(service, session: AsyncSession):
     assert result == value
 
 
+async def test_get_variables(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "first", "value1", session=session)
+    await service.create_variable(user_id, "second", "value2", session=session)
+    await service.create_variable(uuid4(), "third", "value3", session=session)
+
+    result = await service.get_variables(user_id, ["first", "second", "third", "missing"], session=session)
+
+    assert result == {"first": "value1", "second": "value2"}
+
+
 async def test_get_variable__valueerror(service, session: AsyncSession):
     user_id = uuid4()
     name = "name"
@@ -0,0 +1,48 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.deps import get_settings_service
+from langflow.services.vertex_cache.service import VertexCacheService
+
+
+@pytest.fixture
+async def vertex_cache(tmp_path):
+    settings = get_settings_service().settings.model_copy(update={"vertex_cache_dir": str(tmp_path)})
+    service = VertexCacheService(SimpleNamespace(settings=settings))
+    yield service
+    await service.teardown()
+
+
+async def test_get_and_set(vertex_cache):
+    assert await vertex_cache.get("key") is CACHE_MISS
+
+    await vertex_cache.set("key", {"results": {"text": "value"}})
+
+    assert await vertex_cache.get("key") == {"results": {"text": "value"}}
+    assert (vertex_cache.hits, vertex_cache.misses) == (1, 1)
+
+
+async def test_results_survive_a_new_service(vertex_cache):
+    await vertex_cache.set("key", [1, 2, 3])
+
+    other_service = VertexCacheService(vertex_cache.settings_service)
+
+    assert await other_service.get("key") == [1, 2, 3]
+    await other_service.teardown()
+
+
+async def test_unpicklable_values_are_not_cached(vertex_cache):
+    await vertex_cache.set("key", {"lock": threading.Lock()})
+
+    assert await vertex_cache.get("key") is CACHE_MISS
+
+
+async def test_disabled_with_zero_size(vertex_cache):
+    vertex_cache.settings_service.settings.vertex_cache_max_size_mb = 0
+
+    await vertex_cache.set("key", "value")
+
+    assert await vertex_cache.get("key") is CACHE_MISS
+    assert vertex_cache._disk_cache is None
@@ -127,6 +127,12 @@ async def test_get_all(client: AsyncClient, logged_in_headers):
     assert "Prompt" in json_response["prompts"]
     assert "ChatOutput" in json_response["outputs"]
 
+    etag = response.headers["etag"]
+    response = await client.get("api/v1/all", headers={**logged_in_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert not response.content
+
 
 @pytest.mark.usefixtures("active_user")
 async def test_post_validate_code(client: AsyncClient, logged_in_headers):
@@ -454,6 +460,50 @@ async def test_successful_run_with_input_type_chat(client: AsyncClient, simple_a
     )
 
 
+async def test_successful_run_with_list_of_input_values(client: AsyncClient, simple_api_test, created_api_key):
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+    input_values = [f"value{index}" for index in range(6)]
+    payload = {"input_type": "chat", "output_type": "debug", "input_value": input_values}
+    response = await client.post(f"/api/v1/run/{flow_id}", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    outer_outputs = response.json()["outputs"]
+    assert [outputs_dict["inputs"] for outputs_dict in outer_outputs] == [
+        {"input_value": input_value} for input_value in input_values
+    ]
+    for input_value, outputs_dict in zip(input_values, outer_outputs, strict=True):
+        chat_input_outputs = [output for output in outputs_dict["outputs"] if "ChatInput" in output["component_id"]]
+        assert [output["results"]["message"]["text"] for output in chat_input_outputs] == [input_value]
+
+
+async def test_only_list_input_values_run_concurrently(
+    client: AsyncClient, simple_api_test, created_api_key, monkeypatch
+):
+    from langflow.graph.graph.base import Graph
+
+    monkeypatch.setattr(get_settings_service().settings, "batch_run_concurrency", 3)
+    max_concurrencies = []
+    arun = Graph.arun
+
+    async def record_arun(self, *args, max_concurrency=None, **kwargs):
+        max_concurrencies.append(max_concurrency)
+        return await arun(self, *args, max_concurrency=max_concurrency, **kwargs)
+
+    monkeypatch.setattr(Graph, "arun", record_arun)
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+
+    payload = {"input_type": "chat", "output_type": "debug", "input_value": ["value0", "value1"]}
+    response = await client.post(f"/api/v1/run/{flow_id}", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    payload = {"inputs": [{"input_value": "value0"}, {"input_value": "value1"}]}
+    response = await client.post(f"/api/v1/run/advanced/{flow_id}", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    assert max_concurrencies == [3, None]
+
+
 @pytest.mark.benchmark
 async def test_invalid_run_with_input_type_chat(client, simple_api_test, created_api_key):
     headers = {"x-api-key": created_api_key.api_key}
@@ -1,3 +1,8 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+from langflow.processing.graph_cache import clear_graph_templates, get_graph_for_run
 from langflow.processing.process import process_tweaks
 from langflow.services.deps import get_session_service
 
@@ -273,6 +278,49 @@ async def test_load_langchain_object_with_cached_session(basic_graph_data):
     assert artifacts1 == artifacts2
 
 
+@pytest.fixture
+def memory_chatbot_data(json_memory_chatbot_no_llm):
+    clear_graph_templates()
+    yield json.loads(json_memory_chatbot_no_llm)["data"]
+    clear_graph_templates()
+
+
+def test_get_graph_for_run_clones_cached_template(memory_chatbot_data):
+    updated_at = datetime.now(timezone.utc)
+    graph1 = get_graph_for_run(
+        memory_chatbot_data, flow_id="flow", flow_name="Flow", updated_at=updated_at, tweaks={}, user_id="user1"
+    )
+    graph2 = get_graph_for_run(
+        memory_chatbot_data, flow_id="flow", flow_name="Flow", updated_at=updated_at, tweaks={}, user_id="user2"
+    )
+
+    assert graph1 is not graph2
+    assert graph1.user_id == "user1"
+    assert graph2.user_id == "user2"
+    assert [vertex.id for vertex in graph1.vertices] == [vertex.id for vertex in graph2.vertices]
+    assert all(v1 is not v2 for v1, v2 in zip(graph1.vertices, graph2.vertices, strict=True))
+    assert all(vertex.graph is graph2 for vertex in graph2.vertices)
+
+
+def test_get_graph_for_run_applies_tweaks_per_key(memory_chatbot_data):
+    updated_at = datetime.now(timezone.utc)
+    prompt_id = next(node["id"] for node in memory_chatbot_data["nodes"] if node["id"].startswith("Prompt"))
+    tweaked = get_graph_for_run(
+        memory_chatbot_data,
+        flow_id="flow",
+        flow_name="Flow",
+        updated_at=updated_at,
+        tweaks={prompt_id: {"template": "tweaked {memory}"}},
+        user_id="user",
+    )
+    untweaked = get_graph_for_run(
+        memory_chatbot_data, flow_id="flow", flow_name="Flow", updated_at=updated_at, tweaks={}, user_id="user"
+    )
+
+    assert tweaked.get_vertex(prompt_id).params["template"] == "tweaked {memory}"
+    assert untweaked.get_vertex(prompt_id).params["template"] != "tweaked {memory}"
+
+
 # TODO: Update basic graph data
 # async def test_load_langchain_object_with_no_cached_session(client, basic_graph_data):
 #     # Provide a non-existent session_id
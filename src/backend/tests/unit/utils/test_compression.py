@@ -0,0 +1,114 @@
+import gzip
+
+import orjson
+import pytest
+from langflow.utils.compression import (
+    COMPRESSION_MIN_SIZE,
+    STREAM_BATCH_SIZE,
+    compress_response,
+    encode_payload,
+    encoded_payload_response,
+)
+from starlette.requests import Request
+
+DATA = {"inputs": {"ChatInput": {"display_name": "Chat Input"}}}
+
+
+def _request(**headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/v1/all",
+            "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+        }
+    )
+
+
+def test_encode_payload_etag_follows_content():
+    payload = encode_payload(DATA)
+
+    assert orjson.loads(payload.content) == DATA
+    assert gzip.decompress(payload.gzip) == payload.content
+    assert encode_payload(DATA).etag == payload.etag
+    assert encode_payload({"inputs": {}}).etag != payload.etag
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip, deflate", "gzip"),
+        ("gzip;q=0, deflate", None),
+        ("", None),
+    ],
+)
+def test_encoded_payload_response_picks_accepted_encoding(accept_encoding, expected):
+    payload = encode_payload(DATA)._replace(brotli=None)
+
+    response = encoded_payload_response(payload, _request(accept_encoding=accept_encoding))
+
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == expected
+    assert response.headers["etag"] == (payload.etag if expected is None else f'{payload.etag[:-1]}-gzip"')
+    assert response.body == (payload.gzip if expected == "gzip" else payload.content)
+
+
+def test_encoded_payload_response_prefers_brotli():
+    payload = encode_payload(DATA)._replace(brotli=b"brotli")
+
+    response = encoded_payload_response(payload, _request(accept_encoding="gzip, br"))
+
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["etag"] == f'{payload.etag[:-1]}-br"'
+    assert response.body == b"brotli"
+
+
+def test_encoded_payload_response_etag_depends_on_encoding():
+    payload = encode_payload(DATA)._replace(brotli=b"brotli")
+    gzip_etag = encoded_payload_response(payload, _request(accept_encoding="gzip")).headers["etag"]
+
+    brotli_response = encoded_payload_response(payload, _request(accept_encoding="br", if_none_match=gzip_etag))
+    gzip_response = encoded_payload_response(payload, _request(accept_encoding="gzip", if_none_match=gzip_etag))
+
+    assert brotli_response.status_code == 200
+    assert brotli_response.body == b"brotli"
+    assert gzip_response.status_code == 304
+
+
+@pytest.mark.parametrize("if_none_match", ["{etag}", "W/{etag}", '"other", {etag}', "*"])
+def test_encoded_payload_response_not_modified(if_none_match):
+    payload = encode_payload(DATA)
+
+    response = encoded_payload_response(payload, _request(if_none_match=if_none_match.format(etag=payload.etag)))
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == payload.etag
+
+
+async def test_compress_response_skips_small_payloads():
+    response = await compress_response(DATA)
+
+    assert "content-encoding" not in response.headers
+    assert orjson.loads(response.body) == DATA
+
+
+async def test_compress_response_compresses_large_payloads():
+    data = {"description": "x" * COMPRESSION_MIN_SIZE}
+
+    response = await compress_response(data)
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-length"] == str(len(response.body))
+    assert orjson.loads(gzip.decompress(response.body)) == data
+
+
+@pytest.mark.parametrize("size", [STREAM_BATCH_SIZE + 1, STREAM_BATCH_SIZE * 3])
+async def test_compress_response_streams_long_lists(size):
+    data = [{"id": index, "name": f"Flow {index}"} for index in range(size)]
+
+    response = await compress_response(data)
+    body = b"".join([chunk async for chunk in response.body_iterator])
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert orjson.loads(gzip.decompress(body)) == data